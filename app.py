@@ -18,6 +18,15 @@ from flask_wtf import FlaskForm
 from wtforms import StringField, PasswordField, SelectField, TextAreaField, DateField
 from wtforms.validators import DataRequired, Email, Length
 from dotenv import load_dotenv
+from sqlalchemy import select
+
+from pagination import DEFAULT_PAGE_SIZE, clamp_page_size, decode_cursor, encode_cursor, keyset_before, requested_page_size
+from search import SEARCH_PAGE_SIZE, apply_search, install_search_index
+from dashboard_stats import StatusCounts, status_count_query
+from rooms import LOBBY_ROOM, project_room, subscription_rooms
+from change_feed import change_log_table, changed_since, record_change
+from serialization import dumps, project_columns, project_dicts
+from principal_cache import PRINCIPAL_CACHE_SIZE, PRINCIPAL_TTL, TOKEN_CACHE_SIZE, Principal, TTLCache, watch_user_changes
 
 # Load environment variables
 load_dotenv()
@@ -35,6 +44,9 @@ socketio = SocketIO(app, cors_allowed_origins="*")
 # JWT Secret
 JWT_SECRET = os.getenv('JWT_SECRET', 'jwt-secret-key')
 
+# Dashboard status counts, kept current by the project write handlers
+status_counts = StatusCounts()
+
 # Models
 class User(db.Model):
     __tablename__ = 'users'
@@ -63,6 +75,10 @@ class User(db.Model):
 
 class Project(db.Model):
     __tablename__ = 'projects'
+    __table_args__ = (
+        db.Index('ix_projects_updated_at_id', 'updated_at', 'id'),
+        db.Index('ix_projects_status_updated_at', 'status', 'updated_at'),
+    )
     
     id = db.Column(db.Integer, primary_key=True)
     name = db.Column(db.String(255), nullable=False)
@@ -76,6 +92,17 @@ class Project(db.Model):
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
     updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
+# Every project write appends here; /api/projects/changes reads it
+change_log = change_log_table(db.metadata)
+
+# Authenticated user caches: token -> user id until expiry, user id -> principal
+token_cache = TTLCache(TOKEN_CACHE_SIZE)
+principal_cache = TTLCache(PRINCIPAL_CACHE_SIZE, ttl=PRINCIPAL_TTL)
+watch_user_changes(User, principal_cache)
+
+# Socket.IO connections authenticate once at connect; handlers read the principal by sid
+socket_principals: Dict[str, Principal] = {}
+
 # Forms
 class LoginForm(FlaskForm):
     username = StringField('Username', validators=[DataRequired()])
@@ -109,25 +136,41 @@ class ProjectForm(FlaskForm):
     start_date = DateField('Start Date')
     end_date = DateField('End Date')
 
+def authenticate_token(token: Optional[str]) -> Optional[Principal]:
+    """Principal for a session or bearer JWT, or None if it is missing or invalid"""
+    if not token:
+        return None
+    
+    user_id = token_cache.get(token)
+    if user_id is None:
+        try:
+            payload = jwt.decode(token, JWT_SECRET, algorithms=['HS256'])
+        except jwt.InvalidTokenError:
+            return None
+        user_id = payload['user_id']
+        token_cache.set(token, user_id, expires_at=payload.get('exp'))
+    
+    current_user = principal_cache.get(user_id)
+    if current_user is None:
+        user = User.query.get(user_id)
+        if not user:
+            return None
+        current_user = Principal.from_user(user)
+        principal_cache.set(user_id, current_user)
+    return current_user
+
 # Authentication decorator
 def login_required(f):
     @wraps(f)
     def decorated_function(*args, **kwargs):
         token = session.get('token') or request.headers.get('Authorization', '').replace('Bearer ', '')
-        if not token:
+        current_user = authenticate_token(token)
+        if current_user is None:
             return redirect(url_for('login'))
         
-        try:
-            payload = jwt.decode(token, JWT_SECRET, algorithms=['HS256'])
-            current_user = User.query.get(payload['user_id'])
-            if not current_user:
-                return redirect(url_for('login'))
-            
-            # Store user in request context
-            request.current_user = current_user
-            return f(*args, **kwargs)
-        except jwt.InvalidTokenError:
-            return redirect(url_for('login'))
+        # Store user in request context
+        request.current_user = current_user
+        return f(*args, **kwargs)
     
     return decorated_function
 
@@ -215,12 +258,9 @@ def dashboard():
     projects = Project.query.order_by(Project.updated_at.desc()).limit(10).all()
     
     # Get project statistics
-    stats = {
-        'total_projects': Project.query.count(),
-        'active_projects': Project.query.filter(Project.status.in_(['in progress', 'scheduled'])).count(),
-        'completed_projects': Project.query.filter_by(status='complete').count(),
-        'new_leads': Project.query.filter_by(status='new lead').count()
-    }
+    if status_counts.is_stale():
+        status_counts.load(db.session.execute(status_count_query(Project)).all())
+    stats = status_counts.stats()
     
     return render_template('dashboard/index.html', 
                          user=user, 
@@ -233,26 +273,26 @@ def projects():
     user = request.current_user
     search = request.args.get('search', '')
     status_filter = request.args.get('status', '')
+    page = max(request.args.get('page', 1, type=int), 1)
     
     query = Project.query
     
     if search:
-        query = query.filter(
-            Project.name.contains(search) | 
-            Project.description.contains(search) | 
-            Project.project_address.contains(search)
-        )
+        query = apply_search(query, Project, db.engine.dialect.name, search)
     
     if status_filter:
-        query = query.filter_by(status=status_filter)
+        query = query.filter(Project.status == status_filter)
     
-    projects_list = query.order_by(Project.updated_at.desc()).all()
+    query = query.order_by(Project.updated_at.desc())
+    projects_list = query.offset((page - 1) * SEARCH_PAGE_SIZE).limit(SEARCH_PAGE_SIZE + 1).all()
     
     return render_template('projects/index.html', 
                          user=user, 
-                         projects=projects_list,
+                         projects=projects_list[:SEARCH_PAGE_SIZE],
                          search=search,
-                         status_filter=status_filter)
+                         status_filter=status_filter,
+                         page=page,
+                         has_next=len(projects_list) > SEARCH_PAGE_SIZE)
 
 @app.route('/projects/new', methods=['GET', 'POST'])
 @login_required
@@ -273,7 +313,10 @@ def new_project():
         )
         
         db.session.add(project)
+        db.session.flush()
+        record_change(db.session, change_log, 'project', [project.id])
         db.session.commit()
+        status_counts.adjust(None, project.status)
         
         flash('Project created successfully!', 'success')
         return redirect(url_for('projects'))
@@ -287,10 +330,13 @@ def edit_project(project_id):
     form = ProjectForm(obj=project)
     
     if form.validate_on_submit():
+        old_status = project.status
         form.populate_obj(project)
         project.updated_at = datetime.utcnow()
+        record_change(db.session, change_log, 'project', [project.id])
         
         db.session.commit()
+        status_counts.adjust(old_status, project.status)
         
         # Emit real-time update
         socketio.emit('project_updated', {
@@ -302,7 +348,7 @@ def edit_project(project_id):
                 'assigned_to': project.assigned_to,
                 'updated_at': project.updated_at.isoformat()
             }
-        }, room='projects')
+        }, room=project_room(project.id))
         
         flash('Project updated successfully!', 'success')
         return redirect(url_for('projects'))
@@ -324,13 +370,16 @@ def api_update_project(project_id):
     
     # Update allowed fields
     allowed_fields = ['name', 'status', 'assigned_to', 'project_address', 'client_phone']
+    old_status = project.status
     
     for field in allowed_fields:
         if field in data:
             setattr(project, field, data[field])
     
     project.updated_at = datetime.utcnow()
+    record_change(db.session, change_log, 'project', [project.id])
     db.session.commit()
+    status_counts.adjust(old_status, project.status)
     
     # Emit real-time update
     socketio.emit('cell_updated', {
@@ -338,7 +387,7 @@ def api_update_project(project_id):
         'field': list(data.keys())[0] if data else None,
         'value': list(data.values())[0] if data else None,
         'updated_by': request.current_user.username
-    }, room='projects')
+    }, room=project_room(project.id))
     
     return jsonify({'success': True, 'project': {
         'id': project.id,
@@ -353,96 +402,124 @@ def api_update_project(project_id):
 @app.route('/api/projects')
 @login_required
 def api_projects():
-    projects_list = Project.query.order_by(Project.updated_at.desc()).all()
-    
-    return jsonify([{
-        'id': p.id,
-        'name': p.name,
-        'status': p.status,
-        'assigned_to': p.assigned_to,
-        'project_address': p.project_address,
-        'client_phone': p.client_phone,
-        'start_date': p.start_date.isoformat() if p.start_date else None,
-        'end_date': p.end_date.isoformat() if p.end_date else None,
-        'updated_at': p.updated_at.isoformat()
-    } for p in projects_list])
+    # Plain column tuples: no ORM objects are built for a listing
+    query = select(*project_columns(Project)).order_by(Project.updated_at.desc(), Project.id.desc())
+    
+    cursor = request.args.get('cursor')
+    if cursor:
+        try:
+            query = query.where(keyset_before(Project.updated_at, Project.id, decode_cursor(cursor)))
+        except ValueError:
+            return jsonify({'error': 'Invalid cursor'}), 400
+    
+    # Without limit or cursor the whole list is returned, as before pagination
+    page_size = requested_page_size(request.args.get('limit', type=int), cursor)
+    if page_size is not None:
+        query = query.limit(page_size + 1)
+    rows = db.session.execute(query).all()
+    
+    # One extra row tells us whether another page exists
+    next_cursor = None
+    if page_size is not None and len(rows) > page_size:
+        rows = rows[:page_size]
+        last = rows[-1]
+        next_cursor = encode_cursor(last.updated_at, last.id)
+    
+    response = app.response_class(dumps(project_dicts(rows)), mimetype='application/json')
+    
+    if next_cursor:
+        response.headers['X-Next-Cursor'] = next_cursor
+    return response
+
+@app.route('/api/projects/changes')
+@login_required
+def api_project_changes():
+    """Projects changed after sequence number ``since``, oldest change first"""
+    since = request.args.get('since', 0, type=int)
+    page_size = clamp_page_size(request.args.get('limit', DEFAULT_PAGE_SIZE, type=int))
+    rows = db.session.execute(changed_since(change_log, 'project', since, page_size + 1)).all()
+    has_more = len(rows) > page_size
+    rows = rows[:page_size]
+    seqs = {entity_id: seq for entity_id, seq in rows}
+    
+    projects_list = []
+    if seqs:
+        result = db.session.execute(select(*project_columns(Project)).where(Project.id.in_(list(seqs))))
+        projects_list = sorted(project_dicts(result), key=lambda p: seqs[p['id']])
+    found = {p['id'] for p in projects_list}
+    
+    return app.response_class(dumps({
+        'changes': projects_list,
+        'deleted': [project_id for project_id in seqs if project_id not in found],
+        'next_since': rows[-1].last_seq if rows else since,
+        'has_more': has_more
+    }), mimetype='application/json')
 
 # WebSocket Events for Real-time Collaboration
 @socketio.on('connect')
 def on_connect():
-    token = session.get('token')
-    if not token:
+    user = authenticate_token(session.get('token'))
+    if user is None:
         return False
     
-    try:
-        payload = jwt.decode(token, JWT_SECRET, algorithms=['HS256'])
-        user = User.query.get(payload['user_id'])
-        if user:
-            join_room('projects')
-            emit('user_connected', {
-                'user_id': user.id,
-                'username': user.username,
-                'message': f'{user.username} joined the collaboration'
-            }, room='projects')
-            return True
-    except jwt.InvalidTokenError:
-        return False
+    socket_principals[request.sid] = user
+    join_room(LOBBY_ROOM)
+    emit('user_connected', {
+        'user_id': user.id,
+        'username': user.username,
+        'message': f'{user.username} joined the collaboration'
+    }, room=LOBBY_ROOM)
+    return True
 
 @socketio.on('disconnect')
 def on_disconnect():
-    token = session.get('token')
-    if token:
-        try:
-            payload = jwt.decode(token, JWT_SECRET, algorithms=['HS256'])
-            user = User.query.get(payload['user_id'])
-            if user:
-                leave_room('projects')
-                emit('user_disconnected', {
-                    'user_id': user.id,
-                    'username': user.username,
-                    'message': f'{user.username} left the collaboration'
-                }, room='projects')
-        except jwt.InvalidTokenError:
-            pass
+    user = socket_principals.pop(request.sid, None)
+    if user:
+        leave_room(LOBBY_ROOM)
+        emit('user_disconnected', {
+            'user_id': user.id,
+            'username': user.username,
+            'message': f'{user.username} left the collaboration'
+        }, room=LOBBY_ROOM)
+
+@socketio.on('subscribe')
+def on_subscribe(data):
+    for room in subscription_rooms(data):
+        join_room(room)
+
+@socketio.on('unsubscribe')
+def on_unsubscribe(data):
+    for room in subscription_rooms(data):
+        leave_room(room)
 
 @socketio.on('start_editing')
 def on_start_editing(data):
-    token = session.get('token')
-    if token:
-        try:
-            payload = jwt.decode(token, JWT_SECRET, algorithms=['HS256'])
-            user = User.query.get(payload['user_id'])
-            if user:
-                emit('cell_editing_started', {
-                    'project_id': data['project_id'],
-                    'field': data['field'],
-                    'user_id': user.id,
-                    'username': user.username
-                }, room='projects', include_self=False)
-        except jwt.InvalidTokenError:
-            pass
+    user = socket_principals.get(request.sid)
+    if user:
+        emit('cell_editing_started', {
+            'project_id': data['project_id'],
+            'field': data['field'],
+            'user_id': user.id,
+            'username': user.username
+        }, room=project_room(data['project_id']), include_self=False)
 
 @socketio.on('stop_editing')
 def on_stop_editing(data):
-    token = session.get('token')
-    if token:
-        try:
-            payload = jwt.decode(token, JWT_SECRET, algorithms=['HS256'])
-            user = User.query.get(payload['user_id'])
-            if user:
-                emit('cell_editing_stopped', {
-                    'project_id': data['project_id'],
-                    'field': data['field'],
-                    'user_id': user.id,
-                    'username': user.username
-                }, room='projects', include_self=False)
-        except jwt.InvalidTokenError:
-            pass
+    user = socket_principals.get(request.sid)
+    if user:
+        emit('cell_editing_stopped', {
+            'project_id': data['project_id'],
+            'field': data['field'],
+            'user_id': user.id,
+            'username': user.username
+        }, room=project_room(data['project_id']), include_self=False)
 
 # Initialize database
 @app.before_first_request
 def create_tables():
     db.create_all()
+    with db.engine.begin() as conn:
+        install_search_index(conn)
     
     # Create admin user if it doesn't exist
     admin = User.query.filter_by(username='ADMIN').first()
@@ -0,0 +1,56 @@
+"""
+Bounded worker pool for password hashing
+Keeps bcrypt off the event loop and sheds load when too many calls queue up
+"""
+
+import asyncio
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional
+
+class AuthPoolBusy(Exception):
+    """Raised when the hashing queue is full"""
+
+class AuthExecutor:
+    """Runs blocking auth work in a thread pool with a cap on pending calls.
+
+    bcrypt releases the GIL while hashing, so threads give real parallelism
+    here. Once ``max_pending`` calls are queued or running, new calls fail
+    fast with AuthPoolBusy instead of growing the queue without bound.
+    """
+
+    def __init__(self, max_workers: Optional[int] = None, max_pending: Optional[int] = None):
+        self.max_workers = max_workers or int(os.getenv('AUTH_POOL_WORKERS', min(4, os.cpu_count() or 1)))
+        self.max_pending = max_pending or int(os.getenv('AUTH_POOL_MAX_PENDING', 64))
+        self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix='auth')
+        self._pending = 0
+        self.rejected = 0
+
+    async def run(self, fn: Callable[..., Any], *args) -> Any:
+        if self._pending >= self.max_pending:
+            self.rejected += 1
+            raise AuthPoolBusy()
+
+        self._pending += 1
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._executor, fn, *args)
+        finally:
+            self._pending -= 1
+
+    @property
+    def queue_depth(self) -> int:
+        """Calls waiting for a free worker"""
+        return max(0, self._pending - self.max_workers)
+
+    def metrics(self) -> Dict[str, int]:
+        return {
+            'queue_depth': self.queue_depth,
+            'in_flight': min(self._pending, self.max_workers),
+            'max_workers': self.max_workers,
+            'max_pending': self.max_pending,
+            'rejected': self.rejected
+        }
+
+    def shutdown(self):
+        self._executor.shutdown(wait=False, cancel_futures=True)
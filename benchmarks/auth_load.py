@@ -0,0 +1,72 @@
+"""
+Login burst load test
+Measures p99 latency of /api/projects while 50 logins are in flight,
+with bcrypt run inline on the event loop versus on the auth executor
+
+Run from the repository root: python benchmarks/auth_load.py
+"""
+
+import asyncio
+import os
+import sys
+import tempfile
+import time
+
+DB_PATH = os.path.join(tempfile.mkdtemp(), 'auth_load.db')
+os.environ['DATABASE_URL'] = f'sqlite+aiosqlite:///{DB_PATH}'
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import httpx
+
+import main
+
+CONCURRENT_LOGINS = 50
+
+async def run_inline(fn, *args):
+    return fn(*args)
+
+def percentile(samples, pct):
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct / 100))]
+
+async def burst(client, token):
+    logins_done = asyncio.Event()
+    latencies = []
+
+    async def login():
+        await client.post('/login', data={'username': 'ADMIN', 'password': 'TEST'})
+
+    async def poll():
+        while not logins_done.is_set():
+            start = time.perf_counter()
+            await client.get('/api/projects', cookies={'access_token': token})
+            latencies.append(time.perf_counter() - start)
+            await asyncio.sleep(0.01)
+
+    poller = asyncio.create_task(poll())
+    start = time.perf_counter()
+    await asyncio.gather(*(login() for _ in range(CONCURRENT_LOGINS)))
+    elapsed = time.perf_counter() - start
+    logins_done.set()
+    await poller
+    return elapsed, latencies
+
+async def main_async():
+    main.engine.echo = False
+    token = main.create_access_token({'sub': '1'})
+    transport = httpx.ASGITransport(app=main.app)
+
+    async with main.lifespan(main.app):
+        async with httpx.AsyncClient(transport=transport, base_url='http://bench') as client:
+            pooled_run = main.auth_executor.run
+            print(f"{'mode':>8} {'logins s':>9} {'polls':>6} {'p50 ms':>8} {'p99 ms':>8}")
+            for mode, runner in (('inline', run_inline), ('pool', pooled_run)):
+                main.auth_executor.run = runner
+                elapsed, latencies = await burst(client, token)
+                print(f"{mode:>8} {elapsed:>9.2f} {len(latencies):>6} "
+                      f"{percentile(latencies, 50) * 1000:>8.1f} {percentile(latencies, 99) * 1000:>8.1f}")
+
+    await main.engine.dispose()
+
+if __name__ == '__main__':
+    asyncio.run(main_async())
@@ -0,0 +1,113 @@
+"""
+Batch quoting benchmark
+Prices a 60-opening house and a 5,000-opening commercial bid against the
+full-size synthetic V300 catalog: in process, line by line versus
+PriceCatalog.quote_batch, and over HTTP as one /api/quotes request per
+opening versus a single /api/quotes/batch call
+
+Run from the repository root: python benchmarks/batch_quotes.py
+"""
+
+import asyncio
+import os
+import random
+import sys
+import tempfile
+import time
+
+DB_PATH = os.path.join(tempfile.mkdtemp(), 'batch_quotes.db')
+os.environ['DATABASE_URL'] = f'sqlite+aiosqlite:///{DB_PATH}'
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import httpx
+
+import main
+import pricing
+from pricing import PriceCatalog
+from pricing_lookup import full_size_catalog
+
+ORDERS = (('house', 60), ('commercial bid', 5_000))
+REPEATS = 5
+
+def make_order(catalog: PriceCatalog, lines: int, rng: random.Random):
+    """Openings drawn from a few dozen distinct sizes, like a real takeoff"""
+    grids = list(catalog.grids.values())
+    openings = []
+    for _ in range(40):
+        grid = rng.choice(grids)
+        index = rng.randrange(len(grid))
+        openings.append((grid.window_type, grid.width_at(index) - 1, grid.heights[index] - 1,
+                         rng.randrange(grid.tiers)))
+    picked = [rng.choice(openings) for _ in range(lines)]
+    return {
+        'window_types': [line[0] for line in picked],
+        'widths': [line[1] for line in picked],
+        'heights': [line[2] for line in picked],
+        'configurations': [line[3] for line in picked],
+        'quantities': [rng.randint(1, 3) for _ in picked]
+    }
+
+def best_of(fn):
+    best = float('inf')
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+def in_process(catalog: PriceCatalog, order):
+    columns = (order['window_types'], order['widths'], order['heights'],
+               order['configurations'], order['quantities'])
+    per_line = best_of(lambda: catalog.quote_lines(zip(*columns)))
+    batch = best_of(lambda: catalog.quote_batch(*columns))
+    return per_line, batch
+
+async def over_http(client, order):
+    async def per_line():
+        for window_type, width, height, configuration, quantity in zip(
+                order['window_types'], order['widths'], order['heights'],
+                order['configurations'], order['quantities']):
+            response = await client.post('/api/quotes', json={'lines': [{
+                'window_type': window_type, 'width': width, 'height': height,
+                'configuration': configuration, 'quantity': quantity
+            }]})
+            response.raise_for_status()
+
+    async def batch():
+        response = await client.post('/api/quotes/batch', json=order)
+        response.raise_for_status()
+
+    async def best_async(fn, repeats):
+        best = float('inf')
+        for _ in range(repeats):
+            start = time.perf_counter()
+            await fn()
+            best = min(best, time.perf_counter() - start)
+        return best * 1000
+
+    lines = len(order['window_types'])
+    return await best_async(per_line, 1 if lines > 100 else REPEATS), await best_async(batch, REPEATS)
+
+async def main_async():
+    with open(pricing.CATALOG_PATH, 'rb') as f:
+        catalog = PriceCatalog.from_json(full_size_catalog(f.read()))
+    rng = random.Random(3)
+    orders = [(label, make_order(catalog, lines, rng)) for label, lines in ORDERS]
+
+    print(f"best of {REPEATS}, ms")
+    print(f"{'order':>16} {'lines':>6} {'quote loop':>11} {'quote_batch':>12} {'HTTP per line':>14} {'HTTP batch':>11}")
+    main.engine.echo = False
+    transport = httpx.ASGITransport(app=main.app)
+    async with main.lifespan(main.app):
+        main.catalog_manager.swap(catalog)
+        async with httpx.AsyncClient(transport=transport, base_url='http://bench',
+                                     cookies={'access_token': main.create_access_token({'sub': '1'})}) as client:
+            for label, order in orders:
+                loop, batch = in_process(catalog, order)
+                http_loop, http_batch = await over_http(client, order)
+                print(f"{label:>16} {len(order['window_types']):>6} {loop:>11.2f} {batch:>12.2f} "
+                      f"{http_loop:>14.1f} {http_batch:>11.1f}")
+    await main.engine.dispose()
+
+if __name__ == '__main__':
+    asyncio.run(main_async())
@@ -0,0 +1,137 @@
+"""
+Board API concurrency benchmark
+Requests/second for GET /api/boards/{id} at increasing client counts
+
+Uses a temporary SQLite file unless DATABASE_URL is set. With a PostgreSQL
+DATABASE_URL, ``--latency MS`` routes the connections through a local proxy
+process that holds every packet for MS milliseconds each way, the round trip
+of a database on another host. Concurrency only pays while requests wait on
+the database: against a local database a request is ~10 ms of CPU in the one
+event loop and the rate stays flat at every client count; behind the proxy
+the waits overlap and the rate climbs until that CPU is used up again.
+
+Run from the repository root: python benchmarks/board_concurrency.py
+                              DATABASE_URL=postgresql://... python benchmarks/board_concurrency.py --latency 2
+"""
+
+import asyncio
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from urllib.parse import urlsplit, urlunsplit
+
+ITEMS = 200
+CLIENTS = [1, 4, 16, 64]
+DURATION = 3.0  # seconds per level
+
+async def delayed_proxy(listen_port, target_host, target_port, delay):
+    """Forward TCP connections to the target, delaying every chunk by ``delay`` seconds each way"""
+    loop = asyncio.get_running_loop()
+
+    async def pipe(reader, writer):
+        try:
+            while data := await reader.read(65536):
+                # A fixed delay keeps chunks in order
+                loop.call_later(delay, writer.write, data)
+        finally:
+            loop.call_later(delay, writer.close)
+
+    async def handle(client_reader, client_writer):
+        server_reader, server_writer = await asyncio.open_connection(target_host, target_port)
+        await asyncio.gather(pipe(client_reader, server_writer), pipe(server_reader, client_writer),
+                             return_exceptions=True)
+
+    server = await asyncio.start_server(handle, '127.0.0.1', listen_port)
+    print('ready', flush=True)
+    await server.serve_forever()
+
+def start_proxy(latency_ms):
+    """Point DATABASE_URL at a delaying proxy process; returns the process"""
+    url = urlsplit(os.environ.get('DATABASE_URL', ''))
+    if not url.scheme.startswith('postgres'):
+        sys.exit('--latency needs a PostgreSQL DATABASE_URL')
+    import socket
+    with socket.socket() as s:
+        s.bind(('127.0.0.1', 0))
+        port = s.getsockname()[1]
+    proxy = subprocess.Popen([sys.executable, os.path.abspath(__file__), 'proxy', str(port),
+                              url.hostname, str(url.port or 5432), str(latency_ms / 1000)],
+                             stdout=subprocess.PIPE, text=True)
+    if proxy.stdout.readline().strip() != 'ready':
+        sys.exit('latency proxy did not start')
+    credentials = url.netloc.rpartition('@')[0]
+    netloc = f"{credentials}@127.0.0.1:{port}" if credentials else f"127.0.0.1:{port}"
+    os.environ['DATABASE_URL'] = urlunsplit(url._replace(netloc=netloc))
+    return proxy
+
+async def seed():
+    import board_app
+    from sqlalchemy import insert, select
+    from board_app import Board, BoardColumn, BoardItem, ItemValue, ColumnType
+
+    async with board_app.SessionLocal() as db:
+        board = Board(name="Concurrency bench")
+        db.add(board)
+        await db.flush()
+        columns = [BoardColumn(board_id=board.id, name=f"Col {i}", type=ColumnType.TEXT, order=i)
+                   for i in range(6)]
+        db.add_all(columns)
+        await db.flush()
+        await db.execute(insert(BoardItem), [
+            {"board_id": board.id, "group_name": "Main Group", "order": i} for i in range(ITEMS)
+        ])
+        item_ids = (await db.scalars(select(BoardItem.id).where(BoardItem.board_id == board.id))).all()
+        await db.execute(insert(ItemValue), [
+            {"item_id": item_id, "column_id": column.id, "value": "x"}
+            for item_id in item_ids for column in columns
+        ])
+        await db.commit()
+        return board.id
+
+async def run_level(client, board_id, clients):
+    deadline = time.perf_counter() + DURATION
+    completed = 0
+
+    async def worker():
+        nonlocal completed
+        while time.perf_counter() < deadline:
+            response = await client.get(f'/api/boards/{board_id}')
+            response.raise_for_status()
+            completed += 1
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(clients)))
+    return completed / (time.perf_counter() - start)
+
+async def main():
+    import httpx
+    import board_app
+
+    transport = httpx.ASGITransport(app=board_app.app)
+    async with board_app.lifespan(board_app.app):
+        board_id = await seed()
+        async with httpx.AsyncClient(transport=transport, base_url='http://bench') as client:
+            print(f"{'clients':>8} {'req/s':>10}")
+            for clients in CLIENTS:
+                print(f"{clients:>8} {await run_level(client, board_id, clients):>10.1f}")
+
+if __name__ == '__main__':
+    if sys.argv[1:2] == ['proxy']:
+        port, host, target_port, delay = sys.argv[2:6]
+        asyncio.run(delayed_proxy(int(port), host, int(target_port), float(delay)))
+        sys.exit()
+
+    proxy = None
+    if sys.argv[1:2] == ['--latency']:
+        proxy = start_proxy(float(sys.argv[2]))
+        print(f"database round trip +{2 * float(sys.argv[2]):g} ms")
+    elif 'DATABASE_URL' not in os.environ:
+        os.environ['DATABASE_URL'] = f"sqlite:///{os.path.join(tempfile.mkdtemp(), 'boards.db')}"
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    try:
+        asyncio.run(main())
+    finally:
+        if proxy:
+            proxy.terminate()
@@ -0,0 +1,99 @@
+"""
+Board loader benchmark
+Compares the per-item value lookup with load_board_grid at 100, 1k and 10k items
+
+Run from the repository root: python benchmarks/board_loader.py
+"""
+
+import os
+import sys
+import time
+
+os.environ.setdefault('DATABASE_URL', 'sqlite://')
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import create_engine, event, insert
+from sqlalchemy.orm import sessionmaker
+
+from board_app import Base, Board, BoardColumn, BoardItem, ItemValue, ColumnType, load_board_grid
+
+SIZES = [100, 1_000, 10_000]
+COLUMN_TYPES = [ColumnType.TEXT, ColumnType.STATUS, ColumnType.PEOPLE,
+                ColumnType.DATE, ColumnType.NUMBER, ColumnType.TAGS]
+
+def seed(db, item_count):
+    board = Board(name=f"Bench {item_count}")
+    db.add(board)
+    db.flush()
+
+    columns = [BoardColumn(board_id=board.id, name=f"Col {i}", type=t, order=i)
+               for i, t in enumerate(COLUMN_TYPES)]
+    db.add_all(columns)
+    db.flush()
+
+    db.execute(insert(BoardItem), [
+        {"board_id": board.id, "group_name": f"Group {i % 5}", "order": i}
+        for i in range(item_count)
+    ])
+    item_ids = [row.id for row in db.query(BoardItem.id).filter(BoardItem.board_id == board.id)]
+    db.execute(insert(ItemValue), [
+        {"item_id": item_id, "column_id": column.id, "value": f"{item_id}-{column.id}"}
+        for item_id in item_ids for column in columns
+    ])
+    db.commit()
+    return board.id
+
+def legacy_load(db, board_id):
+    """The original dashboard loop: one value query per item"""
+    columns = db.query(BoardColumn).filter(
+        BoardColumn.board_id == board_id
+    ).order_by(BoardColumn.order).all()
+    items = db.query(BoardItem).filter(
+        BoardItem.board_id == board_id
+    ).order_by(BoardItem.group_name, BoardItem.order).all()
+
+    items_data = []
+    for item in items:
+        item_dict = {"id": item.id, "group_name": item.group_name,
+                     "created_on": item.created_on, "values": {}}
+        for value in db.query(ItemValue).filter(ItemValue.item_id == item.id).all():
+            item_dict["values"][value.column_id] = value.value
+        items_data.append(item_dict)
+    return {"columns": columns, "items": items_data}
+
+def measure(engine, session_factory, loader, board_id):
+    queries = 0
+
+    def count(*args):
+        nonlocal queries
+        queries += 1
+
+    event.listen(engine, "before_cursor_execute", count)
+    db = session_factory()
+    try:
+        start = time.perf_counter()
+        grid = loader(db, board_id)
+        elapsed = time.perf_counter() - start
+    finally:
+        db.close()
+        event.remove(engine, "before_cursor_execute", count)
+    return queries, elapsed, len(grid["items"])
+
+def main():
+    engine = create_engine('sqlite://')
+    Base.metadata.create_all(bind=engine)
+    session_factory = sessionmaker(bind=engine)
+
+    print(f"{'items':>8} {'loader':>10} {'queries':>8} {'ms':>10}")
+    for size in SIZES:
+        db = session_factory()
+        board_id = seed(db, size)
+        db.close()
+
+        for name, loader in (("legacy", legacy_load), ("grid", load_board_grid)):
+            queries, elapsed, rows = measure(engine, session_factory, loader, board_id)
+            assert rows == size
+            print(f"{size:>8} {name:>10} {queries:>8} {elapsed * 1000:>10.1f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""
+Board page render benchmark
+Response time and page size for GET /board/{id} with windowed rendering
+versus the full single-pass render, at 1k, 10k and 50k items
+
+Run from the repository root: python benchmarks/board_render.py
+"""
+
+import asyncio
+import os
+import sys
+import tempfile
+import time
+
+if 'DATABASE_URL' not in os.environ:
+    os.environ['DATABASE_URL'] = f"sqlite:///{os.path.join(tempfile.mkdtemp(), 'boards.db')}"
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import httpx
+from sqlalchemy import insert, select
+
+import board_app
+from board_app import Board, BoardColumn, BoardItem, ItemValue, ColumnType
+
+SIZES = [1_000, 10_000, 50_000]
+GROUPS = 8
+REPEATS = 3
+COLUMN_TYPES = [ColumnType.TEXT, ColumnType.STATUS, ColumnType.PEOPLE,
+                ColumnType.DATE, ColumnType.NUMBER, ColumnType.TAGS]
+
+async def seed(item_count):
+    async with board_app.SessionLocal() as db:
+        board = Board(name=f"Render bench {item_count}")
+        db.add(board)
+        await db.flush()
+        columns = [BoardColumn(board_id=board.id, name=f"Col {i}", type=t, order=i)
+                   for i, t in enumerate(COLUMN_TYPES)]
+        db.add_all(columns)
+        await db.flush()
+        await db.execute(insert(BoardItem), [
+            {"board_id": board.id, "group_name": f"Group {i % GROUPS}", "order": i}
+            for i in range(item_count)
+        ])
+        item_ids = (await db.scalars(select(BoardItem.id).where(BoardItem.board_id == board.id))).all()
+        await db.execute(insert(ItemValue), [
+            {"item_id": item_id, "column_id": column.id, "value": "Done" if column.type == ColumnType.STATUS else "x"}
+            for item_id in item_ids for column in columns
+        ])
+        await db.commit()
+        return board.id
+
+async def timed_get(client, url):
+    best, size = None, 0
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        response = await client.get(url)
+        elapsed = time.perf_counter() - start
+        response.raise_for_status()
+        size = len(response.content)
+        best = elapsed if best is None else min(best, elapsed)
+    return best, size
+
+async def main():
+    async with board_app.engine.begin() as conn:
+        await conn.run_sync(board_app.Base.metadata.create_all)
+
+    transport = httpx.ASGITransport(app=board_app.app)
+    window_rows = board_app.BOARD_WINDOW_ROWS or 50
+    async with httpx.AsyncClient(transport=transport, base_url='http://bench') as client:
+        print(f"{'items':>8} {'mode':>9} {'ms':>9} {'KiB':>9}")
+        for size in SIZES:
+            board_id = await seed(size)
+            for mode, rows in (('windowed', window_rows), ('full', 0)):
+                board_app.BOARD_WINDOW_ROWS = rows
+                elapsed, page = await timed_get(client, f'/board/{board_id}')
+                print(f"{size:>8} {mode:>9} {elapsed * 1000:>9.1f} {page / 1024:>9.1f}")
+
+            elapsed, page = await timed_get(
+                client, f'/board/{board_id}/rows?group=Group%201&offset={size // GROUPS // 2}')
+            print(f"{size:>8} {'fragment':>9} {elapsed * 1000:>9.1f} {page / 1024:>9.1f}")
+
+    board_app.BOARD_WINDOW_ROWS = window_rows
+    await board_app.engine.dispose()
+
+if __name__ == '__main__':
+    asyncio.run(main())
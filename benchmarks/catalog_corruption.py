@@ -0,0 +1,52 @@
+"""
+Compiled catalog corruption check
+Truncates a compiled full-size V300 catalog at every possible length, as a
+sheet copied into place non-atomically would be mid-copy, and requires
+open_catalog to reject each one with PricingError
+
+Run from the repository root: python benchmarks/catalog_corruption.py
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pricing
+from catalog_file import compile_catalog, open_catalog
+from pricing import PriceCatalog, PricingError
+from pricing_lookup import full_size_catalog
+
+def main():
+    with open(pricing.CATALOG_PATH, 'rb') as f:
+        catalog = PriceCatalog.from_json(full_size_catalog(f.read()))
+    workdir = tempfile.mkdtemp()
+    path = os.path.join(workdir, 'v300.bin')
+    compile_catalog(catalog, path)
+    with open(path, 'rb') as f:
+        good = f.read()
+    corrupt = os.path.join(workdir, 'corrupt.bin')
+
+    start = time.perf_counter()
+    rejected, loaded = 0, []
+    for length in range(len(good)):
+        with open(corrupt, 'wb') as f:
+            f.write(good[:length])
+        try:
+            open_catalog(corrupt)
+        except PricingError:
+            rejected += 1
+        else:
+            loaded.append(length)
+    elapsed = time.perf_counter() - start
+
+    assert open_catalog(path).version == catalog.version
+    print(f"{len(good)} byte catalog, {len(good)} truncations in {elapsed:.1f} s")
+    print(f"  rejected with PricingError  {rejected}")
+    print(f"  loaded                      {len(loaded)}")
+    assert not loaded, f"truncated files loaded at lengths {loaded[:10]}"
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,100 @@
+"""
+Catalog hot-reload check
+Quoting threads price batches through CatalogManager while the catalog file
+is recompiled 200 times underneath them. Every batch must be priced from a
+single snapshot, a swap must take well under a millisecond, and old snapshots and
+their mmaps must be released once no batch holds them
+
+Run from the repository root: python benchmarks/catalog_reload.py
+"""
+
+import gc
+import json
+import os
+import sys
+import tempfile
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pricing
+from catalog_file import compile_catalog
+from catalog_manager import CatalogManager
+from pricing import PriceCatalog
+from pricing_lookup import full_size_catalog
+
+RELOADS = 200
+READERS = 4
+
+def price_sheet(raw: bytes, sheet: int) -> PriceCatalog:
+    """Every configuration of every size costs ``sheet``, so a batch mixing sheets is obvious"""
+    data = json.loads(raw)
+    for window in data['windowTypes'].values():
+        for entry in window['pricing']:
+            entry['configurations'] = [sheet] * len(entry['configurations'])
+    return PriceCatalog.from_json(json.dumps(data).encode())
+
+def mapped_copies(path: str) -> int:
+    """Mappings of the file, including replaced builds still mapped as "(deleted)" (Linux only)"""
+    with open('/proc/self/maps') as f:
+        return sum(1 for line in f if path in line)
+
+def main():
+    workdir = tempfile.mkdtemp()
+    path = os.path.join(workdir, 'v300.bin')
+    with open(pricing.CATALOG_PATH, 'rb') as f:
+        raw = full_size_catalog(f.read())
+    sheets = [price_sheet(raw, sheet) for sheet in range(1, RELOADS + 2)]
+    compile_catalog(sheets[0], path)
+
+    manager = CatalogManager(path)
+    catalog = manager.current()
+    grids = list(catalog.grids.values())
+    order = (
+        [grid.window_type for grid in grids] * 10,
+        [grid.width_at(0) for grid in grids] * 10,
+        [grid.heights[0] for grid in grids] * 10
+    )
+    del catalog, grids
+
+    done = threading.Event()
+    batches = [0] * READERS
+    mixed = []
+
+    def reader(slot):
+        while not done.is_set():
+            priced = manager.current().quote_batch(*order)
+            if len(set(priced.unit_prices)) != 1:
+                mixed.append(priced.catalog_version)
+            batches[slot] += 1
+
+    threads = [threading.Thread(target=reader, args=(slot,)) for slot in range(READERS)]
+    for thread in threads:
+        thread.start()
+
+    swap_times = []
+    for sheet in sheets[1:]:
+        compile_catalog(sheet, path)
+        start = time.perf_counter()
+        manager.reload_if_changed()
+        swap_times.append(time.perf_counter() - start)
+        time.sleep(0.005)
+    done.set()
+    for thread in threads:
+        thread.join()
+    gc.collect()
+
+    print(f"{RELOADS} reloads under {READERS} quoting threads")
+    print(f"  reloads applied       {manager.reloads}")
+    print(f"  batches priced        {sum(batches)}")
+    print(f"  batches mixing sheets {len(mixed)}")
+    print(f"  median reload ms      {sorted(swap_times)[len(swap_times) // 2] * 1000:.2f}")
+    print(f"  live snapshots        {len(manager.snapshots())}")
+    print(f"  mapped copies         {mapped_copies(path)}")
+    assert not mixed, "a batch was priced from two snapshots"
+    assert manager.reloads == RELOADS
+    assert mapped_copies(path) == 1, "a replaced catalog is still mapped"
+
+if __name__ == '__main__':
+    main()
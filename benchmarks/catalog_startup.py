@@ -0,0 +1,84 @@
+"""
+Compiled catalog startup benchmark
+Fresh processes load the full-size synthetic V300 catalog from JSON and from
+the compiled file, reporting time to the first quote, private memory the
+catalog adds to the process, and lookup rate over each representation
+
+Run from the repository root: python benchmarks/catalog_startup.py
+"""
+
+import os
+import random
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+RUNS = 5
+LINES = 100_000
+
+def private_kib() -> int:
+    """Private (unshared) memory of this process, Linux only"""
+    with open('/proc/self/smaps_rollup') as f:
+        return sum(int(line.split()[1]) for line in f if line.startswith(('Private_Clean', 'Private_Dirty')))
+
+def child(source, path):
+    import catalog_file
+    import pricing
+
+    before = private_kib()
+    start = time.perf_counter()
+    catalog = pricing.load_catalog(path) if source == 'json' else catalog_file.open_catalog(path)
+    grid = catalog.grid('Picture Window')
+    catalog.quote('Picture Window', grid.width_at(0), grid.heights[0])
+    first_quote = time.perf_counter() - start
+    grown = private_kib() - before
+
+    rng = random.Random(1)
+    grids = list(catalog.grids.values())
+    lines = []
+    for _ in range(LINES):
+        grid = rng.choice(grids)
+        index = rng.randrange(len(grid))
+        lines.append((grid.window_type, grid.width_at(index) - 0.5, grid.heights[index] - 0.5))
+    start = time.perf_counter()
+    for line in lines:
+        catalog.quote(*line)
+    rate = LINES / (time.perf_counter() - start)
+    print(f"{first_quote * 1000:.2f} {grown} {rate:.0f}")
+
+def run(source, path):
+    output = subprocess.run([sys.executable, os.path.abspath(__file__), 'child', source, path],
+                            cwd=ROOT, capture_output=True, text=True, check=True).stdout
+    return [float(value) for value in output.split()]
+
+def main():
+    import catalog_file
+    import pricing
+    from pricing_lookup import full_size_catalog
+
+    workdir = tempfile.mkdtemp()
+    json_path = os.path.join(workdir, 'v300.json')
+    bin_path = os.path.join(workdir, 'v300.bin')
+    with open(pricing.CATALOG_PATH, 'rb') as f:
+        raw = full_size_catalog(f.read())
+    with open(json_path, 'wb') as f:
+        f.write(raw)
+    catalog_file.compile_catalog(pricing.PriceCatalog.from_json(raw), bin_path)
+
+    print(f"median of {RUNS} fresh processes; json {len(raw)} bytes, compiled {os.path.getsize(bin_path)} bytes")
+    print(f"{'catalog':>10} {'first quote ms':>15} {'private KiB':>12} {'lines/s':>10}")
+    for source, path in (('json', json_path), ('compiled', bin_path)):
+        results = [run(source, path) for _ in range(RUNS)]
+        first_quote, grown, rate = (statistics.median(column) for column in zip(*results))
+        print(f"{source:>10} {first_quote:>15.2f} {grown:>12.0f} {rate:>10,.0f}")
+
+if __name__ == '__main__':
+    if sys.argv[1:2] == ['child']:
+        child(*sys.argv[2:])
+    else:
+        main()
@@ -0,0 +1,83 @@
+"""
+Cell update benchmark
+Pastes a 50x10 block through /update_cell one cell at a time and through
+/api/cells/batch in one request, reporting requests, queries and latency
+
+Run from the repository root: python benchmarks/cell_updates.py
+"""
+
+import asyncio
+import os
+import sys
+import tempfile
+import time
+
+if 'DATABASE_URL' not in os.environ:
+    os.environ['DATABASE_URL'] = f"sqlite:///{os.path.join(tempfile.mkdtemp(), 'boards.db')}"
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import httpx
+from sqlalchemy import event, insert, select
+
+import board_app
+from board_app import Board, BoardColumn, BoardItem, ColumnType
+
+ROWS = 50
+COLUMNS = 10
+
+async def seed():
+    async with board_app.SessionLocal() as db:
+        board = Board(name="Paste bench")
+        db.add(board)
+        await db.flush()
+        columns = [BoardColumn(board_id=board.id, name=f"Col {i}", type=ColumnType.TEXT, order=i)
+                   for i in range(COLUMNS)]
+        db.add_all(columns)
+        await db.execute(insert(BoardItem), [
+            {"board_id": board.id, "group_name": "Main Group", "order": i} for i in range(ROWS)
+        ])
+        await db.flush()
+        item_ids = (await db.scalars(select(BoardItem.id).where(BoardItem.board_id == board.id))).all()
+        await db.commit()
+        return item_ids, [column.id for column in columns]
+
+def paste_block(item_ids, column_ids, tag):
+    return [{"item_id": item_id, "column_id": column_id, "value": f"{tag}-{item_id}-{column_id}"}
+            for item_id in item_ids for column_id in column_ids]
+
+async def per_cell(client, cells):
+    for cell in cells:
+        response = await client.post('/update_cell', data=cell)
+        response.raise_for_status()
+    return len(cells)
+
+async def batched(client, cells):
+    response = await client.post('/api/cells/batch', json={"updates": cells})
+    response.raise_for_status()
+    return 1
+
+async def main():
+    queries = 0
+
+    def count(*args):
+        nonlocal queries
+        queries += 1
+
+    transport = httpx.ASGITransport(app=board_app.app)
+    async with board_app.lifespan(board_app.app):
+        item_ids, column_ids = await seed()
+        event.listen(board_app.engine.sync_engine, "before_cursor_execute", count)
+        async with httpx.AsyncClient(transport=transport, base_url='http://bench') as client:
+            print(f"{'path':>10} {'cells':>6} {'requests':>9} {'queries':>8} {'ms':>9}")
+            # The first per-cell run inserts the cells, every later run updates them
+            for tag in ('insert', 'update'):
+                cells = paste_block(item_ids, column_ids, tag)
+                for name, path in (('per-cell', per_cell), ('batch', batched)):
+                    queries = 0
+                    start = time.perf_counter()
+                    requests = await path(client, cells)
+                    elapsed = time.perf_counter() - start
+                    print(f"{name:>10} {len(cells):>6} {requests:>9} {queries:>8} {elapsed * 1000:>9.1f}")
+
+if __name__ == '__main__':
+    asyncio.run(main())
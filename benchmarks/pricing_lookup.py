@@ -0,0 +1,134 @@
+"""
+V300 price lookup benchmark
+Prices 100k random quote lines on one core through pricing.PriceCatalog,
+against the extracted catalog and a synthetic one with the full size counts
+the sheet lists (71 SH sizes, 231 picture windows, ...), next to a linear
+scan over the raw JSON entries
+
+Before timing, SizeGrid.find is checked against a brute-force search for
+the least-area fit, on random openings and on an irregular grid where the
+narrowest fitting width is not the smallest window; any mismatch exits
+non-zero.
+
+Run from the repository root: python benchmarks/pricing_lookup.py
+"""
+
+import json
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pricing
+from pricing import PriceCatalog, PricingError, SizeGrid, parse_dimensions
+
+LINES = 100_000
+REPEATS = 3
+CHECKS = 20_000
+
+def full_size_catalog(raw: bytes) -> bytes:
+    """The extracted catalog with each window type grown to its listed totalSizes"""
+    data = json.loads(raw)
+    rng = random.Random(7)
+    for window in data['windowTypes'].values():
+        tiers = len(window['pricing'][0]['configurations'])
+        count = window.get('totalSizes') or len(window['pricing'])
+        columns = max(1, int(count ** 0.5))
+        window['pricing'] = [{
+            'width': 0, 'height': 0, 'widthRaw': f'{12 + 6 * (i % columns)}{12 + 6 * (i // columns)}',
+            'heightRaw': f'{11 + 6 * (i % columns)} 1/2 x {11 + 6 * (i // columns)} 1/2',
+            'basePrice': 0, 'configurations': [rng.randint(150, 900) for _ in range(tiers)]
+        } for i in range(count)]
+    return json.dumps(data).encode()
+
+def random_lines(catalog: PriceCatalog, rng: random.Random):
+    """Openings that all fit some catalog size, so every line prices"""
+    grids = list(catalog.grids.values())
+    lines = []
+    for _ in range(LINES):
+        grid = rng.choice(grids)
+        index = rng.randrange(len(grid))
+        width, height = grid.width_at(index), grid.heights[index]
+        lines.append((grid.window_type, width - rng.random() * 3, height - rng.random() * 3,
+                      rng.randrange(grid.tiers) if grid.tiers else 0, rng.randint(1, 4)))
+    return lines
+
+def linear_scan(data: dict):
+    """Filter every entry of the window type, then take the least-area one that fits"""
+    windows = data['windowTypes']
+
+    def quote(window_type, width, height, configuration, quantity):
+        fits = []
+        for entry in windows[window_type]['pricing']:
+            w, h = parse_dimensions(entry)
+            if w >= width and h >= height and configuration < len(entry['configurations']):
+                fits.append((w, h, entry))
+        if not fits:
+            raise PricingError(window_type)
+        unit_price = min(fits, key=lambda fit: (fit[0] * fit[1], fit[0]))[2]['configurations'][configuration]
+        return unit_price * quantity
+    return quote
+
+def smallest_fit(grid: SizeGrid, width: float, height: float) -> int:
+    """Brute-force reference for SizeGrid.find: least area, then narrowest"""
+    fits = [(grid.width_at(index) * grid.heights[index], grid.width_at(index), index)
+            for index in range(len(grid))
+            if grid.width_at(index) >= width and grid.heights[index] >= height]
+    return min(fits)[2] if fits else -1
+
+def check_find(catalog: PriceCatalog, rng: random.Random) -> int:
+    """Mismatches between SizeGrid.find and smallest_fit"""
+    # 24 x 72 is the narrowest size that fits 20 x 30, but 30 x 36 is smaller
+    irregular = SizeGrid.from_entries('IRR', 'Irregular', [
+        {'heightRaw': dimensions, 'configurations': [100]}
+        for dimensions in ('24 x 72', '30 x 36', '36 x 24', '48 x 30', '48 x 48')
+    ])
+    cases = [(irregular, 20, 30), (irregular, 30, 20), (irregular, 40, 25), (irregular, 49, 10)]
+    grids = list(catalog.grids.values())
+    for _ in range(CHECKS):
+        grid = rng.choice(grids + [irregular])
+        cases.append((grid, rng.uniform(1, grid.widths[-1] + 6), rng.uniform(1, max(grid.heights) + 6)))
+
+    mismatches = 0
+    for grid, width, height in cases:
+        try:
+            found = grid.find(width, height)
+        except PricingError:
+            found = -1
+        if found != smallest_fit(grid, width, height):
+            mismatches += 1
+    return mismatches
+
+def best_rate(fn, lines):
+    best = float('inf')
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        for line in lines:
+            fn(*line)
+        best = min(best, time.perf_counter() - start)
+    return len(lines) / best
+
+def main():
+    with open(pricing.CATALOG_PATH, 'rb') as f:
+        extracted = f.read()
+    rng = random.Random(42)
+
+    print(f"{LINES} lines, best of {REPEATS}, lines/s")
+    print(f"{'catalog':>12} {'sizes':>6} {'load ms':>8} {'linear scan':>12} {'PriceCatalog':>13}")
+    for label, raw in (('extracted', extracted), ('full size', full_size_catalog(extracted))):
+        start = time.perf_counter()
+        catalog = PriceCatalog.from_json(raw)
+        load = time.perf_counter() - start
+        mismatches = check_find(catalog, rng)
+        if mismatches:
+            sys.exit(f"{label}: SizeGrid.find missed the least-area fit for {mismatches} opening(s)")
+        lines = random_lines(catalog, rng)
+        scan = best_rate(linear_scan(json.loads(raw)), lines[:LINES // 10])
+        indexed = best_rate(catalog.quote, lines)
+        sizes = sum(len(grid) for grid in catalog.grids.values())
+        print(f"{label:>12} {sizes:>6} {load * 1000:>8.1f} {scan:>12,.0f} {indexed:>13,.0f}")
+
+if __name__ == '__main__':
+    main()
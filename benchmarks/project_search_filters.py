@@ -0,0 +1,83 @@
+"""
+Project search filter check
+Requests app.py's /projects page with every combination of search term and
+status filter and compares the listed projects with the expected rows, so a
+filter that breaks once search joins its ranked subquery shows up here
+
+app.py still registers create_tables with before_first_request, which
+Flask 3 removed; this script installs a no-op stand-in so the module imports.
+
+Run from the repository root: python benchmarks/project_search_filters.py
+"""
+
+import os
+import re
+import sys
+import tempfile
+
+os.environ.setdefault('DATABASE_URL', f"sqlite:///{os.path.join(tempfile.mkdtemp(), 'project_search.db')}")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import flask
+
+if not hasattr(flask.Flask, 'before_first_request'):
+    flask.Flask.before_first_request = lambda self, fn: fn
+
+import app as flask_app
+from app import Project, User, db
+from search import install_search_index
+
+PROJECTS = [
+    ('Kitchen Window Replacement', 'complete'),
+    ('Kitchen Garden Door', 'in progress'),
+    ('Bathroom Window Upgrade', 'complete'),
+    ('Living Room Patio Door', 'scheduled'),
+]
+CASES = [
+    ('', ''),
+    ('kitch', ''),
+    ('', 'complete'),
+    ('kitch', 'complete'),
+    ('window', 'complete'),
+    ('door', 'complete'),
+]
+
+def seed():
+    with flask_app.app.app_context():
+        db.create_all()
+        with db.engine.begin() as conn:
+            install_search_index(conn)
+        user = User(username='search', email='search@example.com', role='admin')
+        user.set_password('search')
+        db.session.add(user)
+        db.session.add_all(Project(name=name, status=status) for name, status in PROJECTS)
+        db.session.commit()
+        return user.generate_token()
+
+def expected(search, status):
+    return sorted(
+        name for name, project_status in PROJECTS
+        if (not status or project_status == status)
+        and (not search or any(word.lower().startswith(search) for word in name.split()))
+    )
+
+def main():
+    token = seed()
+    client = flask_app.app.test_client()
+    with client.session_transaction() as flask_session:
+        flask_session['token'] = token
+
+    names = [name for name, _ in PROJECTS]
+    failures = 0
+    for search, status in CASES:
+        response = client.get('/projects', query_string={'search': search, 'status': status})
+        listed = sorted(name for name in names if re.search(rf'>\s*{re.escape(name)}\s*<', response.get_data(as_text=True)))
+        ok = response.status_code == 200 and listed == expected(search, status)
+        failures += not ok
+        print(f"{'ok' if ok else 'FAIL':>4}  search={search!r:<10} status={status!r:<12} "
+              f"{response.status_code} {listed}")
+    if failures:
+        sys.exit(f'{failures} case(s) failed')
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,110 @@
+"""
+Project serialization microbenchmark
+Fetches and encodes 50k projects the old way (ORM objects, hand-built dicts,
+FastAPI's jsonable_encoder and json.dumps) and through serialization.py
+(column tuples encoded to bytes), reporting fetch and encode time separately
+
+Run from the repository root: python benchmarks/project_serialization.py
+"""
+
+import json
+import os
+import sys
+import time
+from datetime import date, datetime, timedelta
+
+os.environ.setdefault('DATABASE_URL', 'sqlite+aiosqlite://')
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fastapi.encoders import jsonable_encoder
+from sqlalchemy import create_engine, insert, select
+from sqlalchemy.orm import Session
+
+import serialization
+from main import Base, Project
+from serialization import project_columns, project_dicts
+
+PROJECTS = 50_000
+REPEATS = 3
+
+def legacy_dict(p):
+    """The per-row dict the API handlers used to build"""
+    return {
+        "id": p.id,
+        "name": p.name,
+        "status": p.status,
+        "assigned_to": p.assigned_to,
+        "project_address": p.project_address,
+        "client_phone": p.client_phone,
+        "start_date": p.start_date.isoformat() if p.start_date else None,
+        "end_date": p.end_date.isoformat() if p.end_date else None,
+        "updated_at": p.updated_at.isoformat()
+    }
+
+def seed(engine):
+    Base.metadata.create_all(engine)
+    base = datetime(2025, 1, 1)
+    with engine.begin() as conn:
+        conn.execute(insert(Project), [{
+            "name": f"Project {i}", "status": "in progress", "assigned_to": "Jane Smith",
+            "project_address": f"{i} Main St", "client_phone": "555-0100",
+            "start_date": date(2025, 1, 1) + timedelta(days=i % 300),
+            "updated_at": base + timedelta(seconds=i), "created_at": base
+        } for i in range(PROJECTS)])
+
+def legacy(engine):
+    with Session(engine) as db:
+        start = time.perf_counter()
+        projects = db.scalars(select(Project).order_by(Project.updated_at.desc(), Project.id.desc())).all()
+        fetched = time.perf_counter()
+        body = json.dumps(jsonable_encoder([legacy_dict(p) for p in projects])).encode()
+        return fetched - start, time.perf_counter() - fetched, body
+
+def tuples(engine):
+    with engine.connect() as conn:
+        start = time.perf_counter()
+        rows = conn.execute(
+            select(*project_columns(Project)).order_by(Project.updated_at.desc(), Project.id.desc())
+        ).all()
+        fetched = time.perf_counter()
+        body = serialization.dumps(project_dicts(rows))
+        return fetched - start, time.perf_counter() - fetched, body
+
+def stdlib_tuples(engine):
+    """``tuples`` with json.dumps in place of orjson, to show what orjson adds"""
+    with engine.connect() as conn:
+        start = time.perf_counter()
+        rows = conn.execute(
+            select(*project_columns(Project)).order_by(Project.updated_at.desc(), Project.id.desc())
+        ).all()
+        fetched = time.perf_counter()
+        body = json.dumps(project_dicts(rows), default=lambda value: value.isoformat(),
+                          separators=(',', ':')).encode()
+        return fetched - start, time.perf_counter() - fetched, body
+
+def best_of(fn, engine):
+    runs = [fn(engine) for _ in range(REPEATS)]
+    fetch = min(run[0] for run in runs)
+    encode = min(run[1] for run in runs)
+    return fetch, encode, runs[-1][2]
+
+def main():
+    engine = create_engine('sqlite://')
+    seed(engine)
+
+    cases = [('ORM + dicts + jsonable_encoder', legacy), ('tuples + orjson', tuples),
+             ('tuples + json', stdlib_tuples)]
+
+    print(f"{PROJECTS} projects, best of {REPEATS}")
+    print(f"{'path':>32} {'fetch ms':>9} {'encode ms':>10} {'total ms':>9} {'MiB':>6}")
+    bodies = []
+    for label, fn in cases:
+        fetch, encode, body = best_of(fn, engine)
+        bodies.append(body)
+        print(f"{label:>32} {fetch * 1000:>9.1f} {encode * 1000:>10.1f} {(fetch + encode) * 1000:>9.1f} "
+              f"{len(body) / 2 ** 20:>6.1f}")
+
+    assert all(json.loads(body) == json.loads(bodies[0]) for body in bodies), "payloads differ"
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,117 @@
+"""
+In-memory project store benchmark
+Compares simple_app's old list scans with ProjectStore for dashboard stats,
+lookup by id and listing by status over 100k projects, then hammers the
+store from 8 threads and checks the counters against a full recount
+
+Run from the repository root: python benchmarks/project_store.py
+"""
+
+import os
+import random
+import sys
+import tempfile
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from project_store import ProjectStore
+
+PROJECTS = 100_000
+LOOKUPS = 1_000
+STATUSES = ('new lead', 'scheduled', 'in progress', 'on order', 'complete')
+ASSIGNEES = ('John Doe', 'Jane Smith', 'Sam Lee', '')
+THREADS = 8
+WRITES_PER_THREAD = 20_000
+
+def make_projects(rng):
+    return [{
+        'id': i, 'name': f'Project {i}', 'status': rng.choice(STATUSES),
+        'assigned_to': rng.choice(ASSIGNEES), 'address': f'{i} Main St'
+    } for i in range(1, PROJECTS + 1)]
+
+def list_stats(projects_data):
+    """What simple_app.index computed on every request"""
+    return {
+        'total_projects': len(projects_data),
+        'active_projects': len([p for p in projects_data if p['status'] in ['in progress', 'scheduled']]),
+        'completed_projects': len([p for p in projects_data if p['status'] == 'complete']),
+        'new_leads': len([p for p in projects_data if p['status'] == 'new lead'])
+    }
+
+def timed(fn, repeats):
+    start = time.perf_counter()
+    for _ in range(repeats):
+        result = fn()
+    return (time.perf_counter() - start) / repeats * 1000, result
+
+def main():
+    rng = random.Random(5)
+    projects_data = make_projects(rng)
+    store = ProjectStore(projects_data)
+    ids = [rng.randint(1, PROJECTS) for _ in range(LOOKUPS)]
+
+    cases = [
+        ('dashboard stats', lambda: list_stats(projects_data), store.stats, 20),
+        (f'{LOOKUPS} lookups by id',
+         lambda: [next(p for p in projects_data if p['id'] == i) for i in ids[:20]] and None,
+         lambda: [store.get(i) for i in ids] and None, 1),
+        # The store hands out copies, so the scans copy their matches too
+        ("list 'complete'", lambda: [dict(p) for p in projects_data if p['status'] == 'complete'],
+         lambda: store.by_status('complete'), 20),
+        ("'on order' for Sam Lee", lambda: [dict(p) for p in projects_data
+                                             if p['status'] == 'on order' and p['assigned_to'] == 'Sam Lee'],
+         lambda: store.find(status='on order', assigned_to='Sam Lee'), 20),
+    ]
+    print(f"{PROJECTS} projects, ms per call")
+    print(f"{'operation':>24} {'list scan':>10} {'ProjectStore':>13}")
+    for label, scan, indexed, repeats in cases:
+        scan_ms, expected = timed(scan, repeats)
+        store_ms, result = timed(indexed, repeats)
+        if label.startswith(str(LOOKUPS)):
+            scan_ms *= LOOKUPS / 20  # the scan is too slow to run all of them
+        else:
+            assert result == expected, label
+        print(f"{label:>24} {scan_ms:>10.2f} {store_ms:>13.3f}")
+
+    def writer(seed):
+        local = random.Random(seed)
+        for _ in range(WRITES_PER_THREAD):
+            roll = local.random()
+            if roll < 0.7:
+                store.update(local.randint(1, PROJECTS), status=local.choice(STATUSES),
+                             assigned_to=local.choice(ASSIGNEES))
+            elif roll < 0.85:
+                store.add(name='New', status='new lead', assigned_to=local.choice(ASSIGNEES))
+            else:
+                store.delete(local.randint(1, PROJECTS))
+
+    start = time.perf_counter()
+    threads = [threading.Thread(target=writer, args=(seed,)) for seed in range(THREADS)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+
+    everything = store.all()
+    assert store.stats() == list_stats(everything), "counters drifted from the data"
+    for status in STATUSES:
+        assert store.by_status(status) == [p for p in everything if p['status'] == status], status
+    for assignee in ASSIGNEES:
+        assert store.by_assignee(assignee) == [p for p in everything if p['assigned_to'] == assignee], assignee
+    print(f"{THREADS * WRITES_PER_THREAD} writes from {THREADS} threads in {elapsed:.2f} s; indexes and counters consistent")
+
+    path = os.path.join(tempfile.mkdtemp(), 'projects.json')
+    start = time.perf_counter()
+    store.save(path)
+    saved = time.perf_counter() - start
+    start = time.perf_counter()
+    restored = ProjectStore(snapshot_path=path)
+    loaded = time.perf_counter() - start
+    assert restored.all() == everything and restored.stats() == store.stats()
+    print(f"snapshot of {len(restored)} projects: save {saved * 1000:.0f} ms, load {loaded * 1000:.0f} ms")
+
+if __name__ == '__main__':
+    main()
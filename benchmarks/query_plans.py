@@ -0,0 +1,209 @@
+"""
+Query plan regression check
+Runs EXPLAIN on each hot project and board query against seeded data and
+exits non-zero if any of them falls back to a sequential scan or does not
+use the index it was built for, or if an index on the hot tables is used
+by none of them
+
+Uses a temporary SQLite file unless PLAN_DATABASE_URL points at PostgreSQL
+(sync driver, e.g. postgresql://localhost/plans_check).
+
+Run from the repository root: python benchmarks/query_plans.py
+"""
+
+import json
+import os
+import re
+import sys
+import tempfile
+from datetime import datetime, timedelta
+
+os.environ.setdefault('DATABASE_URL', 'sqlite+aiosqlite://')
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import create_engine, delete, func, insert, select, text
+
+import board_app
+import main
+from board_app import BoardColumn, BoardItem, ItemValue
+from change_feed import changed_since
+from dashboard_stats import status_count_query
+from main import Project, ProjectQuote
+from pagination import keyset_before
+
+PROJECTS = 2000
+QUOTES = 4000
+CHANGES = 5000  # per entity
+ITEMS = 2000
+COLUMNS = 6
+STATUSES = ['new lead', 'in progress', 'on order', 'scheduled', 'complete']
+
+# The index each hot query must use; a plan that picks another one fails
+EXPECTED_INDEXES = {
+    'dashboard recent projects': 'ix_projects_updated_at_id',
+    'api projects first page': 'ix_projects_updated_at_id',
+    'api projects keyset page': 'ix_projects_updated_at_id',
+    'projects by status': 'ix_projects_status_updated_at',
+    'dashboard status counts': 'ix_projects_status_updated_at',
+    'project quotes': 'ix_project_quotes_project_id',
+    'project change feed': 'ix_change_log_entity_scope_seq',
+    'board change feed': 'ix_change_log_entity_scope_seq',
+    'board columns': 'ix_columns_board_order',
+    'board items': 'ix_items_board_group_order',
+    'group item range': 'ix_items_board_group_order',
+    'board group counts': 'ix_items_board_group_order',
+    'group item count': 'ix_items_board_group_order',
+    'board cell values': 'uq_item_values_item_column',
+    'item values by item': 'uq_item_values_item_column',
+    'cell lookup': 'uq_item_values_item_column',
+    'item values by column': 'ix_item_values_column_id',
+}
+
+def hot_queries():
+    cursor = (datetime(2025, 1, 1), 1000)
+    return {
+        'dashboard recent projects':
+            select(Project).order_by(Project.updated_at.desc()).limit(10),
+        'api projects first page':
+            select(Project).order_by(Project.updated_at.desc(), Project.id.desc()).limit(101),
+        'api projects keyset page':
+            select(Project).where(keyset_before(Project.updated_at, Project.id, cursor))
+            .order_by(Project.updated_at.desc(), Project.id.desc()).limit(101),
+        'projects by status':
+            select(Project).where(Project.status == 'complete').order_by(Project.updated_at.desc()).limit(51),
+        'dashboard status counts':
+            status_count_query(Project),
+        'project quotes':
+            select(ProjectQuote.id, ProjectQuote.total).where(ProjectQuote.project_id == 7)
+            .order_by(ProjectQuote.id.desc()),
+        'project change feed':
+            changed_since(main.change_log, 'project', 100, 101),
+        'board change feed':
+            changed_since(board_app.change_log, 'item', 100, 101, scope_id=1),
+        'board columns':
+            select(BoardColumn).where(BoardColumn.board_id == 1).order_by(BoardColumn.order),
+        'board items':
+            select(BoardItem.id).where(BoardItem.board_id == 1).order_by(BoardItem.group_name, BoardItem.order),
+        'group item range':
+            select(BoardItem.id).where(BoardItem.board_id == 1, BoardItem.group_name == 'Group 1')
+            .order_by(BoardItem.order, BoardItem.id).offset(100).limit(51),
+        'board group counts':
+            select(BoardItem.group_name, func.count(BoardItem.id)).where(BoardItem.board_id == 1)
+            .group_by(BoardItem.group_name),
+        'group item count':
+            select(func.count(BoardItem.id)).where(BoardItem.board_id == 1, BoardItem.group_name == 'Group 1'),
+        'board cell values':
+            select(ItemValue.item_id, ItemValue.column_id, ItemValue.value)
+            .join(BoardItem, ItemValue.item_id == BoardItem.id).where(BoardItem.board_id == 1),
+        'item values by item':
+            select(ItemValue).where(ItemValue.item_id == 10),
+        'cell lookup':
+            select(ItemValue).where(ItemValue.item_id == 10, ItemValue.column_id == 2),
+        'item values by column':
+            delete(ItemValue).where(ItemValue.column_id == 3),
+    }
+
+def hot_indexes():
+    """Secondary indexes on the tables the hot queries read; primary-key-only indexes are left out"""
+    names = set()
+    for metadata in (main.Base.metadata, board_app.Base.metadata):
+        for table in metadata.sorted_tables:
+            for index in table.indexes:
+                if [column.name for column in index.columns] != [column.name for column in table.primary_key]:
+                    names.add(index.name)
+    return names
+
+def seed(engine):
+    main.Base.metadata.create_all(engine)
+    board_app.Base.metadata.create_all(engine)
+    base = datetime(2025, 1, 1)
+
+    with engine.begin() as conn:
+        conn.execute(insert(Project), [
+            {"name": f"Project {i}", "status": STATUSES[i % len(STATUSES)],
+             "updated_at": base + timedelta(minutes=i), "created_at": base}
+            for i in range(PROJECTS)
+        ])
+        conn.execute(insert(ProjectQuote), [
+            {"project_id": i % PROJECTS + 1, "catalog_version": "bench", "line_count": 1, "total": 100.0,
+             "lines": {}}
+            for i in range(QUOTES)
+        ])
+        conn.execute(insert(board_app.Board), [{"id": b, "name": f"Board {b}"} for b in range(1, 11)])
+        conn.execute(insert(BoardColumn), [
+            {"board_id": b, "name": f"Col {c}", "type": "TEXT", "order": c}
+            for b in range(1, 11) for c in range(COLUMNS)
+        ])
+        conn.execute(insert(BoardItem), [
+            {"board_id": i % 10 + 1, "group_name": f"Group {i % 4}", "order": i} for i in range(ITEMS)
+        ])
+        conn.execute(insert(ItemValue), [
+            {"item_id": i, "column_id": c, "value": "x"}
+            for i in range(1, ITEMS + 1) for c in range(1, COLUMNS + 1)
+        ])
+        conn.execute(insert(main.change_log), [
+            {"entity": "project", "entity_id": i % PROJECTS + 1, "scope_id": None} for i in range(CHANGES)
+        ] + [
+            {"entity": "item", "entity_id": i % ITEMS + 1, "scope_id": i % 10 + 1} for i in range(CHANGES)
+        ])
+        conn.execute(text("ANALYZE"))
+
+def sqlite_seq_scans(conn, sql, params):
+    rows = conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {sql}", params).fetchall()
+    details = [row[-1] for row in rows]
+    return details, [d for d in details if re.fullmatch(r'SCAN \w+', d)]
+
+def postgres_seq_scans(conn, sql, params):
+    plan = conn.exec_driver_sql(f"EXPLAIN (FORMAT JSON) {sql}", params).scalar()
+    plan = plan if isinstance(plan, list) else json.loads(plan)
+    nodes, scans = [], []
+
+    def walk(node):
+        label = ' '.join(filter(None, (node['Node Type'], node.get('Relation Name'), node.get('Index Name'))))
+        nodes.append(label)
+        if node['Node Type'] == 'Seq Scan':
+            scans.append(label)
+        for child in node.get('Plans', []):
+            walk(child)
+
+    walk(plan[0]['Plan'])
+    return nodes, scans
+
+def main_check():
+    url = os.getenv('PLAN_DATABASE_URL') or f"sqlite:///{os.path.join(tempfile.mkdtemp(), 'plans.db')}"
+    engine = create_engine(url)
+    seed(engine)
+
+    failures = 0
+    with engine.connect() as conn:
+        if engine.dialect.name == 'postgresql':
+            # Small seeded tables make seq scans look cheap; we only care that an index is usable
+            conn.exec_driver_sql("SET enable_seqscan = off")
+            explain = postgres_seq_scans
+        else:
+            explain = sqlite_seq_scans
+
+        used = set()
+        for name, statement in hot_queries().items():
+            compiled = statement.compile(engine)
+            params = compiled.params if engine.dialect.paramstyle in ('pyformat', 'named') else \
+                tuple(compiled.params[key] for key in compiled.positiontup)
+            plan, scans = explain(conn, str(compiled), params)
+            plan_text = '; '.join(plan)
+            used.update(index for index in hot_indexes() if re.search(rf'\b{index}\b', plan_text))
+            expected = EXPECTED_INDEXES[name]
+            missing = not re.search(rf'\b{expected}\b', plan_text)
+            status = 'FAIL' if scans or missing else 'ok'
+            failures += status == 'FAIL'
+            print(f"[{status:>4}] {name}: {plan_text}" + (f" (expected {expected})" if missing else ''))
+
+    engine.dispose()
+    unused = sorted(hot_indexes() - used)
+    for index in unused:
+        print(f"[FAIL] {index} is used by no hot query")
+    if failures or unused:
+        print(f"{failures} hot queries use a sequential scan or miss their index; {len(unused)} indexes unused")
+        sys.exit(1)
+
+if __name__ == '__main__':
+    main_check()
@@ -0,0 +1,80 @@
+"""
+Real-time fan-out harness
+Simulated Socket.IO clients each view a page of projects while editors
+generate cell_editing_started events; reports messages delivered per client
+per second with everyone in one room versus per-project rooms
+
+Run from the repository root: python benchmarks/room_fanout.py
+"""
+
+import asyncio
+import os
+import random
+import sys
+import time
+from collections import Counter
+
+os.environ.setdefault('DATABASE_URL', 'sqlite+aiosqlite://')
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import main
+from rooms import LOBBY_ROOM
+
+CLIENTS = 200
+PROJECTS = 2000
+PROJECTS_PER_PAGE = 50
+EVENTS = 2000
+SIMULATED_SECONDS = 10  # EVENTS are spread over this much wall time
+
+async def connect_clients(sio):
+    sids = []
+    for i in range(CLIENTS):
+        sid = await sio.manager.connect(f'eio-{i}', '/')
+        sids.append(sid)
+    return sids
+
+async def run(mode, rng):
+    sio = main.sio
+    delivered = Counter()
+
+    async def count_delivery(eio_sid, pkt):
+        delivered[eio_sid] += 1
+
+    sio.eio.send_packet = count_delivery
+    sids = await connect_clients(sio)
+
+    for sid in sids:
+        if mode == 'global':
+            await sio.enter_room(sid, LOBBY_ROOM)
+        else:
+            page = rng.randrange(0, PROJECTS, PROJECTS_PER_PAGE)
+            await main.subscribe(sid, {'project_ids': list(range(page, page + PROJECTS_PER_PAGE))})
+
+    start = time.perf_counter()
+    for _ in range(EVENTS):
+        editor = rng.choice(sids)
+        project_id = rng.randrange(PROJECTS)
+        if mode == 'global':
+            # The previous behaviour: every editing event went to the lobby room
+            await sio.emit('cell_editing_started', {'project_id': project_id, 'field': 'status'},
+                           room=LOBBY_ROOM, skip_sid=editor)
+        else:
+            await main.start_editing(editor, {'project_id': project_id, 'field': 'status'})
+    elapsed = time.perf_counter() - start
+
+    for sid in sids:
+        await sio.manager.disconnect(sid, '/')
+
+    per_client = sum(delivered.values()) / CLIENTS / SIMULATED_SECONDS
+    return per_client, sum(delivered.values()), elapsed
+
+async def main_async():
+    print(f"{CLIENTS} clients, {EVENTS} editing events over {SIMULATED_SECONDS}s, "
+          f"{PROJECTS_PER_PAGE} of {PROJECTS} projects on screen per client")
+    print(f"{'mode':>8} {'msgs/client/s':>14} {'delivered':>10} {'fan-out ms':>11}")
+    for mode in ('global', 'sharded'):
+        per_client, total, elapsed = await run(mode, random.Random(42))
+        print(f"{mode:>8} {per_client:>14.2f} {total:>10} {elapsed * 1000:>11.1f}")
+
+if __name__ == '__main__':
+    asyncio.run(main_async())
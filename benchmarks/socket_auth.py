@@ -0,0 +1,96 @@
+"""
+Socket event authentication benchmark
+Sends editing events through app.py's Flask-SocketIO handlers and reports
+events per second and database queries per event, comparing the old
+per-event JWT decode and user lookup with the per-sid principal table
+
+app.py still registers create_tables with before_first_request, which
+Flask 3 removed; this script installs a no-op stand-in so the module imports.
+
+Run from the repository root: python benchmarks/socket_auth.py
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+os.environ.setdefault('DATABASE_URL', f"sqlite:///{os.path.join(tempfile.mkdtemp(), 'socket_auth.db')}")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import flask
+import jwt
+from flask import session
+from flask_socketio import emit
+from sqlalchemy import event
+
+if not hasattr(flask.Flask, 'before_first_request'):
+    flask.Flask.before_first_request = lambda self, fn: fn
+
+import app as flask_app
+from app import JWT_SECRET, User, db, socketio
+from rooms import project_room
+
+EVENTS = 5000
+
+def legacy_start_editing(data):
+    """The previous handler: decode the JWT and load the user on every event"""
+    token = session.get('token')
+    if token:
+        try:
+            payload = jwt.decode(token, JWT_SECRET, algorithms=['HS256'])
+            user = User.query.get(payload['user_id'])
+            if user:
+                emit('cell_editing_started', {
+                    'project_id': data['project_id'],
+                    'field': data['field'],
+                    'user_id': user.id,
+                    'username': user.username
+                }, room=project_room(data['project_id']), include_self=False)
+        except jwt.InvalidTokenError:
+            pass
+
+def connect_client():
+    with flask_app.app.app_context():
+        db.create_all()
+        user = User.query.filter_by(username='bench').first()
+        if user is None:
+            user = User(username='bench', email='bench@example.com', role='admin')
+            user.set_password('bench')
+            db.session.add(user)
+            db.session.commit()
+        token = user.generate_token()
+
+    http = flask_app.app.test_client()
+    with http.session_transaction() as flask_session:
+        flask_session['token'] = token
+    return socketio.test_client(flask_app.app, flask_test_client=http)
+
+def run(client, event_name, queries):
+    queries.clear()
+    start = time.perf_counter()
+    for i in range(EVENTS):
+        client.emit(event_name, {'project_id': i % 50, 'field': 'status'})
+    elapsed = time.perf_counter() - start
+    return EVENTS / elapsed, len(queries) / EVENTS
+
+def main():
+    socketio.on_event('start_editing_legacy', legacy_start_editing)
+    client = connect_client()
+    if not client.is_connected():
+        sys.exit('socket connection was rejected')
+
+    queries = []
+    with flask_app.app.app_context():
+        event.listen(db.engine, 'before_cursor_execute', lambda *args: queries.append(1))
+
+    print(f"{EVENTS} start_editing events from one connection")
+    print(f"{'handler':>12} {'events/s':>10} {'queries/event':>14}")
+    for label, event_name in (('per-event', 'start_editing_legacy'), ('per-sid', 'start_editing')):
+        rate, per_event = run(client, event_name, queries)
+        print(f"{label:>12} {rate:>10.0f} {per_event:>14.2f}")
+
+    client.disconnect()
+
+if __name__ == '__main__':
+    main()
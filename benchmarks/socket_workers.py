@@ -0,0 +1,104 @@
+"""
+Multi-worker Socket.IO check
+Starts a local message hub and two worker processes of main.py; a client
+on the second worker subscribes to a project room and must receive the
+cells_updated frame for an edit published by the first worker
+
+Set SOCKETIO_MESSAGE_QUEUE to try another backend (redis:// or
+postgresql://); by default a local socket hub is started for the run.
+
+Run from the repository root: python benchmarks/socket_workers.py
+"""
+
+import asyncio
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PROJECT_ID = 7
+TIMEOUT = 10  # seconds
+
+async def listener_worker():
+    import main
+
+    received = asyncio.Event()
+    packets = []
+
+    async def deliver(eio_sid, pkt):
+        packets.append(pkt.encode())
+        if 'cells_updated' in str(packets[-1]):
+            received.set()
+
+    main.sio.eio.send_packet = deliver
+    main.sio.manager.initialize()
+    sid = await main.sio.manager.connect('eio-listener', '/')
+    await main.subscribe(sid, {'project_ids': [PROJECT_ID]})
+    # Give the listener a moment to attach to the queue before announcing readiness
+    await asyncio.sleep(0.5)
+    print('ready', flush=True)
+
+    try:
+        await asyncio.wait_for(received.wait(), TIMEOUT)
+    except asyncio.TimeoutError:
+        print('timeout', flush=True)
+        sys.exit(1)
+    print(f"received {packets[-1]}", flush=True)
+
+async def editor_worker():
+    import main
+    from rooms import project_room
+
+    main.sio.manager.initialize()
+    main.broadcaster.publish(project_room(PROJECT_ID), PROJECT_ID, {'status': 'complete'}, 'editor')
+    await main.broadcaster.flush()
+    await asyncio.sleep(0.2)
+    print('published', flush=True)
+
+def spawn(role, env):
+    return subprocess.Popen([sys.executable, '-W', 'ignore', os.path.abspath(__file__), role],
+                            cwd=ROOT, env=env, stdout=subprocess.PIPE, text=True)
+
+def main_check():
+    env = dict(os.environ, DATABASE_URL='sqlite+aiosqlite://')
+    hub = None
+    if not env.get('SOCKETIO_MESSAGE_QUEUE'):
+        path = os.path.join(tempfile.mkdtemp(), 'sio.sock')
+        hub = subprocess.Popen([sys.executable, os.path.join(ROOT, 'socket_managers.py'), 'hub', path])
+        env['SOCKETIO_MESSAGE_QUEUE'] = f'local://{path}'
+        deadline = time.monotonic() + TIMEOUT
+        while not os.path.exists(path) and time.monotonic() < deadline:
+            time.sleep(0.05)
+
+    try:
+        listener = spawn('listener', env)
+        if listener.stdout.readline().strip() != 'ready':
+            sys.exit('listener worker did not start')
+
+        editor = spawn('editor', env)
+        print(f"editor (pid {editor.pid}): {editor.stdout.readline().strip()}")
+        editor.wait(TIMEOUT)
+
+        outcome = listener.stdout.readline().strip()
+        listener.wait(TIMEOUT)
+        print(f"listener (pid {listener.pid}): {outcome}")
+    finally:
+        if hub is not None:
+            hub.terminate()
+
+    if listener.returncode != 0:
+        print(f"update did not reach the other worker via {env['SOCKETIO_MESSAGE_QUEUE']}")
+        sys.exit(1)
+    print(f"update crossed workers via {env['SOCKETIO_MESSAGE_QUEUE']}")
+
+if __name__ == '__main__':
+    sys.path.insert(0, ROOT)
+    role = sys.argv[1] if len(sys.argv) > 1 else None
+    if role == 'listener':
+        asyncio.run(listener_worker())
+    elif role == 'editor':
+        asyncio.run(editor_worker())
+    else:
+        main_check()
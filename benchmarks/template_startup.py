@@ -0,0 +1,80 @@
+"""
+Template cold-start benchmark
+Time from process start to the first rendered board dashboard, for the
+development template setup and for TEMPLATE_MODE=production with an empty
+and with a warm bytecode cache. Each run is a fresh process. Imports take
+most of a start and vary by tens of milliseconds from run to run, so the
+time after them (lifespan, where templates are precompiled, plus the first
+render) is reported on its own.
+
+Run from the repository root: python benchmarks/template_startup.py
+"""
+
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+START = time.perf_counter()
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+RUNS = 11
+
+def child():
+    sys.path.insert(0, ROOT)
+    import asyncio
+
+    import httpx
+
+    import board_app
+    imported = time.perf_counter()
+
+    async def first_render():
+        async with board_app.lifespan(board_app.app):
+            started = time.perf_counter()
+            transport = httpx.ASGITransport(app=board_app.app)
+            async with httpx.AsyncClient(transport=transport, base_url='http://bench') as client:
+                response = await client.get('/')
+                response.raise_for_status()
+            rendered = time.perf_counter()
+        await board_app.engine.dispose()
+        return started, rendered
+
+    started, rendered = asyncio.run(first_render())
+    print(f"{(imported - START) * 1000:.1f} {(started - imported) * 1000:.1f} {(rendered - started) * 1000:.1f} "
+          f"{(rendered - imported) * 1000:.1f} {(rendered - START) * 1000:.1f}")
+
+def run(env):
+    output = subprocess.run([sys.executable, '-W', 'ignore', os.path.abspath(__file__), 'child'],
+                            cwd=ROOT, env=env, capture_output=True, text=True, check=True).stdout
+    return [float(value) for value in output.split()]
+
+def main():
+    workdir = tempfile.mkdtemp()
+    base_env = dict(os.environ, DATABASE_URL=f"sqlite:///{os.path.join(workdir, 'boards.db')}")
+    # Create the sample board once so every measured run does the same work
+    run(base_env)
+
+    scenarios = [
+        ('development', lambda: dict(base_env, TEMPLATE_MODE='development')),
+        ('production, cold cache', lambda: dict(base_env, TEMPLATE_MODE='production',
+                                                TEMPLATE_CACHE_DIR=tempfile.mkdtemp(dir=workdir))),
+        ('production, warm cache', lambda: dict(base_env, TEMPLATE_MODE='production',
+                                                TEMPLATE_CACHE_DIR=os.path.join(workdir, 'warm'))),
+    ]
+    run(scenarios[2][1]())  # fill the shared cache
+
+    print(f"median of {RUNS} fresh processes")
+    print(f"{'templates':>24} {'imports ms':>11} {'lifespan ms':>12} {'first page ms':>14} "
+          f"{'after imports':>14} {'total ms':>9}")
+    for label, make_env in scenarios:
+        results = [run(make_env()) for _ in range(RUNS)]
+        imports, lifespan, first_page, after_imports, total = (statistics.median(column) for column in zip(*results))
+        print(f"{label:>24} {imports:>11.1f} {lifespan:>12.1f} {first_page:>14.1f} {after_imports:>14.1f} {total:>9.1f}")
+
+if __name__ == '__main__':
+    if sys.argv[1:] == ['child']:
+        child()
+    else:
+        main()
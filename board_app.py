@@ -5,27 +5,63 @@ Row-based project management system
 
 import os
 from datetime import datetime
+from itertools import groupby
+from operator import itemgetter
 from typing import List, Optional, Dict, Any
 from enum import Enum
 import json
 
 from fastapi import FastAPI, Request, Depends, HTTPException, Form
 from fastapi.responses import HTMLResponse, JSONResponse
-from fastapi.templating import Jinja2Templates
 from fastapi.staticfiles import StaticFiles
-from sqlalchemy import create_engine, Column, Integer, String, DateTime, Text, ForeignKey, Enum as SQLEnum
+from contextlib import asynccontextmanager
+from sqlalchemy import Column, Integer, String, DateTime, Text, ForeignKey, Index, Enum as SQLEnum, select, func, insert, literal, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker, Session, relationship
+from sqlalchemy.orm import Session, relationship
 from pydantic import BaseModel
 import uvicorn
 
-# Database setup
-DATABASE_URL = os.getenv('DATABASE_URL', 'sqlite:///./boards.db')
+from template_cache import PRODUCTION_TEMPLATES, create_templates, precompile_templates
+from http_cache import is_not_modified, make_etag, not_modified, validator_headers
+from change_feed import change_log_table, changed_since, record_change
+
+# Database setup: async drivers only, so handlers never block the event loop
+DATABASE_URL = os.getenv('DATABASE_URL', 'sqlite+aiosqlite:///./boards.db')
 if DATABASE_URL.startswith('postgresql://'):
-    DATABASE_URL = DATABASE_URL.replace('postgresql://', 'postgresql+psycopg2://', 1)
+    DATABASE_URL = DATABASE_URL.replace('postgresql://', 'postgresql+asyncpg://', 1)
+elif DATABASE_URL.startswith('sqlite://'):
+    DATABASE_URL = DATABASE_URL.replace('sqlite://', 'sqlite+aiosqlite://', 1)
+
+# Remove SSL mode parameter that causes issues with asyncpg
+if '?sslmode=' in DATABASE_URL:
+    DATABASE_URL = DATABASE_URL.split('?sslmode=')[0]
+
+# Connection pool sizing for the server-backed drivers; SQLite keeps its defaults
+engine_options = {}
+if not DATABASE_URL.startswith('sqlite'):
+    engine_options = {
+        "pool_size": int(os.getenv('BOARD_DB_POOL_SIZE', 10)),
+        "max_overflow": int(os.getenv('BOARD_DB_MAX_OVERFLOW', 20)),
+        "pool_timeout": 30,
+        "pool_pre_ping": True,
+    }
+
+# Sparse cells: a missing item_values row reads as an empty cell, so new
+# columns and items only store the values that are actually set
+SPARSE_CELLS = os.getenv('BOARD_SPARSE_CELLS', 'true').lower() in ('1', 'true', 'yes')
 
-engine = create_engine(DATABASE_URL)
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# Windowed rendering: the board page only renders the first rows of the first
+# few groups; the rest come from /board/{id}/rows as the user scrolls or
+# expands a group. BOARD_WINDOW_ROWS=0 renders the whole board in one pass.
+BOARD_WINDOW_ROWS = int(os.getenv('BOARD_WINDOW_ROWS', 50))
+BOARD_OPEN_GROUPS = int(os.getenv('BOARD_OPEN_GROUPS', 5))
+MAX_FRAGMENT_ROWS = 500
+
+engine = create_async_engine(DATABASE_URL, **engine_options)
+SessionLocal = async_sessionmaker(engine, autoflush=False, expire_on_commit=False)
 Base = declarative_base()
 
 # Enums
@@ -47,12 +83,17 @@ class Board(Base):
     name = Column(String, nullable=False)
     created_by = Column(String, default="User")
     created_at = Column(DateTime, default=datetime.utcnow)
+    # Bumped by every write to the board's columns, items or cells; feeds the page ETag
+    version = Column(Integer, nullable=False, default=0, server_default="0")
     
     columns = relationship("BoardColumn", back_populates="board", cascade="all, delete-orphan")
     items = relationship("BoardItem", back_populates="board", cascade="all, delete-orphan")
 
 class BoardColumn(Base):
     __tablename__ = "columns"
+    __table_args__ = (
+        Index("ix_columns_board_order", "board_id", "order"),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     board_id = Column(Integer, ForeignKey("boards.id"))
@@ -65,6 +106,9 @@ class BoardColumn(Base):
 
 class BoardItem(Base):
     __tablename__ = "items"
+    __table_args__ = (
+        Index("ix_items_board_group_order", "board_id", "group_name", "order"),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     board_id = Column(Integer, ForeignKey("boards.id"))
@@ -77,6 +121,12 @@ class BoardItem(Base):
 
 class ItemValue(Base):
     __tablename__ = "item_values"
+    __table_args__ = (
+        # One value per cell; also the conflict target for cell upserts and
+        # the index for lookups by item_id
+        Index("uq_item_values_item_column", "item_id", "column_id", unique=True),
+        Index("ix_item_values_column_id", "column_id"),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     item_id = Column(Integer, ForeignKey("items.id"))
@@ -86,8 +136,8 @@ class ItemValue(Base):
     item = relationship("BoardItem", back_populates="values")
     column = relationship("BoardColumn", back_populates="values")
 
-# Create tables
-Base.metadata.create_all(bind=engine)
+# Item writes append here; /api/boards/{id}/changes reads it
+change_log = change_log_table(Base.metadata)
 
 # Pydantic models
 class ColumnCreate(BaseModel):
@@ -104,17 +154,34 @@ class CellUpdate(BaseModel):
     column_id: int
     value: str
 
+class CellBatch(BaseModel):
+    updates: List[CellUpdate]
+
+MAX_CELL_BATCH = 5000
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Create tables
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    
+    if PRODUCTION_TEMPLATES:
+        precompile_templates(templates, PRECOMPILED_TEMPLATES)
+    
+    yield
+    
+    await engine.dispose()
+
 # FastAPI app
-app = FastAPI(title="Monday.com Style Board Builder")
-templates = Jinja2Templates(directory="templates")
+app = FastAPI(title="Monday.com Style Board Builder", lifespan=lifespan)
+templates = create_templates()
+# Compiled at startup in production mode; the rest on first use
+PRECOMPILED_TEMPLATES = ('board/dashboard.html', 'board/_rows.html')
 
 # Database dependency
-def get_db():
-    db = SessionLocal()
-    try:
+async def get_db():
+    async with SessionLocal() as db:
         yield db
-    finally:
-        db.close()
 
 # Helper functions
 def get_or_create_sample_board(db: Session):
@@ -194,43 +261,173 @@ def get_or_create_sample_board(db: Session):
     
     return board
 
-@app.get("/", response_class=HTMLResponse)
-async def dashboard(request: Request, db: Session = Depends(get_db)):
-    """Main board dashboard"""
-    board = get_or_create_sample_board(db)
-    
-    # Get columns ordered by order field
+def load_board_grid(db: Session, board_id: int) -> Dict[str, Any]:
+    """Load a board's columns, items and cell values in three queries.
+
+    Values are fetched for the whole board at once and pivoted into each
+    item's ``values`` dict in memory, instead of one query per item.
+    """
     columns = db.query(BoardColumn).filter(
-        BoardColumn.board_id == board.id
+        BoardColumn.board_id == board_id
     ).order_by(BoardColumn.order).all()
-    
-    # Get items with their values
-    items = db.query(BoardItem).filter(
-        BoardItem.board_id == board.id
+
+    item_rows = db.query(
+        BoardItem.id, BoardItem.group_name, BoardItem.created_on
+    ).filter(
+        BoardItem.board_id == board_id
     ).order_by(BoardItem.group_name, BoardItem.order).all()
-    
-    # Build items with values
+
     items_data = []
-    for item in items:
+    items_by_id = {}
+    for item_id, group_name, created_on in item_rows:
         item_dict = {
-            "id": item.id,
-            "group_name": item.group_name,
-            "created_on": item.created_on,
+            "id": item_id,
+            "group_name": group_name,
+            "created_on": created_on,
             "values": {}
         }
-        
-        # Get all values for this item
-        values = db.query(ItemValue).filter(ItemValue.item_id == item.id).all()
-        for value in values:
-            item_dict["values"][value.column_id] = value.value
-        
         items_data.append(item_dict)
-    
+        items_by_id[item_id] = item_dict
+
+    value_rows = db.query(
+        ItemValue.item_id, ItemValue.column_id, ItemValue.value
+    ).join(
+        BoardItem, ItemValue.item_id == BoardItem.id
+    ).filter(BoardItem.board_id == board_id)
+
+    for item_id, column_id, value in value_rows:
+        items_by_id[item_id]["values"][column_id] = value
+
+    return {"columns": columns, "items": items_data}
+
+def load_item_rows(db: Session, board_id: int, group_name: str, offset: int, limit: int) -> List[Dict[str, Any]]:
+    """One group's items in board order, sliced by offset/limit, with their values"""
+    item_rows = db.query(
+        BoardItem.id, BoardItem.group_name, BoardItem.created_on
+    ).filter(
+        BoardItem.board_id == board_id,
+        BoardItem.group_name == group_name
+    ).order_by(BoardItem.order, BoardItem.id).offset(offset).limit(limit).all()
+
+    return attach_item_values(db, item_rows)
+
+def load_items_by_id(db: Session, item_ids: List[int]) -> List[Dict[str, Any]]:
+    """Items with their values for a set of ids; missing ids are left out"""
+    item_rows = db.query(
+        BoardItem.id, BoardItem.group_name, BoardItem.created_on
+    ).filter(BoardItem.id.in_(item_ids)).all()
+
+    return attach_item_values(db, item_rows)
+
+def attach_item_values(db: Session, item_rows) -> List[Dict[str, Any]]:
+    """Build item dicts from (id, group_name, created_on) rows and fill their values in one query"""
+    items_by_id = {
+        item_id: {"id": item_id, "group_name": group, "created_on": created_on, "values": {}}
+        for item_id, group, created_on in item_rows
+    }
+    if items_by_id:
+        value_rows = db.query(
+            ItemValue.item_id, ItemValue.column_id, ItemValue.value
+        ).filter(ItemValue.item_id.in_(list(items_by_id)))
+
+        for item_id, column_id, value in value_rows:
+            items_by_id[item_id]["values"][column_id] = value
+
+    return list(items_by_id.values())
+
+def load_board_columns(db: Session, board_id: int) -> List[BoardColumn]:
+    return db.query(BoardColumn).filter(
+        BoardColumn.board_id == board_id
+    ).order_by(BoardColumn.order).all()
+
+def load_board_window(db: Session, board_id: int, rows_per_group: int, open_groups: int) -> Dict[str, Any]:
+    """Columns, every group header with its item count, and the first rows of the open groups.
+
+    The work done is bounded by rows_per_group * open_groups, so the first
+    paint of a 10k-item board costs about the same as a 100-item one.
+    """
+    group_counts = db.query(
+        BoardItem.group_name, func.count(BoardItem.id)
+    ).filter(
+        BoardItem.board_id == board_id
+    ).group_by(BoardItem.group_name).order_by(BoardItem.group_name).all()
+
+    groups = []
+    for index, (group_name, count) in enumerate(group_counts):
+        collapsed = index >= open_groups
+        items = [] if collapsed else load_item_rows(db, board_id, group_name, 0, rows_per_group)
+        groups.append({"name": group_name, "count": count, "items": items, "collapsed": collapsed})
+
+    return {"columns": load_board_columns(db, board_id), "groups": groups}
+
+def group_items(items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Group load_board_grid items (already sorted by group) for the full render"""
+    groups = []
+    for group_name, rows in groupby(items, key=itemgetter("group_name")):
+        rows = list(rows)
+        groups.append({"name": group_name, "count": len(rows), "items": rows, "collapsed": False})
+    return groups
+
+def serialize_item(item: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        "id": item["id"],
+        "group_name": item["group_name"],
+        "created_on": item["created_on"].isoformat() if item["created_on"] else None,
+        "values": item["values"]
+    }
+
+def bump_board_version(board_ids):
+    """UPDATE boards SET version = version + 1 for a board id or a list of ids"""
+    if isinstance(board_ids, int):
+        condition = Board.id == board_ids
+    else:
+        condition = Board.id.in_(board_ids)
+    return update(Board).where(condition).values(version=Board.version + 1)
+
+async def render_board(request: Request, board: Board, db: AsyncSession):
+    # Polling clients revalidate against the board version before anything is loaded
+    headers = validator_headers(make_etag('board', board.id, board.version, BOARD_WINDOW_ROWS, BOARD_OPEN_GROUPS))
+    if is_not_modified(request, headers['ETag']):
+        return not_modified(headers)
+
+    if BOARD_WINDOW_ROWS > 0:
+        grid = await db.run_sync(load_board_window, board.id, BOARD_WINDOW_ROWS, BOARD_OPEN_GROUPS)
+        groups = grid["groups"]
+    else:
+        grid = await db.run_sync(load_board_grid, board.id)
+        groups = group_items(grid["items"])
+
     return templates.TemplateResponse("board/dashboard.html", {
         "request": request,
         "board": board,
-        "columns": columns,
-        "items": items_data
+        "columns": grid["columns"],
+        "groups": groups
+    }, headers=headers)
+
+@app.get("/", response_class=HTMLResponse)
+async def dashboard(request: Request, db: AsyncSession = Depends(get_db)):
+    """Main board dashboard"""
+    board = await db.run_sync(get_or_create_sample_board)
+    return await render_board(request, board, db)
+
+@app.get("/api/boards/{board_id}")
+async def api_get_board(board_id: int, db: AsyncSession = Depends(get_db)):
+    """Board grid as JSON, served from the same loader as the HTML page"""
+    board = await db.get(Board, board_id)
+    if not board:
+        raise HTTPException(status_code=404, detail="Board not found")
+
+    grid = await db.run_sync(load_board_grid, board.id)
+    return JSONResponse({
+        "id": board.id,
+        "name": board.name,
+        "columns": [{
+            "id": column.id,
+            "name": column.name,
+            "type": column.type,
+            "order": column.order
+        } for column in grid["columns"]],
+        "items": [serialize_item(item) for item in grid["items"]]
     })
 
 @app.post("/add_column")
@@ -238,13 +435,13 @@ async def add_column(
     board_id: int = Form(...),
     name: str = Form(...),
     type: ColumnType = Form(...),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """Add a new column to the board"""
     # Get max order
-    max_order = db.query(BoardColumn).filter(
-        BoardColumn.board_id == board_id
-    ).count()
+    max_order = await db.scalar(
+        select(func.count(BoardColumn.id)).where(BoardColumn.board_id == board_id)
+    )
     
     column = BoardColumn(
         board_id=board_id,
@@ -253,20 +450,23 @@ async def add_column(
         order=max_order + 1
     )
     db.add(column)
-    db.commit()
-    db.refresh(column)
+    await db.flush()
     
-    # Add empty values for existing items
-    items = db.query(BoardItem).filter(BoardItem.board_id == board_id).all()
-    for item in items:
-        item_value = ItemValue(
-            item_id=item.id,
-            column_id=column.id,
-            value=""
+    # Backfill empty values for existing items in one INSERT ... SELECT
+    if not SPARSE_CELLS:
+        await db.execute(
+            insert(ItemValue).from_select(
+                ["item_id", "column_id", "value"],
+                select(BoardItem.id, literal(column.id), literal("")).where(
+                    BoardItem.board_id == board_id
+                )
+            )
         )
-        db.add(item_value)
     
-    db.commit()
+    await db.execute(bump_board_version(board_id))
+    # No item changes with sparse cells, so the column itself goes in the feed
+    await db.run_sync(record_change, change_log, 'column', [column.id], board_id)
+    await db.commit()
     
     return JSONResponse({
         "success": True,
@@ -282,14 +482,16 @@ async def add_column(
 async def add_item(
     board_id: int = Form(...),
     group_name: str = Form("Main Group"),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """Add a new item (row) to the board"""
     # Get max order for this group
-    max_order = db.query(BoardItem).filter(
-        BoardItem.board_id == board_id,
-        BoardItem.group_name == group_name
-    ).count()
+    max_order = await db.scalar(
+        select(func.count(BoardItem.id)).where(
+            BoardItem.board_id == board_id,
+            BoardItem.group_name == group_name
+        )
+    )
     
     item = BoardItem(
         board_id=board_id,
@@ -297,21 +499,23 @@ async def add_item(
         order=max_order + 1
     )
     db.add(item)
-    db.commit()
-    db.refresh(item)
+    await db.flush()
     
-    # Create empty values for all columns
-    columns = db.query(BoardColumn).filter(BoardColumn.board_id == board_id).all()
-    for column in columns:
-        default_value = "New Item" if column.name == "Item" else ""
-        item_value = ItemValue(
-            item_id=item.id,
-            column_id=column.id,
-            value=default_value
-        )
-        db.add(item_value)
+    # Create default values for all columns
+    columns = await db.scalars(select(BoardColumn).where(BoardColumn.board_id == board_id))
+    values = [{
+        "item_id": item.id,
+        "column_id": column.id,
+        "value": "New Item" if column.name == "Item" else ""
+    } for column in columns]
+    if SPARSE_CELLS:
+        values = [value for value in values if value["value"]]
+    if values:
+        await db.execute(insert(ItemValue), values)
     
-    db.commit()
+    await db.execute(bump_board_version(board_id))
+    await db.run_sync(record_change, change_log, 'item', [item.id], board_id)
+    await db.commit()
     
     return JSONResponse({
         "success": True,
@@ -319,42 +523,162 @@ async def add_item(
         "redirect": "/"
     })
 
+def upsert_cells(dialect_name: str):
+    """INSERT ... ON CONFLICT (item_id, column_id) DO UPDATE for item values"""
+    dialect_insert = pg_insert if dialect_name == 'postgresql' else sqlite_insert
+    stmt = dialect_insert(ItemValue)
+    return stmt.on_conflict_do_update(
+        index_elements=[ItemValue.item_id, ItemValue.column_id],
+        set_={"value": stmt.excluded.value}
+    )
+
 @app.post("/update_cell")
 async def update_cell(
     item_id: int = Form(...),
     column_id: int = Form(...),
     value: str = Form(...),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """Update a cell value"""
-    # Find existing value or create new one
-    item_value = db.query(ItemValue).filter(
-        ItemValue.item_id == item_id,
-        ItemValue.column_id == column_id
-    ).first()
+    await db.execute(
+        upsert_cells(engine.dialect.name),
+        {"item_id": item_id, "column_id": column_id, "value": value}
+    )
+    board_id = await db.scalar(select(BoardItem.board_id).where(BoardItem.id == item_id))
+    if board_id is not None:
+        await db.execute(bump_board_version(board_id))
+        await db.run_sync(record_change, change_log, 'item', [item_id], board_id)
+    await db.commit()
     
-    if item_value:
-        item_value.value = value
-    else:
-        item_value = ItemValue(
-            item_id=item_id,
-            column_id=column_id,
-            value=value
+    return JSONResponse({"success": True})
+
+@app.post("/api/cells/batch")
+async def update_cells(batch: CellBatch, db: AsyncSession = Depends(get_db)):
+    """Apply many cell edits (e.g. a block pasted from Excel) in one transaction"""
+    if len(batch.updates) > MAX_CELL_BATCH:
+        raise HTTPException(status_code=413, detail=f"At most {MAX_CELL_BATCH} cells per batch")
+    
+    # A cell may only be touched once per statement; the last edit wins
+    cells = {}
+    for cell in batch.updates:
+        cells[(cell.item_id, cell.column_id)] = cell.value
+    
+    if cells:
+        await db.execute(upsert_cells(engine.dialect.name), [
+            {"item_id": item_id, "column_id": column_id, "value": value}
+            for (item_id, column_id), value in cells.items()
+        ])
+        items_by_board = {}
+        item_rows = await db.execute(
+            select(BoardItem.id, BoardItem.board_id).where(BoardItem.id.in_({item_id for item_id, _ in cells}))
         )
-        db.add(item_value)
+        for item_id, board_id in item_rows:
+            items_by_board.setdefault(board_id, []).append(item_id)
+        
+        if items_by_board:
+            await db.execute(bump_board_version(list(items_by_board)))
+        for board_id, item_ids in items_by_board.items():
+            await db.run_sync(record_change, change_log, 'item', item_ids, board_id)
+        await db.commit()
     
-    db.commit()
+    return JSONResponse({"success": True, "updated": len(cells)})
+
+@app.get("/api/boards/{board_id}/changes")
+async def api_board_changes(board_id: int, since: int = 0, limit: int = 100, db: AsyncSession = Depends(get_db)):
+    """Items added or edited after sequence number ``since``, with all their values
+
+    Columns added in the same span are listed under ``columns``. A board has
+    few columns, so they are not paged; when items are, a column newer than
+    ``next_since`` is simply listed again on the next page.
+    """
+    limit = min(max(limit, 1), MAX_FRAGMENT_ROWS)
+    rows = (await db.execute(changed_since(change_log, 'item', since, limit + 1, scope_id=board_id))).all()
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+    seqs = {entity_id: seq for entity_id, seq in rows}
     
-    return JSONResponse({"success": True})
+    items = await db.run_sync(load_items_by_id, list(seqs)) if seqs else []
+    items.sort(key=lambda item: seqs[item["id"]])
+    found = {item["id"] for item in items}
+    
+    column_rows = (await db.execute(
+        changed_since(change_log, 'column', since, MAX_FRAGMENT_ROWS, scope_id=board_id)
+    )).all()
+    columns = []
+    if column_rows:
+        columns = (await db.scalars(
+            select(BoardColumn).where(BoardColumn.id.in_([column_id for column_id, _ in column_rows]))
+            .order_by(BoardColumn.order)
+        )).all()
+    
+    next_since = rows[-1].last_seq if rows else since
+    if not has_more and column_rows:
+        next_since = max(next_since, column_rows[-1].last_seq)
+    
+    return JSONResponse({
+        "board_id": board_id,
+        "changes": [serialize_item(item) for item in items],
+        "columns": [{
+            "id": column.id,
+            "name": column.name,
+            "type": column.type,
+            "order": column.order
+        } for column in columns],
+        "deleted": [item_id for item_id in seqs if item_id not in found],
+        "next_since": next_since,
+        "has_more": has_more
+    })
 
 @app.get("/board/{board_id}", response_class=HTMLResponse)
-async def view_board(request: Request, board_id: int, db: Session = Depends(get_db)):
+async def view_board(request: Request, board_id: int, db: AsyncSession = Depends(get_db)):
     """View specific board"""
-    board = db.query(Board).filter(Board.id == board_id).first()
+    board = await db.get(Board, board_id)
     if not board:
         raise HTTPException(status_code=404, detail="Board not found")
     
-    return await dashboard(request, db)
+    return await render_board(request, board, db)
+
+@app.get("/board/{board_id}/rows")
+async def board_rows(
+    request: Request,
+    board_id: int,
+    group: str,
+    offset: int = 0,
+    limit: int = 50,
+    format: str = "html",
+    db: AsyncSession = Depends(get_db)
+):
+    """A range of one group's rows, as table-row HTML or JSON, for windowed boards"""
+    board = await db.get(Board, board_id)
+    if not board:
+        raise HTTPException(status_code=404, detail="Board not found")
+
+    offset = max(offset, 0)
+    limit = min(max(limit, 1), MAX_FRAGMENT_ROWS)
+
+    def load(sync_db: Session):
+        # One extra row tells us whether there is another range after this one
+        items = load_item_rows(sync_db, board_id, group, offset, limit + 1)
+        return load_board_columns(sync_db, board_id), items
+
+    columns, items = await db.run_sync(load)
+    next_offset = offset + limit if len(items) > limit else None
+    items = items[:limit]
+
+    if format == "json":
+        return JSONResponse({
+            "group": group,
+            "offset": offset,
+            "next_offset": next_offset,
+            "items": [serialize_item(item) for item in items]
+        })
+
+    return templates.TemplateResponse("board/_rows.html", {
+        "request": request,
+        "columns": columns,
+        "items": items,
+        "next_offset": next_offset
+    })
 
 if __name__ == "__main__":
     uvicorn.run("board_app:app", host="0.0.0.0", port=3000, reload=False)
\ No newline at end of file
@@ -0,0 +1,61 @@
+"""
+Coalescing broadcaster for real-time project updates
+Buffers field changes for a short window and emits one batched frame per room
+"""
+
+import asyncio
+from typing import Any, Dict, Optional, Tuple
+
+COALESCE_WINDOW = 0.05  # seconds
+
+class UpdateBroadcaster:
+    """Merges project field changes into batched ``cells_updated`` frames.
+
+    Changes published within ``window`` seconds of each other are held back.
+    Changes to the same project by the same user merge into one delta that
+    keeps the latest value per field. Each room then gets a single frame:
+    ``{"updates": [{"project_id", "fields", "updated_by"}, ...]}``.
+    """
+
+    def __init__(self, sio, event: str = 'cells_updated', window: float = COALESCE_WINDOW):
+        self.sio = sio
+        self.event = event
+        self.window = window
+        self._pending: Dict[str, Dict[Tuple[int, str], Dict[str, Any]]] = {}
+        self._flush_task: Optional[asyncio.Task] = None
+        self.published = 0
+        self.frames_sent = 0
+
+    def publish(self, room: str, project_id: int, fields: Dict[str, Any], updated_by: str):
+        if not fields:
+            return
+
+        self.published += 1
+        room_updates = self._pending.setdefault(room, {})
+        update = room_updates.setdefault((project_id, updated_by), {
+            'project_id': project_id,
+            'fields': {},
+            'updated_by': updated_by
+        })
+        update['fields'].update(fields)
+
+        if self._flush_task is None:
+            self._flush_task = asyncio.get_running_loop().create_task(self._flush_later())
+
+    async def _flush_later(self):
+        await asyncio.sleep(self.window)
+        await self.flush()
+
+    async def flush(self):
+        pending, self._pending = self._pending, {}
+        self._flush_task = None
+
+        for room, updates in pending.items():
+            await self.sio.emit(self.event, {'updates': list(updates.values())}, room=room)
+            self.frames_sent += 1
+
+    async def close(self):
+        """Cancel the pending timer and send whatever is buffered"""
+        if self._flush_task is not None:
+            self._flush_task.cancel()
+        await self.flush()
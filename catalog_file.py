@@ -0,0 +1,179 @@
+"""
+Compiled price catalog file
+Packs the V300 size grids into a fixed binary layout that workers mmap instead of parsing
+"""
+
+import mmap
+import os
+import struct
+import sys
+from array import array
+
+from pricing import CATALOG_PATH, PriceCatalog, PricingError, SizeGrid, load_catalog
+
+COMPILED_CATALOG_PATH = os.getenv('PRICING_CATALOG_BIN', os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), 'catalog', 'v300.bin'
+))
+
+MAGIC = b'WDPRICE\x00'
+FORMAT_VERSION = 1
+
+# Layout, all little-endian, every section 8-byte aligned:
+#   header      magic, format version, window type count, catalog version, series
+#   directory   one entry per window type: key, display name, counts and the
+#               byte offsets of its sections
+#   sections    widths f64[W], starts i64[W + 1], heights f64[N],
+#               base prices f64[N], prices f64[N * tiers], codes char[8][N]
+HEADER = struct.Struct('<8sHH4x16s64s')
+ENTRY = struct.Struct('<32s64sIIH6x6Q')
+CODE_SIZE = 8
+
+class SizeCodes:
+    """Fixed-width size codes read from the mapped file, decoded on first use"""
+
+    __slots__ = ('_raw', '_decoded')
+
+    def __init__(self, raw: memoryview):
+        self._raw = raw
+        self._decoded = [None] * (len(raw) // CODE_SIZE)
+
+    def __len__(self):
+        return len(self._decoded)
+
+    def __getitem__(self, index: int) -> str:
+        code = self._decoded[index]
+        if code is None:
+            start = index * CODE_SIZE
+            code = self._raw[start:start + CODE_SIZE].tobytes().rstrip(b'\x00').decode('ascii')
+            self._decoded[index] = code
+        return code
+
+def _text(value: bytes) -> str:
+    return value.rstrip(b'\x00').decode('utf-8')
+
+def _align(offset: int) -> int:
+    return (offset + 7) & ~7
+
+def _little_endian(values: array) -> bytes:
+    if sys.byteorder != 'little':
+        values = array(values.typecode, values)
+        values.byteswap()
+    return values.tobytes()
+
+def compile_catalog(catalog: PriceCatalog, path: str = COMPILED_CATALOG_PATH):
+    """Write ``catalog`` to ``path``, replacing any existing file atomically"""
+    grids = list(catalog.grids.values())
+    sections = []
+    offset = _align(HEADER.size + ENTRY.size * len(grids))
+    entries = []
+    for grid in grids:
+        codes = b''.join(code.encode('ascii')[:CODE_SIZE].ljust(CODE_SIZE, b'\x00') for code in grid.codes)
+        parts = [
+            _little_endian(array('d', grid.widths)),
+            _little_endian(array('q', grid.starts)),
+            _little_endian(array('d', grid.heights)),
+            _little_endian(array('d', grid.base_prices)),
+            _little_endian(array('d', grid.prices)),
+            codes
+        ]
+        offsets = []
+        for part in parts:
+            offsets.append(offset)
+            sections.append((offset, part))
+            offset = _align(offset + len(part))
+        entries.append(ENTRY.pack(
+            grid.window_type.encode('utf-8'), grid.display_name.encode('utf-8'),
+            len(grid), len(grid.widths), grid.tiers, *offsets
+        ))
+
+    buffer = bytearray(offset)
+    HEADER.pack_into(buffer, 0, MAGIC, FORMAT_VERSION, len(grids),
+                     catalog.version.encode('ascii'), catalog.series.encode('utf-8'))
+    for index, entry in enumerate(entries):
+        buffer[HEADER.size + ENTRY.size * index:HEADER.size + ENTRY.size * (index + 1)] = entry
+    for start, part in sections:
+        buffer[start:start + len(part)] = part
+
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    temp_path = f'{path}.tmp{os.getpid()}'
+    with open(temp_path, 'wb') as f:
+        f.write(buffer)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(temp_path, path)
+
+def _view(mapped: memoryview, fmt: str, offset: int, count: int):
+    size = struct.calcsize(fmt) * count
+    if sys.byteorder != 'little':
+        values = array(fmt, mapped[offset:offset + size].tobytes())
+        values.byteswap()
+        return values
+    return mapped[offset:offset + size].cast(fmt)
+
+def _section_end(path: str, mapped: memoryview, offset: int, size: int) -> int:
+    if offset % 8 or offset + size > len(mapped):
+        raise PricingError(f'{path} is truncated or corrupt: section at {offset} overruns {len(mapped)} bytes')
+    return _align(offset + size)
+
+def open_catalog(path: str = COMPILED_CATALOG_PATH) -> PriceCatalog:
+    """Map a compiled catalog; the grids read their arrays from the page cache
+
+    Nothing is copied or parsed beyond the header and directory, so every
+    worker that opens the same file shares one copy of it in memory. The map
+    stays open for as long as any grid of the catalog is referenced.
+
+    Every section is checked against the file size and the file must end
+    where its last section does, so a truncated or partly copied file raises
+    PricingError instead of loading.
+    """
+    with open(path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size < HEADER.size:
+            raise PricingError(f'{path} is not a compiled price catalog (format {FORMAT_VERSION})')
+        mapped = memoryview(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+
+    magic, format_version, count, version, series = HEADER.unpack_from(mapped, 0)
+    if magic != MAGIC or format_version != FORMAT_VERSION:
+        raise PricingError(f'{path} is not a compiled price catalog (format {FORMAT_VERSION})')
+
+    end = _section_end(path, mapped, 0, HEADER.size + ENTRY.size * count)
+    grids = {}
+    try:
+        for index in range(count):
+            key, display_name, sizes, columns, tiers, *offsets = ENTRY.unpack_from(
+                mapped, HEADER.size + ENTRY.size * index
+            )
+            widths, starts, heights, base_prices, prices, codes = offsets
+            for offset, size in ((widths, 8 * columns), (starts, 8 * (columns + 1)), (heights, 8 * sizes),
+                                 (base_prices, 8 * sizes), (prices, 8 * sizes * tiers), (codes, CODE_SIZE * sizes)):
+                end = max(end, _section_end(path, mapped, offset, size))
+
+            start_view = _view(mapped, 'q', starts, columns + 1)
+            if start_view[0] != 0 or start_view[-1] != sizes or any(
+                    start_view[column] >= start_view[column + 1] for column in range(columns)):
+                raise PricingError(f'{path} is corrupt: size offsets of entry {index} are out of order')
+
+            key = _text(key)
+            grids[key] = SizeGrid(
+                key, _text(display_name),
+                _view(mapped, 'd', widths, columns),
+                start_view,
+                _view(mapped, 'd', heights, sizes),
+                _view(mapped, 'd', base_prices, sizes),
+                _view(mapped, 'd', prices, sizes * tiers),
+                tiers,
+                SizeCodes(mapped[codes:codes + CODE_SIZE * sizes])
+            )
+        series, version = _text(series), _text(version)
+    except UnicodeDecodeError:
+        raise PricingError(f'{path} is corrupt: names are not valid UTF-8') from None
+
+    if end != len(mapped):
+        raise PricingError(f'{path} is {len(mapped)} bytes; its sections end at {end}')
+    return PriceCatalog(grids, series, version)
+
+if __name__ == '__main__':
+    if len(sys.argv) > 3 or sys.argv[1:2] != ['compile']:
+        sys.exit('usage: python catalog_file.py compile [/path/to/output.bin]')
+    destination = sys.argv[2] if len(sys.argv) == 3 else COMPILED_CATALOG_PATH
+    compile_catalog(load_catalog(CATALOG_PATH), destination)
+    print(f'compiled {CATALOG_PATH} -> {destination}')
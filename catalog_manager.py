@@ -0,0 +1,127 @@
+"""
+Hot-reloadable price catalog
+Watches the compiled catalog file and swaps in new immutable snapshots without a restart
+"""
+
+import asyncio
+import logging
+import os
+import struct
+import threading
+import time
+import weakref
+from typing import Dict, Optional, Tuple
+
+from catalog_file import COMPILED_CATALOG_PATH, open_catalog
+from pricing import CATALOG_PATH, PriceCatalog, load_catalog
+
+CATALOG_POLL_INTERVAL = float(os.getenv('CATALOG_POLL_INTERVAL', '5'))  # seconds
+
+logger = logging.getLogger(__name__)
+
+FileSignature = Tuple[int, int, int]
+
+class CatalogManager:
+    """Hands out the current catalog snapshot and replaces it when the file changes
+
+    A snapshot is never modified. Handlers call ``current()`` once and price
+    the whole request with that object, so a reload in the middle of a
+    request cannot mix two price sheets, and swapping is a single attribute
+    assignment that never waits on readers.
+
+    The manager only keeps a strong reference to the newest snapshot. Older
+    ones live exactly as long as some in-flight request still holds them;
+    when the last reference goes, the snapshot and its mmap are released.
+    ``snapshots()`` reports which versions are still alive.
+
+    Until a compiled file exists the JSON extract is served, and building the
+    compiled file later is picked up like any other change.
+    """
+
+    def __init__(self, path: str = COMPILED_CATALOG_PATH, fallback_path: str = CATALOG_PATH):
+        self.path = path
+        self.fallback_path = fallback_path
+        self.reloads = 0
+        self.failed_reloads = 0
+        self.loaded_at: Optional[float] = None
+        self._current: Optional[PriceCatalog] = None
+        self._signature: Optional[FileSignature] = None
+        self._live: 'weakref.WeakValueDictionary[str, PriceCatalog]' = weakref.WeakValueDictionary()
+        self._lock = threading.Lock()
+
+    def current(self) -> PriceCatalog:
+        catalog = self._current
+        if catalog is None:
+            self.reload_if_changed()
+            catalog = self._current
+        return catalog
+
+    def _stat(self) -> Optional[FileSignature]:
+        try:
+            stat = os.stat(self.path)
+        except FileNotFoundError:
+            return None
+        # compile_catalog replaces the file, so a new inode marks a new build
+        return stat.st_ino, stat.st_size, stat.st_mtime_ns
+
+    def reload_if_changed(self) -> bool:
+        """Load the file if it changed since the last check; True if a new snapshot was swapped in
+
+        A file that fails to load is logged and skipped until it changes
+        again; the previous snapshot keeps serving. With no snapshot yet the
+        error is raised.
+        """
+        signature = self._stat()
+        if self._current is not None and signature == self._signature:
+            return False
+
+        with self._lock:
+            if self._current is not None and signature == self._signature:
+                return False
+            try:
+                catalog = open_catalog(self.path) if signature else load_catalog(self.fallback_path)
+            except (OSError, ValueError, struct.error):
+                if self._current is None:
+                    raise
+                self._signature = signature
+                self.failed_reloads += 1
+                logger.exception('Keeping catalog %s; could not load %s', self._current.version, self.path)
+                return False
+            self._signature = signature
+            return self.swap(catalog)
+
+    def swap(self, catalog: PriceCatalog) -> bool:
+        """Make ``catalog`` the current snapshot unless it has the same version"""
+        current = self._current
+        if current is not None and current.version == catalog.version:
+            return False
+        self._live[catalog.version] = catalog
+        self._current = catalog
+        self.loaded_at = time.time()
+        if current is not None:
+            self.reloads += 1
+            logger.info('Price catalog %s replaced %s', catalog.version, current.version)
+        return True
+
+    def snapshots(self):
+        """Versions of every snapshot still referenced somewhere, current one included"""
+        return sorted(self._live.keys())
+
+    async def watch(self, interval: float = CATALOG_POLL_INTERVAL):
+        """Poll for changes until cancelled; no error stops the polling"""
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                self.reload_if_changed()
+            except Exception:
+                self.failed_reloads += 1
+                logger.exception('Catalog reload from %s failed', self.path)
+
+    def metrics(self) -> Dict[str, object]:
+        return {
+            'version': self._current.version if self._current else None,
+            'loaded_at': self.loaded_at,
+            'reloads': self.reloads,
+            'failed_reloads': self.failed_reloads,
+            'live_snapshots': self.snapshots()
+        }
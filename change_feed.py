@@ -0,0 +1,60 @@
+"""
+Change sequence feed
+An append-only log of which rows changed, so clients can catch up in O(changes)
+"""
+
+from datetime import datetime
+from typing import Iterable, Optional
+
+from sqlalchemy import Column, DateTime, Index, Integer, MetaData, String, Table, func, insert, select, text
+
+# Any fixed 64-bit key; held until commit so sequence order matches commit order
+CHANGE_LOCK_KEY = 0x6368616e6765
+
+def change_log_table(metadata: MetaData) -> Table:
+    """The change_log table, attached to an app's metadata
+
+    ``entity`` names what changed ("project", "item"), ``entity_id`` its
+    primary key and ``scope_id`` the container it belongs to (the board for
+    items, NULL for projects).
+    """
+    return Table(
+        'change_log', metadata,
+        Column('seq', Integer, primary_key=True, autoincrement=True),
+        Column('entity', String(20), nullable=False),
+        Column('entity_id', Integer, nullable=False),
+        Column('scope_id', Integer),
+        Column('changed_at', DateTime, default=datetime.utcnow),
+        Index('ix_change_log_entity_scope_seq', 'entity', 'scope_id', 'seq'),
+    )
+
+def record_change(session, table: Table, entity: str, entity_ids: Iterable[int], scope_id: Optional[int] = None):
+    """Append change entries in the caller's transaction; call right before commit
+
+    Sequence values are handed out when rows are inserted but become visible
+    at commit, so on PostgreSQL two writers could commit out of order and a
+    reader could skip the lower one. A transaction-level advisory lock makes
+    writers append to the log one at a time until they commit.
+    """
+    rows = [{'entity': entity, 'entity_id': entity_id, 'scope_id': scope_id} for entity_id in entity_ids]
+    if not rows:
+        return
+
+    if session.get_bind().dialect.name == 'postgresql':
+        session.execute(text('SELECT pg_advisory_xact_lock(:key)'), {'key': CHANGE_LOCK_KEY})
+    session.execute(insert(table), rows)
+
+def changed_since(table: Table, entity: str, since: int, limit: int, scope_id: Optional[int] = None):
+    """(entity_id, last_seq) of rows changed after ``since``, oldest change first
+
+    A row edited several times appears once, at its latest sequence number.
+    """
+    last_seq = func.max(table.c.seq).label('last_seq')
+    return select(table.c.entity_id, last_seq).where(
+        table.c.entity == entity,
+        table.c.scope_id == scope_id,
+        table.c.seq > since
+    ).group_by(table.c.entity_id).order_by(last_seq).limit(limit)
+
+def latest_seq(table: Table):
+    return select(func.coalesce(func.max(table.c.seq), 0)).scalar_subquery()
@@ -0,0 +1,65 @@
+"""
+In-process project status counts for the dashboard
+Loaded with one grouped query, adjusted on writes and periodically reconciled
+"""
+
+import threading
+import time
+from typing import Dict, Iterable, Optional, Tuple
+
+from sqlalchemy import func, select
+
+ACTIVE_STATUSES = ('in progress', 'scheduled')
+RECONCILE_INTERVAL = 300  # seconds
+
+def status_count_query(model):
+    return select(model.status, func.count(model.id)).group_by(model.status)
+
+class StatusCounts:
+    """Per-status project counts shared by every request in this process.
+
+    Writes call ``adjust`` so the dashboard stays current without a query.
+    The counts are reloaded from the database every ``reconcile_interval``
+    seconds, which corrects drift from other workers or out-of-band writes.
+    """
+
+    def __init__(self, reconcile_interval: float = RECONCILE_INTERVAL):
+        self.reconcile_interval = reconcile_interval
+        self._counts: Optional[Dict[str, int]] = None
+        self._loaded_at = 0.0
+        self._lock = threading.Lock()
+
+    def is_stale(self) -> bool:
+        return self._counts is None or time.monotonic() - self._loaded_at > self.reconcile_interval
+
+    def load(self, rows: Iterable[Tuple[Optional[str], int]]):
+        counts = {status: count for status, count in rows}
+        with self._lock:
+            self._counts = counts
+            self._loaded_at = time.monotonic()
+
+    def invalidate(self):
+        with self._lock:
+            self._counts = None
+
+    def adjust(self, old_status: Optional[str], new_status: Optional[str]):
+        """Move one project between statuses; pass None for a create or delete"""
+        if old_status == new_status:
+            return
+        with self._lock:
+            if self._counts is None:
+                return
+            if old_status is not None:
+                self._counts[old_status] = self._counts.get(old_status, 0) - 1
+            if new_status is not None:
+                self._counts[new_status] = self._counts.get(new_status, 0) + 1
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            counts = dict(self._counts or {})
+        return {
+            'total_projects': sum(counts.values()),
+            'active_projects': sum(counts.get(status, 0) for status in ACTIVE_STATUSES),
+            'completed_projects': counts.get('complete', 0),
+            'new_leads': counts.get('new lead', 0)
+        }
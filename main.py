@@ -5,23 +5,39 @@ Modern async Python solution with real-time collaboration
 
 import os
 import asyncio
+import logging
 from datetime import datetime, timedelta
-from typing import List, Optional, Dict, Any
+from typing import Annotated, List, Optional, Dict, Any
 from contextlib import asynccontextmanager
 
 import uvicorn
 from fastapi import FastAPI, Request, Depends, HTTPException, Form, status
-from fastapi.responses import HTMLResponse, RedirectResponse
-from fastapi.templating import Jinja2Templates
+from fastapi.responses import HTMLResponse, RedirectResponse, StreamingResponse
 from fastapi.staticfiles import StaticFiles
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
-from sqlalchemy import String, Integer, Text, DateTime, Date, select, update, delete, func
+from sqlalchemy import String, Integer, Float, Text, DateTime, Date, Index, JSON, ForeignKey, select, update, delete, func
 from passlib.context import CryptContext
 from jose import JWTError, jwt
 import socketio
 from pydantic import BaseModel, Field, EmailStr
 
+from pagination import DEFAULT_PAGE_SIZE, clamp_page_size, decode_cursor, encode_cursor, keyset_before, requested_page_size
+from search import SEARCH_PAGE_SIZE, apply_search, install_search_index
+from dashboard_stats import StatusCounts, status_count_query
+from auth_executor import AuthExecutor, AuthPoolBusy
+from broadcast import UpdateBroadcaster
+from rooms import LOBBY_ROOM, project_room, subscription_rooms
+from socket_managers import create_client_manager
+from presence import HEARTBEAT_INTERVAL, PresenceRegistry
+from template_cache import PRODUCTION_TEMPLATES, create_templates, precompile_templates
+from http_cache import is_not_modified, make_etag, not_modified, validator_headers
+from change_feed import change_log_table, changed_since, latest_seq, record_change
+from serialization import PROJECT_UPDATE_FIELDS, FastJSONResponse, dumps, project_columns, project_dicts
+from pricing import MAX_BATCH_LINES, PricingError
+from catalog_manager import CatalogManager
+from principal_cache import PRINCIPAL_CACHE_SIZE, PRINCIPAL_TTL, TOKEN_CACHE_SIZE, Principal, TTLCache, watch_user_changes
+
 # Load environment variables
 # Fix database URL for async driver and remove SSL mode for local development
 db_url = os.getenv('DATABASE_URL', 'postgresql://localhost/project_manager')
@@ -56,6 +72,10 @@ class User(Base):
 
 class Project(Base):
     __tablename__ = 'projects'
+    __table_args__ = (
+        Index('ix_projects_updated_at_id', 'updated_at', 'id'),
+        Index('ix_projects_status_updated_at', 'status', 'updated_at'),
+    )
     
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
     name: Mapped[str] = mapped_column(String(255), nullable=False)
@@ -69,6 +89,23 @@ class Project(Base):
     created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
     updated_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
+class ProjectQuote(Base):
+    """A priced batch of openings saved against a project"""
+    __tablename__ = 'project_quotes'
+    
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    project_id: Mapped[int] = mapped_column(Integer, ForeignKey('projects.id'), nullable=False, index=True)
+    catalog_version: Mapped[str] = mapped_column(String(40), nullable=False)
+    line_count: Mapped[int] = mapped_column(Integer, nullable=False)
+    total: Mapped[float] = mapped_column(Float, nullable=False)
+    # Request and priced arrays in columns, as returned by /api/quotes/batch
+    lines: Mapped[Dict[str, Any]] = mapped_column(JSON, nullable=False)
+    created_by: Mapped[Optional[str]] = mapped_column(String(80))
+    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+
+# Every project write appends here; /api/projects/changes reads it
+change_log = change_log_table(Base.metadata)
+
 # Pydantic models
 class UserCreate(BaseModel):
     username: str = Field(..., min_length=3, max_length=20)
@@ -102,6 +139,25 @@ class ProjectUpdate(BaseModel):
     start_date: Optional[datetime] = None
     end_date: Optional[datetime] = None
 
+class QuoteLineRequest(BaseModel):
+    window_type: str
+    width: float = Field(..., gt=0)
+    height: float = Field(..., gt=0)
+    configuration: int = Field(0, ge=0)
+    quantity: int = Field(1, ge=1)
+
+class QuoteRequest(BaseModel):
+    lines: List[QuoteLineRequest] = Field(..., min_length=1)
+
+class BatchQuoteRequest(BaseModel):
+    """Parallel arrays, one position per opening"""
+    window_types: List[str] = Field(..., min_length=1, max_length=MAX_BATCH_LINES)
+    widths: List[Annotated[float, Field(gt=0)]] = Field(..., max_length=MAX_BATCH_LINES)
+    heights: List[Annotated[float, Field(gt=0)]] = Field(..., max_length=MAX_BATCH_LINES)
+    configurations: Optional[List[Annotated[int, Field(ge=0)]]] = Field(None, max_length=MAX_BATCH_LINES)
+    quantities: Optional[List[Annotated[int, Field(ge=1)]]] = Field(None, max_length=MAX_BATCH_LINES)
+    project_id: Optional[int] = None
+
 # Password hashing
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
@@ -111,6 +167,9 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
 def get_password_hash(password: str) -> str:
     return pwd_context.hash(password)
 
+# bcrypt takes ~250ms per call, so it runs on a bounded pool, never the event loop
+auth_executor = AuthExecutor()
+
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
     to_encode = data.copy()
     if expires_delta:
@@ -125,6 +184,12 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
 engine = create_async_engine(DATABASE_URL, echo=True)
 async_session = async_sessionmaker(engine, expire_on_commit=False)
 
+# Price catalog snapshots, swapped in when a new compiled catalog is deployed
+catalog_manager = CatalogManager()
+
+# Dashboard status counts, kept current by the project write handlers
+status_counts = StatusCounts()
+
 async def get_db():
     async with async_session() as session:
         yield session
@@ -134,6 +199,7 @@ async def lifespan(app: FastAPI):
     # Create tables
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
+        await conn.run_sync(install_search_index)
     
     # Create admin user
     async with async_session() as session:
@@ -144,7 +210,7 @@ async def lifespan(app: FastAPI):
             admin = User(
                 username='ADMIN',
                 email='admin@windowsanddoors.com',
-                password_hash=get_password_hash('TEST'),
+                password_hash=await auth_executor.run(get_password_hash, 'TEST'),
                 role='admin',
                 first_name='Admin',
                 last_name='User'
@@ -152,7 +218,21 @@ async def lifespan(app: FastAPI):
             session.add(admin)
             await session.commit()
     
+    if PRODUCTION_TEMPLATES:
+        precompile_templates(templates, PRECOMPILED_TEMPLATES)
+    
+    # Load the price catalog now rather than on the first quote
+    catalog_manager.current()
+    
+    lock_sweeper = asyncio.create_task(expire_editing_locks())
+    catalog_watcher = asyncio.create_task(catalog_manager.watch())
+    
     yield
+    
+    lock_sweeper.cancel()
+    catalog_watcher.cancel()
+    await broadcaster.close()
+    auth_executor.shutdown()
 
 # FastAPI app
 app = FastAPI(
@@ -162,12 +242,32 @@ app = FastAPI(
     lifespan=lifespan
 )
 
-# Socket.IO server
-sio = socketio.AsyncServer(async_mode='asgi', cors_allowed_origins='*')
+# Socket.IO server; SOCKETIO_MESSAGE_QUEUE shares rooms and emits across workers
+SOCKETIO_MESSAGE_QUEUE = os.getenv('SOCKETIO_MESSAGE_QUEUE')
+sio = socketio.AsyncServer(
+    async_mode='asgi',
+    cors_allowed_origins='*',
+    client_manager=create_client_manager(SOCKETIO_MESSAGE_QUEUE)
+)
 socket_app = socketio.ASGIApp(sio, app)
 
+# Batches project edits into one cells_updated frame per project room every 50ms
+broadcaster = UpdateBroadcaster(sio)
+
+# Who is editing which project cell; entries lapse without a heartbeat.
+# The registry is per process: the message queue relays the lock events but
+# not the lock table, so workers cannot see each other's locks.
+presence = PresenceRegistry()
+if SOCKETIO_MESSAGE_QUEUE and not SOCKETIO_MESSAGE_QUEUE.startswith('memory:'):
+    logging.getLogger(__name__).warning(
+        'SOCKETIO_MESSAGE_QUEUE is set but editing locks are per worker: users on different '
+        'workers can hold the same cell, and /api/presence lists only this worker\'s locks'
+    )
+
 # Templates and static files
-templates = Jinja2Templates(directory="templates")
+templates = create_templates()
+# Compiled at startup in production mode; the rest on first use
+PRECOMPILED_TEMPLATES = ('base.html', 'auth/login.html', 'dashboard/index.html')
 
 # Mount static files if directory exists
 try:
@@ -175,42 +275,59 @@ try:
 except RuntimeError:
     pass  # Static directory doesn't exist yet
 
+# Authenticated user caches: token -> user id until expiry, user id -> principal
+token_cache = TTLCache(TOKEN_CACHE_SIZE)
+principal_cache = TTLCache(PRINCIPAL_CACHE_SIZE, ttl=PRINCIPAL_TTL)
+watch_user_changes(User, principal_cache)
+
 # Current user dependency
-async def get_current_user(request: Request, db: AsyncSession = Depends(get_db)) -> Optional[User]:
+async def get_current_user(request: Request, db: AsyncSession = Depends(get_db)) -> Optional[Principal]:
     token = request.cookies.get("access_token") or request.headers.get("Authorization", "").replace("Bearer ", "")
     
     if not token:
         return None
     
-    try:
-        payload = jwt.decode(token, JWT_SECRET, algorithms=[ALGORITHM])
-        user_id = payload.get("sub")
-        if user_id is None:
+    user_id = token_cache.get(token)
+    if user_id is None:
+        try:
+            payload = jwt.decode(token, JWT_SECRET, algorithms=[ALGORITHM])
+            user_id = payload.get("sub")
+            if user_id is None:
+                return None
+            user_id = int(user_id)
+        except (JWTError, ValueError):
             return None
-        user_id = int(user_id)
-        if user_id is None:
-            return None
-    except JWTError:
-        return None
+        token_cache.set(token, user_id, expires_at=payload.get("exp"))
     
-    result = await db.execute(select(User).where(User.id == user_id))
-    user = result.scalar_one_or_none()
-    return user
+    principal = principal_cache.get(user_id)
+    if principal is None:
+        result = await db.execute(select(User).where(User.id == user_id))
+        user = result.scalar_one_or_none()
+        if not user:
+            return None
+        principal = Principal.from_user(user)
+        principal_cache.set(user_id, principal)
+    return principal
 
-async def require_auth(current_user: User = Depends(get_current_user)):
+async def require_auth(current_user: Principal = Depends(get_current_user)):
     if not current_user:
         raise HTTPException(status_code=401, detail="Authentication required")
     return current_user
 
+async def require_admin(current_user: Principal = Depends(require_auth)):
+    if current_user.role != 'admin':
+        raise HTTPException(status_code=403, detail="Access denied")
+    return current_user
+
 # Routes
 @app.get("/", response_class=HTMLResponse)
-async def index(request: Request, current_user: User = Depends(get_current_user)):
+async def index(request: Request, current_user: Principal = Depends(get_current_user)):
     if current_user:
         return RedirectResponse(url="/dashboard", status_code=302)
     return RedirectResponse(url="/login", status_code=302)
 
 @app.get("/login", response_class=HTMLResponse)
-async def login_page(request: Request, current_user: User = Depends(get_current_user)):
+async def login_page(request: Request, current_user: Principal = Depends(get_current_user)):
     if current_user:
         return RedirectResponse(url="/dashboard", status_code=302)
     return templates.TemplateResponse("auth/login.html", {"request": request})
@@ -226,7 +343,15 @@ async def login(
     result = await db.execute(select(User).where(User.username == username))
     user = result.scalar_one_or_none()
     
-    if not user or not verify_password(password, user.password_hash):
+    try:
+        valid = user is not None and await auth_executor.run(verify_password, password, user.password_hash)
+    except AuthPoolBusy:
+        return templates.TemplateResponse("auth/login.html", {
+            "request": request,
+            "error": "Too many sign-ins in progress, please try again"
+        }, status_code=503, headers={"Retry-After": "1"})
+    
+    if not valid:
         return templates.TemplateResponse("auth/login.html", {
             "request": request,
             "error": "Invalid username or password"
@@ -235,7 +360,7 @@ async def login(
     # Create access token
     access_token_expires = timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
     access_token = create_access_token(
-        data={"sub": user.id}, expires_delta=access_token_expires
+        data={"sub": str(user.id)}, expires_delta=access_token_expires
     )
     
     # Set cookie and redirect
@@ -250,7 +375,7 @@ async def login(
     return response
 
 @app.get("/register", response_class=HTMLResponse)
-async def register_page(request: Request, current_user: User = Depends(get_current_user)):
+async def register_page(request: Request, current_user: Principal = Depends(get_current_user)):
     if current_user:
         return RedirectResponse(url="/dashboard", status_code=302)
     return templates.TemplateResponse("auth/register.html", {"request": request})
@@ -278,11 +403,19 @@ async def register(
             "error": "Username or email already exists"
         })
     
+    try:
+        password_hash = await auth_executor.run(get_password_hash, password)
+    except AuthPoolBusy:
+        return templates.TemplateResponse("auth/register.html", {
+            "request": request,
+            "error": "Too many sign-ups in progress, please try again"
+        }, status_code=503, headers={"Retry-After": "1"})
+    
     # Create new user
     user = User(
         username=username,
         email=email,
-        password_hash=get_password_hash(password),
+        password_hash=password_hash,
         role=role,
         first_name=first_name,
         last_name=last_name
@@ -305,7 +438,7 @@ async def logout():
 @app.get("/dashboard", response_class=HTMLResponse)
 async def dashboard(
     request: Request, 
-    current_user: User = Depends(require_auth),
+    current_user: Principal = Depends(require_auth),
     db: AsyncSession = Depends(get_db)
 ):
     # Get recent projects
@@ -315,23 +448,10 @@ async def dashboard(
     projects = result.scalars().all()
     
     # Get statistics
-    total_projects = await db.scalar(select(func.count(Project.id)))
-    active_projects = await db.scalar(
-        select(func.count(Project.id)).where(Project.status.in_(['in progress', 'scheduled']))
-    )
-    completed_projects = await db.scalar(
-        select(func.count(Project.id)).where(Project.status == 'complete')
-    )
-    new_leads = await db.scalar(
-        select(func.count(Project.id)).where(Project.status == 'new lead')
-    )
-    
-    stats = {
-        'total_projects': total_projects or 0,
-        'active_projects': active_projects or 0,
-        'completed_projects': completed_projects or 0,
-        'new_leads': new_leads or 0
-    }
+    if status_counts.is_stale():
+        result = await db.execute(status_count_query(Project))
+        status_counts.load(result.all())
+    stats = status_counts.stats()
     
     return templates.TemplateResponse("dashboard/index.html", {
         "request": request,
@@ -343,39 +463,40 @@ async def dashboard(
 @app.get("/projects", response_class=HTMLResponse)
 async def projects_page(
     request: Request,
-    current_user: User = Depends(require_auth),
+    current_user: Principal = Depends(require_auth),
     search: Optional[str] = None,
     status: Optional[str] = None,
+    page: int = 1,
     db: AsyncSession = Depends(get_db)
 ):
     query = select(Project)
     
     if search:
-        query = query.where(
-            Project.name.contains(search) |
-            Project.description.contains(search) |
-            Project.project_address.contains(search)
-        )
+        query = apply_search(query, Project, engine.dialect.name, search)
     
     if status:
         query = query.where(Project.status == status)
     
+    page = max(page, 1)
     query = query.order_by(Project.updated_at.desc())
+    query = query.offset((page - 1) * SEARCH_PAGE_SIZE).limit(SEARCH_PAGE_SIZE + 1)
     result = await db.execute(query)
     projects = result.scalars().all()
     
     return templates.TemplateResponse("projects/index.html", {
         "request": request,
         "current_user": current_user,
-        "projects": projects,
+        "projects": projects[:SEARCH_PAGE_SIZE],
         "search": search or "",
-        "status_filter": status or ""
+        "status_filter": status or "",
+        "page": page,
+        "has_next": len(projects) > SEARCH_PAGE_SIZE
     })
 
 @app.get("/projects/new", response_class=HTMLResponse)
 async def new_project_page(
     request: Request,
-    current_user: User = Depends(require_auth)
+    current_user: Principal = Depends(require_auth)
 ):
     if current_user.role not in ['admin', 'contractor_trial', 'contractor_paid']:
         raise HTTPException(status_code=403, detail="Access denied")
@@ -389,7 +510,7 @@ async def new_project_page(
 @app.post("/projects/new")
 async def create_project(
     request: Request,
-    current_user: User = Depends(require_auth),
+    current_user: Principal = Depends(require_auth),
     name: str = Form(...),
     description: str = Form(""),
     status: str = Form("new lead"),
@@ -411,7 +532,10 @@ async def create_project(
     )
     
     db.add(project)
+    await db.flush()
+    await db.run_sync(record_change, change_log, 'project', [project.id])
     await db.commit()
+    status_counts.adjust(None, project.status)
     
     return RedirectResponse(url="/projects", status_code=302)
 
@@ -419,47 +543,130 @@ async def create_project(
 async def project_detail(
     request: Request,
     project_id: int,
-    current_user: User = Depends(require_auth),
+    current_user: Principal = Depends(require_auth),
     db: AsyncSession = Depends(get_db)
 ):
-    result = await db.execute(select(Project).where(Project.id == project_id))
-    project = result.scalar_one_or_none()
-    
-    if not project:
+    # Check the validator first; the project row is only loaded for a full render
+    row = (await db.execute(select(Project.updated_at).where(Project.id == project_id))).first()
+    if row is None:
         raise HTTPException(status_code=404, detail="Project not found")
+    updated_at = row.updated_at
+    
+    # The page also shows who is signed in, so the tag is per user
+    headers = validator_headers(
+        make_etag('project', project_id, updated_at and updated_at.isoformat(), current_user.id),
+        updated_at
+    )
+    if is_not_modified(request, headers['ETag'], updated_at):
+        return not_modified(headers)
+    
+    result = await db.execute(select(Project).where(Project.id == project_id))
+    project = result.scalar_one()
     
     return templates.TemplateResponse("projects/detail.html", {
         "request": request,
         "current_user": current_user,
         "project": project
-    })
+    }, headers=headers)
 
 # API Routes
+async def stream_projects_ndjson():
+    """Yield every project as one JSON line, holding a single batch in memory.
+
+    Opens its own session because the request-scoped one is closed before a
+    streaming response body is sent.
+    """
+    query = select(*project_columns(Project)).order_by(
+        Project.updated_at.desc(), Project.id.desc()
+    ).execution_options(yield_per=500)
+
+    async with async_session() as session:
+        result = await session.stream(query)
+        async for partition in result.partitions():
+            yield b"".join(dumps(project) + b"\n" for project in project_dicts(partition))
+
 @app.get("/api/projects")
 async def api_get_projects(
-    current_user: User = Depends(require_auth),
+    request: Request,
+    limit: Optional[int] = None,
+    cursor: Optional[str] = None,
+    format: str = "json",
+    current_user: Principal = Depends(require_auth),
     db: AsyncSession = Depends(get_db)
 ):
-    result = await db.execute(select(Project).order_by(Project.updated_at.desc()))
-    projects = result.scalars().all()
+    # Any insert, delete or edit moves max(updated_at) or the row count, so
+    # polling clients get a 304 from one aggregate query until something changes
+    last_modified, total, change_seq = (await db.execute(
+        select(func.max(Project.updated_at), func.count(Project.id), latest_seq(change_log))
+    )).one()
+    headers = validator_headers(
+        make_etag('projects', last_modified and last_modified.isoformat(), total, format, limit, cursor),
+        last_modified
+    )
+    # Where a client that just loaded the list should start reading /api/projects/changes
+    headers["X-Change-Seq"] = str(change_seq)
+    if is_not_modified(request, headers['ETag'], last_modified):
+        return not_modified(headers)
+    
+    if format == "ndjson":
+        return StreamingResponse(stream_projects_ndjson(), media_type="application/x-ndjson", headers=headers)
+    
+    # Plain column tuples: no ORM objects are built for a listing
+    query = select(*project_columns(Project)).order_by(Project.updated_at.desc(), Project.id.desc())
+    
+    if cursor:
+        try:
+            query = query.where(keyset_before(Project.updated_at, Project.id, decode_cursor(cursor)))
+        except ValueError:
+            raise HTTPException(status_code=400, detail="Invalid cursor")
+    
+    # Without limit or cursor the whole list is returned, as before pagination
+    page_size = requested_page_size(limit, cursor)
+    if page_size is not None:
+        query = query.limit(page_size + 1)
+    result = await db.execute(query)
+    rows = result.all()
+    
+    # One extra row tells us whether another page exists
+    if page_size is not None and len(rows) > page_size:
+        rows = rows[:page_size]
+        last = rows[-1]
+        headers["X-Next-Cursor"] = encode_cursor(last.updated_at, last.id)
     
-    return [{
-        "id": p.id,
-        "name": p.name,
-        "status": p.status,
-        "assigned_to": p.assigned_to,
-        "project_address": p.project_address,
-        "client_phone": p.client_phone,
-        "start_date": p.start_date.isoformat() if p.start_date else None,
-        "end_date": p.end_date.isoformat() if p.end_date else None,
-        "updated_at": p.updated_at.isoformat()
-    } for p in projects]
+    return FastJSONResponse(project_dicts(rows), headers=headers)
+
+@app.get("/api/projects/changes")
+async def api_project_changes(
+    since: int = 0,
+    limit: int = DEFAULT_PAGE_SIZE,
+    current_user: Principal = Depends(require_auth),
+    db: AsyncSession = Depends(get_db)
+):
+    """Projects changed after sequence number ``since``, oldest change first"""
+    page_size = clamp_page_size(limit)
+    rows = (await db.execute(changed_since(change_log, 'project', since, page_size + 1))).all()
+    has_more = len(rows) > page_size
+    rows = rows[:page_size]
+    seqs = {entity_id: seq for entity_id, seq in rows}
+    
+    projects = []
+    if seqs:
+        result = await db.execute(select(*project_columns(Project)).where(Project.id.in_(list(seqs))))
+        projects = sorted(project_dicts(result), key=lambda p: seqs[p["id"]])
+    found = {p["id"] for p in projects}
+    
+    return FastJSONResponse({
+        "changes": projects,
+        "deleted": [project_id for project_id in seqs if project_id not in found],
+        "next_since": rows[-1].last_seq if rows else since,
+        "has_more": has_more
+    })
 
 @app.put("/api/projects/{project_id}")
 async def api_update_project(
     project_id: int,
     update_data: Dict[str, Any],
-    current_user: User = Depends(require_auth),
+    current_user: Principal = Depends(require_auth),
     db: AsyncSession = Depends(get_db)
 ):
     # Get project
@@ -471,70 +678,206 @@ async def api_update_project(
     
     # Update allowed fields
     allowed_fields = ['name', 'status', 'assigned_to', 'project_address', 'client_phone']
+    old_status = project.status
     
+    changed = {}
     for field, value in update_data.items():
-        if field in allowed_fields:
+        if field in allowed_fields and getattr(project, field) != value:
             setattr(project, field, value)
+            changed[field] = value
     
     project.updated_at = datetime.utcnow()
+    await db.run_sync(record_change, change_log, 'project', [project.id])
     await db.commit()
+    status_counts.adjust(old_status, project.status)
     
-    # Emit real-time update
-    await sio.emit('cell_updated', {
-        'project_id': project.id,
-        'field': list(update_data.keys())[0] if update_data else None,
-        'value': list(update_data.values())[0] if update_data else None,
-        'updated_by': current_user.username
-    }, room='projects')
+    # Queue only the changed fields; the broadcaster merges and batches them
+    broadcaster.publish(project_room(project.id), project.id, changed, current_user.username)
+    
+    return FastJSONResponse({field: getattr(project, field) for field in PROJECT_UPDATE_FIELDS})
+
+@app.get("/api/presence")
+async def api_presence(
+    project_ids: Optional[str] = None,
+    current_user: Principal = Depends(require_auth)
+):
+    """Current editing locks, so a reconnecting client can redraw them in one call
+
+    Locks are held in this worker's memory only. With several workers behind
+    SOCKETIO_MESSAGE_QUEUE the snapshot lists just the locks taken through
+    this worker, and two workers can grant the same cell; run a single
+    Socket.IO worker where lock exclusivity matters.
+    """
+    ids = None
+    if project_ids:
+        try:
+            ids = [int(project_id) for project_id in project_ids.split(',')]
+        except ValueError:
+            raise HTTPException(status_code=400, detail="project_ids must be comma-separated integers")
     
     return {
-        "id": project.id,
-        "name": project.name,
-        "status": project.status,
-        "assigned_to": project.assigned_to,
-        "project_address": project.project_address,
-        "client_phone": project.client_phone,
-        "updated_at": project.updated_at.isoformat()
+        "locks": [lock.to_dict() for lock in presence.snapshot(ids)],
+        "ttl": presence.ttl
+    }
+
+@app.get("/api/pricing")
+async def api_pricing_catalog(current_user: Principal = Depends(require_auth)):
+    """Window types, configurations and sizes of the loaded price catalog"""
+    catalog = catalog_manager.current()
+    return FastJSONResponse({
+        "series": catalog.series,
+        "version": catalog.version,
+        "window_types": [grid.to_dict() for grid in catalog.grids.values()]
+    })
+
+@app.post("/api/quotes")
+async def api_quote(quote: QuoteRequest, current_user: Principal = Depends(require_auth)):
+    """Price each opening at the nearest catalog size that covers it"""
+    catalog = catalog_manager.current()
+    try:
+        lines = catalog.quote_lines(
+            (line.window_type, line.width, line.height, line.configuration, line.quantity)
+            for line in quote.lines
+        )
+    except PricingError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    
+    return FastJSONResponse({
+        "catalog_version": catalog.version,
+        "lines": [line.to_dict() for line in lines],
+        "total": round(sum(line.total for line in lines), 2)
+    })
+
+@app.post("/api/quotes/batch")
+async def api_quote_batch(
+    batch: BatchQuoteRequest,
+    current_user: Principal = Depends(require_auth),
+    db: AsyncSession = Depends(get_db)
+):
+    """Price a whole order at once; with ``project_id`` the quote is saved to that project"""
+    if batch.project_id is not None:
+        exists = await db.scalar(select(Project.id).where(Project.id == batch.project_id))
+        if exists is None:
+            raise HTTPException(status_code=404, detail="Project not found")
+    
+    try:
+        priced = catalog_manager.current().quote_batch(
+            batch.window_types, batch.widths, batch.heights, batch.configurations, batch.quantities
+        )
+    except PricingError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    
+    result = priced.to_dict()
+    if batch.project_id is not None:
+        quote = ProjectQuote(
+            project_id=batch.project_id,
+            catalog_version=priced.catalog_version,
+            line_count=len(batch.window_types),
+            total=priced.total,
+            lines=dict(batch.model_dump(exclude={'project_id'}), **result),
+            created_by=current_user.username
+        )
+        db.add(quote)
+        await db.commit()
+        result["quote_id"] = quote.id
+        result["project_id"] = batch.project_id
+    
+    return FastJSONResponse(result)
+
+@app.get("/api/projects/{project_id}/quotes")
+async def api_project_quotes(
+    project_id: int,
+    current_user: Principal = Depends(require_auth),
+    db: AsyncSession = Depends(get_db)
+):
+    """Saved quotes of a project, newest first, without their lines"""
+    rows = await db.execute(
+        select(ProjectQuote.id, ProjectQuote.catalog_version, ProjectQuote.line_count,
+               ProjectQuote.total, ProjectQuote.created_by, ProjectQuote.created_at)
+        .where(ProjectQuote.project_id == project_id)
+        .order_by(ProjectQuote.id.desc())
+    )
+    return FastJSONResponse(project_dicts(
+        rows, ('id', 'catalog_version', 'line_count', 'total', 'created_by', 'created_at')
+    ))
+
+# Operational metrics; admins only
+@app.get("/api/metrics/auth")
+async def api_auth_metrics(current_user: Principal = Depends(require_admin)):
+    return auth_executor.metrics()
+
+@app.get("/api/metrics/catalog")
+async def api_catalog_metrics(current_user: Principal = Depends(require_admin)):
+    return catalog_manager.metrics()
+
+@app.get("/api/metrics/broadcast")
+async def api_broadcast_metrics(current_user: Principal = Depends(require_admin)):
+    return {
+        "updates_published": broadcaster.published,
+        "frames_sent": broadcaster.frames_sent
     }
 
 # Socket.IO Events
 @sio.event
 async def connect(sid, environ):
     print(f"Client {sid} connected")
-    await sio.enter_room(sid, 'projects')
+    await sio.enter_room(sid, LOBBY_ROOM)
     await sio.emit('user_connected', {
         'user_id': sid,
         'username': 'User',
         'message': 'User joined the collaboration'
-    }, room='projects', skip_sid=sid)
+    }, room=LOBBY_ROOM, skip_sid=sid)
 
 @sio.event
 async def disconnect(sid):
     print(f"Client {sid} disconnected")
-    await sio.leave_room(sid, 'projects')
+    for lock in presence.release_sid(sid):
+        await sio.emit('cell_editing_stopped', lock.to_dict(), room=project_room(lock.project_id), skip_sid=sid)
+    await sio.leave_room(sid, LOBBY_ROOM)
     await sio.emit('user_disconnected', {
         'user_id': sid,
         'username': 'User',
         'message': 'User left the collaboration'
-    }, room='projects')
+    }, room=LOBBY_ROOM)
+
+@sio.event
+async def subscribe(sid, data):
+    """Join the rooms for the projects the client has on screen"""
+    for room in subscription_rooms(data):
+        await sio.enter_room(sid, room)
+
+@sio.event
+async def unsubscribe(sid, data):
+    for room in subscription_rooms(data):
+        await sio.leave_room(sid, room)
 
 @sio.event
 async def start_editing(sid, data):
-    await sio.emit('cell_editing_started', {
-        'project_id': data['project_id'],
-        'field': data['field'],
-        'user_id': sid,
-        'username': data.get('username', 'User')
-    }, room='projects', skip_sid=sid)
+    lock, acquired = presence.acquire(int(data['project_id']), data['field'], sid, data.get('username', 'User'))
+    if not acquired:
+        # Someone else holds the cell; tell only the requester who it is
+        await sio.emit('cell_editing_locked', lock.to_dict(), to=sid)
+        return
+    
+    await sio.emit('cell_editing_started', lock.to_dict(), room=project_room(lock.project_id), skip_sid=sid)
 
 @sio.event
 async def stop_editing(sid, data):
-    await sio.emit('cell_editing_stopped', {
-        'project_id': data['project_id'],
-        'field': data['field'],
-        'user_id': sid,
-        'username': data.get('username', 'User')
-    }, room='projects', skip_sid=sid)
+    lock = presence.release(int(data['project_id']), data['field'], sid)
+    if lock is not None:
+        await sio.emit('cell_editing_stopped', lock.to_dict(), room=project_room(lock.project_id), skip_sid=sid)
+
+@sio.event
+async def editing_heartbeat(sid, data=None):
+    presence.heartbeat(sid)
+
+async def expire_editing_locks():
+    """Release locks whose holder stopped sending heartbeats"""
+    while True:
+        await asyncio.sleep(HEARTBEAT_INTERVAL)
+        for lock in presence.expire():
+            await sio.emit('cell_editing_stopped', lock.to_dict(), room=project_room(lock.project_id))
 
 if __name__ == "__main__":
-    uvicorn.run("main:socket_app", host="0.0.0.0", port=5000, reload=True)
\ No newline at end of file
+    # The reloader recompiles every template after each restart; keep it to development
+    uvicorn.run("main:socket_app", host="0.0.0.0", port=5000, reload=not PRODUCTION_TEMPLATES)
\ No newline at end of file
@@ -0,0 +1,39 @@
+"""
+Alembic environment
+Tables are created by the apps at startup; migrations carry the changes
+create_all cannot apply to existing databases, such as new indexes
+"""
+
+import os
+from logging.config import fileConfig
+
+from alembic import context
+from sqlalchemy import create_engine, pool
+
+config = context.config
+if config.config_file_name is not None:
+    fileConfig(config.config_file_name)
+
+def database_url() -> str:
+    """DATABASE_URL with the async drivers swapped for their sync counterparts"""
+    url = os.getenv('DATABASE_URL', 'postgresql://localhost/project_manager')
+    url = url.replace('postgresql+asyncpg://', 'postgresql://', 1)
+    url = url.replace('sqlite+aiosqlite://', 'sqlite://', 1)
+    return url
+
+def run_migrations_offline():
+    context.configure(url=database_url(), target_metadata=None, literal_binds=True)
+    with context.begin_transaction():
+        context.run_migrations()
+
+def run_migrations_online():
+    engine = create_engine(database_url(), poolclass=pool.NullPool)
+    with engine.connect() as connection:
+        context.configure(connection=connection, target_metadata=None)
+        with context.begin_transaction():
+            context.run_migrations()
+
+if context.is_offline_mode():
+    run_migrations_offline()
+else:
+    run_migrations_online()
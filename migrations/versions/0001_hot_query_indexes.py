@@ -0,0 +1,48 @@
+"""Indexes for hot project and board queries
+
+Revision ID: 0001_hot_query_indexes
+Revises:
+Create Date: 2025-07-01
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = '0001_hot_query_indexes'
+down_revision = None
+branch_labels = None
+depends_on = None
+
+# (table, index name, columns, unique)
+INDEXES = [
+    ('projects', 'ix_projects_updated_at_id', ['updated_at', 'id'], False),
+    ('projects', 'ix_projects_status_updated_at', ['status', 'updated_at'], False),
+    ('columns', 'ix_columns_board_order', ['board_id', 'order'], False),
+    ('items', 'ix_items_board_group_order', ['board_id', 'group_name', 'order'], False),
+    ('item_values', 'uq_item_values_item_column', ['item_id', 'column_id'], True),
+    ('item_values', 'ix_item_values_column_id', ['column_id'], False),
+]
+
+def upgrade():
+    inspector = sa.inspect(op.get_bind())
+
+    # The project and board apps may point at different databases
+    for table, name, columns, unique in INDEXES:
+        if not inspector.has_table(table):
+            continue
+
+        if name == 'uq_item_values_item_column':
+            # Keep only the newest value per cell before enforcing uniqueness
+            op.execute(
+                "DELETE FROM item_values WHERE id NOT IN ("
+                "SELECT MAX(id) FROM item_values GROUP BY item_id, column_id)"
+            )
+
+        op.create_index(name, table, columns, unique=unique, if_not_exists=True)
+
+def downgrade():
+    inspector = sa.inspect(op.get_bind())
+
+    for table, name, columns, unique in reversed(INDEXES):
+        if inspector.has_table(table):
+            op.drop_index(name, table_name=table, if_exists=True)
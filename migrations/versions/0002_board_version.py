@@ -0,0 +1,28 @@
+"""Board version counter for conditional GETs
+
+Revision ID: 0002_board_version
+Revises: 0001_hot_query_indexes
+Create Date: 2025-07-08
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = '0002_board_version'
+down_revision = '0001_hot_query_indexes'
+branch_labels = None
+depends_on = None
+
+def upgrade():
+    inspector = sa.inspect(op.get_bind())
+    if not inspector.has_table('boards'):
+        return
+
+    if 'version' not in {column['name'] for column in inspector.get_columns('boards')}:
+        op.add_column('boards', sa.Column('version', sa.Integer(), nullable=False, server_default='0'))
+
+def downgrade():
+    inspector = sa.inspect(op.get_bind())
+    if inspector.has_table('boards'):
+        with op.batch_alter_table('boards') as batch_op:
+            batch_op.drop_column('version')
@@ -0,0 +1,49 @@
+"""
+Keyset pagination helpers shared by the FastAPI and Flask apps
+Cursors encode the (updated_at, id) of the last row on a page
+"""
+
+import base64
+import binascii
+from datetime import datetime
+from typing import Optional, Tuple
+
+from sqlalchemy import tuple_
+
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 1000
+
+def encode_cursor(updated_at: datetime, row_id: int) -> str:
+    raw = f"{updated_at.isoformat()}|{row_id}".encode('utf-8')
+    return base64.urlsafe_b64encode(raw).decode('ascii').rstrip('=')
+
+def decode_cursor(cursor: str) -> Tuple[datetime, int]:
+    """Decode a cursor, raising ValueError if it is malformed"""
+    padded = cursor + '=' * (-len(cursor) % 4)
+    try:
+        raw = base64.urlsafe_b64decode(padded.encode('ascii')).decode('utf-8')
+    except (binascii.Error, UnicodeError) as exc:
+        raise ValueError('Invalid cursor') from exc
+
+    updated_at, _, row_id = raw.partition('|')
+    return datetime.fromisoformat(updated_at), int(row_id)
+
+def clamp_page_size(limit: Optional[int]) -> int:
+    if not limit or limit < 1:
+        return DEFAULT_PAGE_SIZE
+    return min(limit, MAX_PAGE_SIZE)
+
+def requested_page_size(limit: Optional[int], cursor: Optional[str]) -> Optional[int]:
+    """Page size for a project listing, or None for the whole list
+
+    Listings were unpaged before cursors were added, and the clients read
+    them as a plain array. A request with neither ``limit`` nor ``cursor``
+    still gets every row; either one opts in to pages.
+    """
+    if limit is None and not cursor:
+        return None
+    return clamp_page_size(limit)
+
+def keyset_before(updated_col, id_col, cursor: Tuple[datetime, int]):
+    """Rows that sort after the cursor in (updated_at DESC, id DESC) order"""
+    return tuple_(updated_col, id_col) < tuple_(*cursor)
@@ -0,0 +1,110 @@
+"""
+Editing presence registry
+Tracks who is editing which project cell, with per-entry TTL and heartbeats
+"""
+
+import os
+import time
+from typing import Dict, Iterable, List, NamedTuple, Optional, Set, Tuple
+
+EDITING_LOCK_TTL = float(os.getenv('EDITING_LOCK_TTL', '30'))  # seconds
+HEARTBEAT_INTERVAL = EDITING_LOCK_TTL / 3
+
+CellKey = Tuple[int, str]
+
+class EditingLock(NamedTuple):
+    project_id: int
+    field: str
+    sid: str
+    username: str
+    expires_at: float
+
+    def to_dict(self):
+        return {
+            'project_id': self.project_id,
+            'field': self.field,
+            'user_id': self.sid,
+            'username': self.username
+        }
+
+class PresenceRegistry:
+    """Editing locks keyed by (project_id, field)
+
+    A cell is held by one connection at a time until it is released, the
+    connection disconnects, or the entry goes ``ttl`` seconds without a
+    heartbeat. Entries are also indexed by sid so a disconnect releases
+    everything that connection held in one step.
+
+    The registry lives in one process. Workers sharing a Socket.IO message
+    queue each keep their own, so locks are only exclusive per worker.
+    """
+
+    def __init__(self, ttl: float = EDITING_LOCK_TTL):
+        self.ttl = ttl
+        self._locks: Dict[CellKey, EditingLock] = {}
+        self._by_sid: Dict[str, Set[CellKey]] = {}
+
+    def __len__(self):
+        return len(self._locks)
+
+    def acquire(self, project_id: int, field: str, sid: str, username: str,
+                now: Optional[float] = None) -> Tuple[EditingLock, bool]:
+        """Take the lock on a cell; returns (current holder, whether sid holds it)"""
+        now = time.monotonic() if now is None else now
+        key = (project_id, field)
+        holder = self._locks.get(key)
+        if holder is not None and holder.sid != sid and holder.expires_at > now:
+            return holder, False
+
+        if holder is not None and holder.sid != sid:
+            self._forget(holder)
+        lock = EditingLock(project_id, field, sid, username, now + self.ttl)
+        self._locks[key] = lock
+        self._by_sid.setdefault(sid, set()).add(key)
+        return lock, True
+
+    def release(self, project_id: int, field: str, sid: str) -> Optional[EditingLock]:
+        lock = self._locks.get((project_id, field))
+        if lock is None or lock.sid != sid:
+            return None
+        self._forget(lock)
+        return lock
+
+    def release_sid(self, sid: str) -> List[EditingLock]:
+        """Drop every lock held by a connection, e.g. on disconnect"""
+        return [self._locks.pop(key) for key in self._by_sid.pop(sid, ())]
+
+    def heartbeat(self, sid: str, now: Optional[float] = None) -> int:
+        """Extend every lock held by sid; returns how many were refreshed"""
+        expires_at = (time.monotonic() if now is None else now) + self.ttl
+        keys = self._by_sid.get(sid, ())
+        for key in keys:
+            self._locks[key] = self._locks[key]._replace(expires_at=expires_at)
+        return len(keys)
+
+    def expire(self, now: Optional[float] = None) -> List[EditingLock]:
+        """Remove and return entries whose TTL has lapsed"""
+        now = time.monotonic() if now is None else now
+        expired = [lock for lock in self._locks.values() if lock.expires_at <= now]
+        for lock in expired:
+            self._forget(lock)
+        return expired
+
+    def snapshot(self, project_ids: Optional[Iterable[int]] = None,
+                 now: Optional[float] = None) -> List[EditingLock]:
+        """Live locks, optionally limited to some projects"""
+        now = time.monotonic() if now is None else now
+        wanted = None if project_ids is None else set(project_ids)
+        return [
+            lock for lock in self._locks.values()
+            if lock.expires_at > now and (wanted is None or lock.project_id in wanted)
+        ]
+
+    def _forget(self, lock: EditingLock):
+        key = (lock.project_id, lock.field)
+        self._locks.pop(key, None)
+        keys = self._by_sid.get(lock.sid)
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self._by_sid[lock.sid]
@@ -0,0 +1,289 @@
+"""
+V300 window price lookup
+Loads the extracted Trinsic V300 catalog once into sorted arrays per window type
+"""
+
+import hashlib
+import json
+import os
+import re
+from array import array
+from bisect import bisect_left
+from fractions import Fraction
+from typing import Dict, Iterable, List, NamedTuple, Optional, Sequence, Tuple
+
+CATALOG_PATH = os.getenv('PRICING_CATALOG', os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), 'attached_assets',
+    'Pasted--metadata-source-V300-SERIES-xlsx-series-Trinsic-V300-extracted-1750377690382_1750377690382.txt'
+))
+
+MISSING = float('nan')  # configuration tier a size is not offered in
+MAX_BATCH_LINES = int(os.getenv('MAX_BATCH_LINES', 20000))
+
+# "11 1/2 x 23 1/2": the actual width x height in inches
+_DIMENSIONS = re.compile(r'^\s*(\d+(?:\s+\d+/\d+)?)\s*x\s*(\d+(?:\s+\d+/\d+)?)\s*$')
+
+class PricingError(ValueError):
+    """Unknown window type, unavailable size or configuration"""
+
+class QuoteLine(NamedTuple):
+    window_type: str
+    size: str
+    width: float
+    height: float
+    configuration: int
+    unit_price: float
+    quantity: int
+    total: float
+
+    def to_dict(self):
+        return self._asdict()
+
+class BatchQuote(NamedTuple):
+    """A priced batch in columns, line ``i`` at position ``i`` of each array"""
+    catalog_version: str
+    sizes: List[str]
+    unit_prices: array
+    totals: array
+    total: float
+
+    def to_dict(self):
+        return {
+            'catalog_version': self.catalog_version,
+            'sizes': self.sizes,
+            'unit_prices': self.unit_prices.tolist(),
+            'totals': self.totals.tolist(),
+            'total': self.total
+        }
+
+def _inches(value: str) -> float:
+    return float(sum(Fraction(part) for part in value.split()))
+
+def parse_dimensions(entry: dict) -> Tuple[float, float]:
+    """Actual (width, height) of a catalog entry
+
+    The extractor filled ``width``/``height`` from the nominal size code
+    ("1020" -> 10.20), so the real dimensions are read from ``heightRaw``,
+    which holds "W x H" in inches. Entries without it keep the numeric fields.
+    """
+    match = _DIMENSIONS.match(entry.get('heightRaw') or '')
+    if match:
+        return _inches(match.group(1)), _inches(match.group(2))
+    return float(entry['width']), float(entry['height'])
+
+class SizeGrid:
+    """Sizes of one window type in flat arrays ordered by (width, height)
+
+    ``widths`` holds each distinct width once; the sizes of ``widths[w]`` sit
+    at ``starts[w]:starts[w + 1]`` of the per-size arrays, sorted by height.
+    Configuration prices are a row-major ``sizes x tiers`` matrix.
+
+    Arrays are ``array`` objects when parsed from JSON and memoryviews over
+    the mapped file when opened with catalog_file.open_catalog.
+    """
+
+    __slots__ = ('window_type', 'display_name', 'widths', 'starts', 'heights',
+                 'base_prices', 'prices', 'tiers', 'codes')
+
+    def __init__(self, window_type: str, display_name: str, widths: array, starts: array, heights: array,
+                 base_prices: array, prices: array, tiers: int, codes: Sequence[str]):
+        self.window_type = window_type
+        self.display_name = display_name
+        self.widths = widths
+        self.starts = starts
+        self.heights = heights
+        self.base_prices = base_prices
+        self.prices = prices
+        self.tiers = tiers
+        self.codes = codes
+
+    @classmethod
+    def from_entries(cls, window_type: str, display_name: str, entries: Iterable[dict]) -> 'SizeGrid':
+        sizes = sorted(
+            (*parse_dimensions(entry), float(entry.get('basePrice') or 0), entry.get('configurations') or [],
+             str(entry.get('widthRaw') or ''))
+            for entry in entries
+        )
+        tiers = max((len(size[3]) for size in sizes), default=0)
+
+        widths, starts, heights = array('d'), array('q'), array('d')
+        base_prices, prices = array('d'), array('d')
+        for index, (width, height, base_price, configurations, _) in enumerate(sizes):
+            if not widths or widths[-1] != width:
+                widths.append(width)
+                starts.append(index)
+            heights.append(height)
+            base_prices.append(base_price)
+            prices.extend(float(price) for price in configurations)
+            prices.extend([MISSING] * (tiers - len(configurations)))
+        starts.append(len(sizes))
+        return cls(window_type, display_name, widths, starts, heights, base_prices, prices, tiers,
+                   tuple(size[4] for size in sizes))
+
+    def __len__(self):
+        return len(self.heights)
+
+    def find(self, width: float, height: float) -> int:
+        """Index of the smallest size at least ``width`` wide and ``height`` tall
+
+        Smallest means least area (width x height), the narrower size on a
+        tie. Each width from the first wide enough one contributes its
+        shortest size that is tall enough, found by bisecting its heights;
+        the scan stops at the first width whose area at ``height`` already
+        reaches the best fit, since every later width is larger still.
+        """
+        widths, starts, heights = self.widths, self.starts, self.heights
+        best, best_area = -1, float('inf')
+        for column in range(bisect_left(widths, width), len(widths)):
+            column_width = widths[column]
+            if column_width * height >= best_area:
+                break
+            end = starts[column + 1]
+            index = bisect_left(heights, height, starts[column], end)
+            if index < end and column_width * heights[index] < best_area:
+                best, best_area = index, column_width * heights[index]
+        if best < 0:
+            raise PricingError(f'No {self.window_type} size fits {width:g} x {height:g}')
+        return best
+
+    def find_many(self, widths: Sequence[float], heights: Sequence[float]) -> array:
+        """``find`` over a batch of openings; -1 where nothing fits
+
+        Orders repeat the same few openings, so each distinct (width, height)
+        is searched once and the rest are dictionary hits.
+        """
+        found: Dict[Tuple[float, float], int] = {}
+        indexes = array('l')
+        for key in zip(widths, heights):
+            index = found.get(key)
+            if index is None:
+                try:
+                    index = self.find(*key)
+                except PricingError:
+                    index = -1
+                found[key] = index
+            indexes.append(index)
+        return indexes
+
+    def width_at(self, index: int) -> float:
+        return self.widths[bisect_left(self.starts, index + 1) - 1]
+
+    def price(self, index: int, configuration: int) -> float:
+        if not 0 <= configuration < self.tiers:
+            raise PricingError(f'{self.window_type} has configurations 0-{self.tiers - 1}')
+        price = self.prices[index * self.tiers + configuration]
+        if price != price:  # NaN: this size is not offered in that configuration
+            raise PricingError(f'{self.window_type} {self.codes[index]} has no configuration {configuration}')
+        return price
+
+    def to_dict(self):
+        return {
+            'window_type': self.window_type,
+            'display_name': self.display_name,
+            'configurations': self.tiers,
+            'sizes': [
+                {'size': self.codes[index], 'width': self.width_at(index), 'height': self.heights[index]}
+                for index in range(len(self))
+            ]
+        }
+
+class PriceCatalog:
+    """Immutable set of size grids keyed by window type
+
+    Window types are matched by catalog key ("SH") or display name
+    ("Single Hung"), case-insensitively.
+    """
+
+    def __init__(self, grids: Dict[str, SizeGrid], series: str = '', version: str = ''):
+        self.grids = grids
+        self.series = series
+        self.version = version
+        self._aliases = {}
+        for key, grid in grids.items():
+            self._aliases[key.lower()] = grid
+            self._aliases[grid.display_name.lower()] = grid
+
+    @classmethod
+    def from_json(cls, raw: bytes) -> 'PriceCatalog':
+        data = json.loads(raw)
+        grids = {
+            key: SizeGrid.from_entries(key, window.get('displayName') or key, window.get('pricing') or [])
+            for key, window in data.get('windowTypes', {}).items()
+        }
+        series = data.get('metadata', {}).get('series', '')
+        return cls(grids, series, hashlib.sha1(raw).hexdigest()[:12])
+
+    def grid(self, window_type: str) -> SizeGrid:
+        grid = self._aliases.get(window_type.lower())
+        if grid is None:
+            raise PricingError(f'Unknown window type {window_type!r}')
+        return grid
+
+    def quote(self, window_type: str, width: float, height: float, configuration: int = 0,
+              quantity: int = 1) -> QuoteLine:
+        """Price ``quantity`` windows of the nearest catalog size that covers the opening
+
+        Each configuration column is a complete unit price; ``basePrice`` is
+        kept in the grid as listed but not added on top.
+        """
+        if width <= 0 or height <= 0 or quantity < 1:
+            raise PricingError('Width and height must be positive and quantity at least 1')
+        grid = self.grid(window_type)
+        index = grid.find(width, height)
+        unit_price = grid.price(index, configuration)
+        return QuoteLine(grid.window_type, grid.codes[index], grid.width_at(index), grid.heights[index],
+                         configuration, unit_price, quantity, round(unit_price * quantity, 2))
+
+    def quote_lines(self, lines: Iterable[Tuple[str, float, float, int, int]]) -> List[QuoteLine]:
+        quote = self.quote
+        return [quote(*line) for line in lines]
+
+    def quote_batch(self, window_types: Sequence[str], widths: Sequence[float], heights: Sequence[float],
+                    configurations: Optional[Sequence[int]] = None,
+                    quantities: Optional[Sequence[int]] = None) -> BatchQuote:
+        """Price parallel arrays of openings, one grid search per window type
+
+        Lines are grouped by window type so each grid is resolved once and
+        searched with ``find_many``. Errors name the offending line.
+        """
+        count = len(window_types)
+        configurations = [0] * count if configurations is None else configurations
+        quantities = [1] * count if quantities is None else quantities
+        if not len(widths) == len(heights) == len(configurations) == len(quantities) == count:
+            raise PricingError('All batch arrays must have the same length')
+        if count > MAX_BATCH_LINES:
+            raise PricingError(f'At most {MAX_BATCH_LINES} lines per batch')
+        if count and (min(widths) <= 0 or min(heights) <= 0):
+            raise PricingError('Widths and heights must be positive')
+        if count and min(quantities) < 1:
+            raise PricingError('Quantities must be at least 1')
+
+        by_type: Dict[str, List[int]] = {}
+        for line, window_type in enumerate(window_types):
+            by_type.setdefault(window_type, []).append(line)
+
+        sizes = [''] * count
+        unit_prices = array('d', bytes(8 * count))
+        totals = array('d', bytes(8 * count))
+        for window_type, lines in by_type.items():
+            try:
+                grid = self.grid(window_type)
+            except PricingError as e:
+                raise PricingError(f'line {lines[0]}: {e}') from None
+            indexes = grid.find_many([widths[line] for line in lines], [heights[line] for line in lines])
+            for line, index in zip(lines, indexes):
+                if index < 0:
+                    raise PricingError(f'line {line}: No {grid.window_type} size fits '
+                                       f'{widths[line]:g} x {heights[line]:g}')
+                try:
+                    unit_price = grid.price(index, configurations[line])
+                except PricingError as e:
+                    raise PricingError(f'line {line}: {e}') from None
+                sizes[line] = grid.codes[index]
+                unit_prices[line] = unit_price
+                totals[line] = round(unit_price * quantities[line], 2)
+        return BatchQuote(self.version, sizes, unit_prices, totals, round(sum(totals), 2))
+
+def load_catalog(path: Optional[str] = None) -> PriceCatalog:
+    with open(path or CATALOG_PATH, 'rb') as f:
+        return PriceCatalog.from_json(f.read())
@@ -0,0 +1,101 @@
+"""
+Caches for authenticated users
+Keeps per-request auth from decoding the JWT and querying users every time
+
+Principals are cached per worker process. watch_user_changes drops an entry
+when this process changes the user through the ORM; a change made by another
+worker, by a bulk UPDATE/DELETE or outside the app is not seen, and the old
+role or name can be served until the entry expires, at most PRINCIPAL_TTL
+(60 s) later. Lower PRINCIPAL_TTL if that window is too long for a revoked
+role.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Hashable, Optional
+
+from sqlalchemy import event
+
+PRINCIPAL_TTL = 60  # seconds
+PRINCIPAL_CACHE_SIZE = 1024
+TOKEN_CACHE_SIZE = 4096
+
+@dataclass(frozen=True)
+class Principal:
+    """The user fields request handlers and templates actually read"""
+    id: int
+    username: str
+    email: str
+    role: str
+    first_name: Optional[str] = None
+    last_name: Optional[str] = None
+
+    @classmethod
+    def from_user(cls, user) -> 'Principal':
+        return cls(
+            id=user.id,
+            username=user.username,
+            email=user.email,
+            role=user.role,
+            first_name=user.first_name,
+            last_name=user.last_name
+        )
+
+class TTLCache:
+    """Thread-safe LRU cache whose entries also expire.
+
+    Entries expire ``ttl`` seconds after they are set, or at an explicit
+    ``expires_at`` timestamp when one is given.
+    """
+
+    def __init__(self, max_size: int, ttl: Optional[float] = None):
+        self.max_size = max_size
+        self.ttl = ttl
+        self._entries: 'OrderedDict[Hashable, tuple]' = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            value, expires_at = entry
+            if expires_at is not None and expires_at <= time.time():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: Any, expires_at: Optional[float] = None):
+        if expires_at is None and self.ttl is not None:
+            expires_at = time.time() + self.ttl
+        with self._lock:
+            self._entries[key] = (value, expires_at)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, key: Hashable):
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+def watch_user_changes(user_model, principal_cache: TTLCache):
+    """Drop cached principals when this process updates or deletes a user through the ORM
+
+    Mapper events do not fire for bulk ``update()``/``delete()`` statements
+    or for other processes; those changes wait for PRINCIPAL_TTL.
+    """
+    def invalidate(mapper, connection, target):
+        principal_cache.invalidate(target.id)
+
+    event.listen(user_model, 'after_update', invalidate)
+    event.listen(user_model, 'after_delete', invalidate)
@@ -0,0 +1,178 @@
+"""
+In-memory project repository
+Projects by id with status and assignee indexes, live counters and optional JSON snapshots
+"""
+
+import json
+import os
+import threading
+from typing import Any, Dict, Iterable, List, Optional
+
+from dashboard_stats import ACTIVE_STATUSES
+
+# Fields with a secondary index; lookups on anything else scan
+INDEXED_FIELDS = ('status', 'assigned_to')
+
+class ProjectStore:
+    """Thread-safe project repository kept entirely in memory.
+
+    Projects are plain dicts keyed by id. Every write updates the status and
+    assignee indexes in the same locked step, so ``by_status``/``count`` and
+    ``stats`` never scan the whole store. Readers get copies; the stored dicts
+    are only changed through ``add``, ``update`` and ``delete``.
+
+    With a ``snapshot_path`` the store loads that JSON file on construction
+    and ``save`` writes it back atomically. ``dirty`` tells whether there are
+    writes since the last save.
+    """
+
+    def __init__(self, projects: Iterable[Dict[str, Any]] = (), snapshot_path: Optional[str] = None):
+        self.snapshot_path = snapshot_path
+        self.dirty = False
+        self._projects: Dict[int, Dict[str, Any]] = {}
+        self._indexes: Dict[str, Dict[Any, Dict[int, None]]] = {field: {} for field in INDEXED_FIELDS}
+        self._next_id = 1
+        self._lock = threading.RLock()
+
+        if snapshot_path and os.path.exists(snapshot_path):
+            with open(snapshot_path) as f:
+                projects = json.load(f)['projects']
+        for project in projects:
+            self._insert(dict(project))
+
+    def __len__(self):
+        return len(self._projects)
+
+    def __contains__(self, project_id: int):
+        return project_id in self._projects
+
+    def _index(self, project: Dict[str, Any]):
+        for field, index in self._indexes.items():
+            # dicts as ordered sets: O(1) add and remove
+            index.setdefault(project.get(field), {})[project['id']] = None
+
+    def _unindex(self, project: Dict[str, Any]):
+        for field, index in self._indexes.items():
+            key = project.get(field)
+            ids = index[key]
+            del ids[project['id']]
+            if not ids:
+                del index[key]
+
+    def _insert(self, project: Dict[str, Any]):
+        if project.get('id') is None:
+            project['id'] = self._next_id
+        if project['id'] in self._projects:
+            raise ValueError(f"Duplicate project id {project['id']}")
+        self._projects[project['id']] = project
+        self._next_id = max(self._next_id, project['id'] + 1)
+        self._index(project)
+
+    def get(self, project_id: int) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            project = self._projects.get(project_id)
+            return dict(project) if project is not None else None
+
+    def all(self) -> List[Dict[str, Any]]:
+        with self._lock:
+            return [dict(project) for project in self._projects.values()]
+
+    def find(self, **criteria) -> List[Dict[str, Any]]:
+        """Projects whose fields equal every criterion, in id order
+
+        Indexed criteria intersect their index entries, smallest first; any
+        other criteria filter what is left.
+        """
+        with self._lock:
+            indexed = sorted(
+                (self._indexes[field].get(value, {}) for field, value in criteria.items() if field in self._indexes),
+                key=len
+            )
+            ids = self._projects
+            if indexed:
+                ids = indexed[0].keys()
+                for other in indexed[1:]:
+                    ids = ids & other.keys()
+                # Updates re-append ids to their index, so index order is not id order
+                ids = sorted(ids)
+            rest = [(field, value) for field, value in criteria.items() if field not in self._indexes]
+            projects = map(self._projects.__getitem__, ids)
+            if rest:
+                projects = (p for p in projects if all(p.get(field) == value for field, value in rest))
+            return [dict(project) for project in projects]
+
+    def by_status(self, status: str) -> List[Dict[str, Any]]:
+        return self.find(status=status)
+
+    def by_assignee(self, assigned_to: str) -> List[Dict[str, Any]]:
+        return self.find(assigned_to=assigned_to)
+
+    def count(self, status: Optional[str] = None) -> int:
+        with self._lock:
+            if status is None:
+                return len(self._projects)
+            return len(self._indexes['status'].get(status, ()))
+
+    def status_counts(self) -> Dict[str, int]:
+        with self._lock:
+            return {status: len(ids) for status, ids in self._indexes['status'].items()}
+
+    def stats(self) -> Dict[str, int]:
+        """Dashboard tiles, in the shape of dashboard_stats.StatusCounts.stats"""
+        counts = self.status_counts()
+        return {
+            'total_projects': sum(counts.values()),
+            'active_projects': sum(counts.get(status, 0) for status in ACTIVE_STATUSES),
+            'completed_projects': counts.get('complete', 0),
+            'new_leads': counts.get('new lead', 0)
+        }
+
+    def add(self, **fields) -> Dict[str, Any]:
+        """Store a new project; an id is assigned unless one is given"""
+        with self._lock:
+            project = dict(fields)
+            self._insert(project)
+            self.dirty = True
+            return dict(project)
+
+    def update(self, project_id: int, **changes) -> Optional[Dict[str, Any]]:
+        if 'id' in changes and changes['id'] != project_id:
+            raise ValueError('Project ids cannot change')
+        with self._lock:
+            project = self._projects.get(project_id)
+            if project is None:
+                return None
+            reindex = any(field in changes for field in INDEXED_FIELDS)
+            if reindex:
+                self._unindex(project)
+            project.update(changes)
+            if reindex:
+                self._index(project)
+            self.dirty = True
+            return dict(project)
+
+    def delete(self, project_id: int) -> bool:
+        with self._lock:
+            project = self._projects.pop(project_id, None)
+            if project is None:
+                return False
+            self._unindex(project)
+            self.dirty = True
+            return True
+
+    def save(self, path: Optional[str] = None):
+        """Write every project to a JSON snapshot, replacing the old file atomically"""
+        path = path or self.snapshot_path
+        if not path:
+            raise ValueError('No snapshot path configured')
+        with self._lock:
+            body = json.dumps({'projects': list(self._projects.values())}, default=str)
+            self.dirty = False
+
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        temp_path = f'{path}.tmp{os.getpid()}.{threading.get_ident()}'
+        with open(temp_path, 'w') as f:
+            f.write(body)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, path)
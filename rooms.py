@@ -0,0 +1,35 @@
+"""
+Socket.IO room naming and subscriptions shared by the FastAPI and Flask apps
+Clients join one room per project they have on screen
+"""
+
+from typing import Any, Dict, List
+
+# Connection-level notices (user joined/left) still go to everyone here
+LOBBY_ROOM = 'projects'
+MAX_SUBSCRIPTIONS = 500
+
+def project_room(project_id) -> str:
+    return f'project:{int(project_id)}'
+
+def subscription_rooms(data: Dict[str, Any]) -> List[str]:
+    """Rooms named by a subscribe payload: {"project_ids": [...]}
+
+    Ids that are not integers are skipped and at most MAX_SUBSCRIPTIONS rooms
+    are returned per call. Boards have no rooms: board_app serves no
+    Socket.IO and its pages follow /api/boards/{id}/changes instead.
+    """
+    if not isinstance(data, dict):
+        return []
+
+    ids = data.get('project_ids') or []
+    if not isinstance(ids, list):
+        return []
+
+    rooms = []
+    for project_id in ids:
+        try:
+            rooms.append(project_room(project_id))
+        except (TypeError, ValueError):
+            continue
+    return rooms[:MAX_SUBSCRIPTIONS]
@@ -0,0 +1,123 @@
+"""
+Full-text project search shared by the FastAPI and Flask apps
+PostgreSQL uses a generated tsvector column with a GIN index,
+SQLite uses an FTS5 table kept in sync by triggers
+"""
+
+import re
+
+from sqlalchemy import func, literal, literal_column, select, text
+
+SEARCH_PAGE_SIZE = 50
+
+_TOKEN_RE = re.compile(r'\w+', re.UNICODE)
+
+POSTGRES_DDL = [
+    """
+    ALTER TABLE projects ADD COLUMN IF NOT EXISTS search_vector tsvector
+    GENERATED ALWAYS AS (
+        setweight(to_tsvector('english', coalesce(name, '')), 'A') ||
+        setweight(to_tsvector('english', coalesce(project_address, '')), 'B') ||
+        setweight(to_tsvector('english', coalesce(description, '')), 'C')
+    ) STORED
+    """,
+    "CREATE INDEX IF NOT EXISTS ix_projects_search_vector ON projects USING GIN (search_vector)",
+]
+
+SQLITE_DDL = [
+    """
+    CREATE TRIGGER IF NOT EXISTS projects_fts_insert AFTER INSERT ON projects BEGIN
+        INSERT INTO projects_fts(rowid, name, project_address, description)
+        VALUES (new.id, new.name, new.project_address, new.description);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS projects_fts_delete AFTER DELETE ON projects BEGIN
+        INSERT INTO projects_fts(projects_fts, rowid, name, project_address, description)
+        VALUES ('delete', old.id, old.name, old.project_address, old.description);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS projects_fts_update AFTER UPDATE ON projects BEGIN
+        INSERT INTO projects_fts(projects_fts, rowid, name, project_address, description)
+        VALUES ('delete', old.id, old.name, old.project_address, old.description);
+        INSERT INTO projects_fts(rowid, name, project_address, description)
+        VALUES (new.id, new.name, new.project_address, new.description);
+    END
+    """,
+]
+
+def install_search_index(conn):
+    """Create the search index for the connection's dialect.
+
+    Safe to run on every startup. Takes a sync Connection, so async callers
+    go through ``conn.run_sync(install_search_index)``.
+    """
+    dialect = conn.dialect.name
+
+    if dialect == 'postgresql':
+        for statement in POSTGRES_DDL:
+            conn.execute(text(statement))
+    elif dialect == 'sqlite':
+        exists = conn.execute(text(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'projects_fts'"
+        )).first()
+        if not exists:
+            conn.execute(text(
+                "CREATE VIRTUAL TABLE projects_fts USING fts5("
+                "name, project_address, description, content='projects', content_rowid='id')"
+            ))
+            # Index rows that were written before the table existed
+            conn.execute(text("INSERT INTO projects_fts(projects_fts) VALUES ('rebuild')"))
+        for statement in SQLITE_DDL:
+            conn.execute(text(statement))
+
+def search_tokens(term: str):
+    return _TOKEN_RE.findall(term or '')
+
+def search_matches(model, dialect: str, term: str):
+    """Subquery of (id, rank) for projects matching ``term``, best match first.
+
+    Every token is prefix-matched so partially typed words still hit. Lower
+    rank sorts first on all backends. Returns None when the term has no
+    searchable tokens.
+    """
+    tokens = search_tokens(term)
+    if not tokens:
+        return None
+
+    if dialect == 'postgresql':
+        ts_query = func.to_tsquery('english', ' & '.join(f"{token}:*" for token in tokens))
+        vector = literal_column('projects.search_vector')
+        query = select(
+            model.id.label('id'),
+            (-func.ts_rank_cd(vector, ts_query)).label('rank')
+        ).where(vector.op('@@')(ts_query))
+    elif dialect == 'sqlite':
+        match = ' '.join('"{}"*'.format(token.replace('"', '""')) for token in tokens)
+        query = select(
+            literal_column('projects_fts.rowid').label('id'),
+            literal_column('bm25(projects_fts, 10.0, 5.0, 1.0)').label('rank')
+        ).select_from(text('projects_fts')).where(
+            text('projects_fts MATCH :match').bindparams(match=match)
+        )
+    else:
+        # No index available; fall back to the old substring scan
+        condition = None
+        for token in tokens:
+            token_match = (
+                model.name.contains(token) |
+                model.description.contains(token) |
+                model.project_address.contains(token)
+            )
+            condition = token_match if condition is None else condition & token_match
+        query = select(model.id.label('id'), literal(0).label('rank')).where(condition)
+
+    return query.subquery('search_matches')
+
+def apply_search(query, model, dialect: str, term: str):
+    """Restrict a select() or Flask-SQLAlchemy query to ranked search hits"""
+    matches = search_matches(model, dialect, term)
+    if matches is None:
+        return query
+    return query.join(matches, matches.c.id == model.id).order_by(matches.c.rank)
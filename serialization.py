@@ -0,0 +1,35 @@
+"""
+Fast JSON serialization for project listings
+Selects plain column tuples and encodes them straight to bytes
+"""
+
+from typing import Any, Dict, Iterable, List, Sequence
+
+import orjson
+from fastapi.responses import Response
+
+# Fields of a project in API responses, in select order
+PROJECT_FIELDS = (
+    'id', 'name', 'status', 'assigned_to', 'project_address', 'client_phone',
+    'start_date', 'end_date', 'updated_at'
+)
+# Fields echoed back after an inline edit
+PROJECT_UPDATE_FIELDS = ('id', 'name', 'status', 'assigned_to', 'project_address', 'client_phone', 'updated_at')
+
+def dumps(value: Any) -> bytes:
+    """Compact JSON bytes; dates and datetimes become ISO 8601 strings"""
+    return orjson.dumps(value)
+
+def project_columns(model) -> List[Any]:
+    """The columns to select for PROJECT_FIELDS, so rows come back as tuples"""
+    return [getattr(model, field) for field in PROJECT_FIELDS]
+
+def project_dicts(rows: Iterable[Sequence[Any]], fields: Sequence[str] = PROJECT_FIELDS) -> List[Dict[str, Any]]:
+    return [dict(zip(fields, row)) for row in rows]
+
+class FastJSONResponse(Response):
+    """JSONResponse that encodes with orjson"""
+    media_type = 'application/json'
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
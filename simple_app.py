@@ -3,43 +3,87 @@ Simple FastAPI Project Management System
 Simplified version for immediate deployment
 """
 
-from fastapi import FastAPI, Request
+import asyncio
+import os
+from contextlib import asynccontextmanager
+from typing import Optional
+
+from fastapi import FastAPI, HTTPException, Request
 from fastapi.responses import HTMLResponse
-from fastapi.templating import Jinja2Templates
 import uvicorn
 
+from project_store import ProjectStore
+from template_cache import PRODUCTION_TEMPLATES, create_templates, precompile_templates
+
+# Set to a file path to keep demo data across restarts
+SNAPSHOT_PATH = os.getenv('SIMPLE_APP_SNAPSHOT')
+SNAPSHOT_INTERVAL = float(os.getenv('SIMPLE_APP_SNAPSHOT_INTERVAL', '30'))  # seconds
+
+async def save_snapshots():
+    """Write the store to disk whenever it has unsaved changes"""
+    while True:
+        await asyncio.sleep(SNAPSHOT_INTERVAL)
+        if store.dirty:
+            await asyncio.to_thread(store.save)
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    if PRODUCTION_TEMPLATES:
+        precompile_templates(templates, PRECOMPILED_TEMPLATES)
+    snapshotter = asyncio.create_task(save_snapshots()) if SNAPSHOT_PATH else None
+    yield
+    if snapshotter is not None:
+        snapshotter.cancel()
+        store.save()
+
 # Initialize FastAPI app
-app = FastAPI(title="Project Management System")
+app = FastAPI(title="Project Management System", lifespan=lifespan)
 
 # Templates
-templates = Jinja2Templates(directory="templates")
+templates = create_templates()
+# Compiled at startup in production mode; the rest on first use
+PRECOMPILED_TEMPLATES = ('simple/index.html', 'simple/projects.html')
 
-# Simple data store for demo
-projects_data = [
+# Simple data store for demo; a snapshot, when configured and present, replaces the seed data
+store = ProjectStore([
     {"id": 1, "name": "Kitchen Window Replacement", "status": "in progress", "assigned_to": "John Doe", "address": "123 Main St"},
     {"id": 2, "name": "Living Room Patio Door", "status": "scheduled", "assigned_to": "Jane Smith", "address": "456 Oak Ave"},
     {"id": 3, "name": "Bathroom Window Upgrade", "status": "new lead", "assigned_to": "", "address": "789 Pine Rd"},
-]
+], snapshot_path=SNAPSHOT_PATH)
+
+def filter_projects(status: Optional[str], assigned_to: Optional[str]):
+    criteria = {}
+    if status is not None:
+        criteria["status"] = status
+    if assigned_to is not None:
+        criteria["assigned_to"] = assigned_to
+    return store.find(**criteria)
 
 @app.get("/", response_class=HTMLResponse)
 async def index(request: Request):
     return templates.TemplateResponse("simple/index.html", {
         "request": request,
-        "projects": projects_data,
-        "stats": {
-            "total_projects": len(projects_data),
-            "active_projects": len([p for p in projects_data if p["status"] in ["in progress", "scheduled"]]),
-            "completed_projects": 0,
-            "new_leads": len([p for p in projects_data if p["status"] == "new lead"])
-        }
+        "projects": store.all(),
+        "stats": store.stats()
     })
 
 @app.get("/projects", response_class=HTMLResponse)
-async def projects(request: Request):
+async def projects(request: Request, status: Optional[str] = None, assigned_to: Optional[str] = None):
     return templates.TemplateResponse("simple/projects.html", {
         "request": request,
-        "projects": projects_data
+        "projects": filter_projects(status, assigned_to)
     })
 
+@app.get("/api/projects")
+async def api_projects(status: Optional[str] = None, assigned_to: Optional[str] = None):
+    return filter_projects(status, assigned_to)
+
+@app.get("/api/projects/{project_id}")
+async def api_project(project_id: int):
+    project = store.get(project_id)
+    if project is None:
+        raise HTTPException(status_code=404, detail="Project not found")
+    return project
+
 if __name__ == "__main__":
-    uvicorn.run("simple_app:app", host="0.0.0.0", port=5000, reload=False)
\ No newline at end of file
+    uvicorn.run("simple_app:app", host="0.0.0.0", port=5000, reload=False)
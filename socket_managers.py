@@ -0,0 +1,222 @@
+"""
+Cross-process Socket.IO client managers
+Lets several uvicorn workers share rooms and emits through a message queue
+
+SOCKETIO_MESSAGE_QUEUE selects the backend:
+    unset                      single process, events stay in this worker
+    memory://                  in-process bus, for tests with several servers
+    local:///tmp/sio.sock      local relay hub (python socket_managers.py hub /tmp/sio.sock)
+    redis://host:6379/0        socketio.AsyncRedisManager (needs the redis package)
+    postgresql://user@host/db  PostgreSQL LISTEN/NOTIFY over asyncpg
+"""
+
+import asyncio
+import json
+import logging
+import os
+import sys
+from typing import Dict, List, Optional
+from urllib.parse import urlparse
+
+import socketio
+from socketio.async_pubsub_manager import AsyncPubSubManager
+
+DEFAULT_CHANNEL = 'socketio'
+RECONNECT_DELAY = 1.0  # seconds
+# PostgreSQL rejects NOTIFY payloads of 8000 bytes or more
+NOTIFY_MAX_PAYLOAD = 7999
+
+logger = logging.getLogger(__name__)
+
+class MemoryManager(AsyncPubSubManager):
+    """Pub/sub over an in-process bus shared by every server using the same channel"""
+
+    name = 'memory'
+    _subscribers: Dict[str, List[asyncio.Queue]] = {}
+
+    def __init__(self, channel: str = DEFAULT_CHANNEL, write_only: bool = False, logger=None):
+        super().__init__(channel=channel, write_only=write_only, logger=logger)
+        self._queue: asyncio.Queue = asyncio.Queue()
+        if not write_only:
+            self._subscribers.setdefault(channel, []).append(self._queue)
+
+    async def _publish(self, data):
+        payload = json.dumps(data)
+        for queue in self._subscribers.get(self.channel, []):
+            queue.put_nowait(payload)
+
+    async def _listen(self):
+        while True:
+            yield await self._queue.get()
+
+class LocalSocketManager(AsyncPubSubManager):
+    """Pub/sub through a relay hub on a local Unix socket
+
+    Every message written to the hub is sent back to all connected workers,
+    one JSON document per line. Meant for development and multi-process tests
+    on a single box; the hub is started with ``run_hub``.
+    """
+
+    name = 'localsocket'
+
+    def __init__(self, path: str, channel: str = DEFAULT_CHANNEL, write_only: bool = False, logger=None):
+        super().__init__(channel=channel, write_only=write_only, logger=logger)
+        self.path = path
+        self._reader: Optional[asyncio.StreamReader] = None
+        self._writer: Optional[asyncio.StreamWriter] = None
+        self._connect_lock = asyncio.Lock()
+
+    async def _connect(self):
+        async with self._connect_lock:
+            if self._writer is None or self._writer.is_closing():
+                self._reader, self._writer = await asyncio.open_unix_connection(self.path)
+        return self._reader, self._writer
+
+    def _reset(self):
+        if self._writer is not None:
+            self._writer.close()
+        self._reader = self._writer = None
+
+    async def _publish(self, data):
+        line = json.dumps({'channel': self.channel, 'data': data}).encode() + b'\n'
+        for attempt in range(2):
+            try:
+                _, writer = await self._connect()
+                writer.write(line)
+                await writer.drain()
+                return
+            except OSError:
+                self._reset()
+                if attempt:
+                    raise
+
+    async def _listen(self):
+        while True:
+            try:
+                reader, _ = await self._connect()
+                while True:
+                    line = await reader.readline()
+                    if not line:
+                        raise ConnectionResetError('message hub closed the connection')
+                    message = json.loads(line)
+                    if message.get('channel') == self.channel:
+                        yield message['data']
+            except OSError:
+                logger.warning('Lost connection to message hub at %s, retrying', self.path)
+                self._reset()
+                await asyncio.sleep(RECONNECT_DELAY)
+
+class PostgresNotifyManager(AsyncPubSubManager):
+    """Pub/sub over PostgreSQL LISTEN/NOTIFY using asyncpg
+
+    One connection listens on the channel and a second one publishes with
+    pg_notify. Payloads must stay under PostgreSQL's 8000 byte NOTIFY limit;
+    larger messages are still delivered to this worker's clients but are not
+    forwarded to the other workers.
+    """
+
+    name = 'postgresnotify'
+
+    def __init__(self, url: str, channel: str = DEFAULT_CHANNEL, write_only: bool = False, logger=None):
+        super().__init__(channel=channel, write_only=write_only, logger=logger)
+        self.dsn = url.replace('postgresql+asyncpg://', 'postgresql://', 1)
+        self._conn = None
+        self._connect_lock = asyncio.Lock()
+
+    async def _connection(self):
+        import asyncpg
+
+        async with self._connect_lock:
+            if self._conn is None or self._conn.is_closed():
+                self._conn = await asyncpg.connect(self.dsn)
+        return self._conn
+
+    async def _publish(self, data):
+        payload = json.dumps(data)
+        if len(payload.encode()) > NOTIFY_MAX_PAYLOAD:
+            logger.error('Socket.IO message of %d bytes is too large for NOTIFY, not forwarded',
+                         len(payload.encode()))
+            return
+
+        for attempt in range(2):
+            try:
+                conn = await self._connection()
+                await conn.execute('SELECT pg_notify($1, $2)', self.channel, payload)
+                return
+            except (OSError, ConnectionError):
+                self._conn = None
+                if attempt:
+                    raise
+
+    async def _listen(self):
+        import asyncpg
+
+        queue: asyncio.Queue = asyncio.Queue()
+        lost = asyncio.Event()
+
+        def on_notify(conn, pid, channel, payload):
+            queue.put_nowait(payload)
+
+        while True:
+            conn = None
+            try:
+                lost.clear()
+                conn = await asyncpg.connect(self.dsn)
+                conn.add_termination_listener(lambda _conn: lost.set())
+                await conn.add_listener(self.channel, on_notify)
+                while not lost.is_set():
+                    try:
+                        yield await asyncio.wait_for(queue.get(), timeout=RECONNECT_DELAY)
+                    except asyncio.TimeoutError:
+                        continue
+                logger.warning('LISTEN connection closed, reconnecting')
+            except (OSError, ConnectionError, asyncpg.PostgresError):
+                logger.warning('Could not listen on channel %s, retrying', self.channel)
+                await asyncio.sleep(RECONNECT_DELAY)
+            finally:
+                if conn is not None and not conn.is_closed():
+                    await conn.close()
+
+def create_client_manager(url: Optional[str], channel: str = DEFAULT_CHANNEL):
+    """Client manager for a SOCKETIO_MESSAGE_QUEUE url, or None for the in-process default"""
+    if not url:
+        return None
+
+    scheme = urlparse(url).scheme
+    if scheme == 'memory':
+        return MemoryManager(channel=channel)
+    if scheme == 'local':
+        return LocalSocketManager(urlparse(url).path, channel=channel)
+    if scheme in ('redis', 'rediss'):
+        return socketio.AsyncRedisManager(url, channel=channel)
+    if scheme.startswith('postgres'):
+        return PostgresNotifyManager(url, channel=channel)
+    raise ValueError(f"Unsupported SOCKETIO_MESSAGE_QUEUE scheme: {scheme}")
+
+async def run_hub(path: str):
+    """Relay every line a worker sends to all connected workers"""
+    writers = set()
+
+    async def handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        writers.add(writer)
+        try:
+            while line := await reader.readline():
+                for peer in list(writers):
+                    try:
+                        peer.write(line)
+                    except (OSError, RuntimeError):
+                        writers.discard(peer)
+        finally:
+            writers.discard(writer)
+            writer.close()
+
+    if os.path.exists(path):
+        os.unlink(path)
+    server = await asyncio.start_unix_server(handle, path=path)
+    async with server:
+        await server.serve_forever()
+
+if __name__ == '__main__':
+    if len(sys.argv) != 3 or sys.argv[1] != 'hub':
+        sys.exit('usage: python socket_managers.py hub /path/to/hub.sock')
+    asyncio.run(run_hub(sys.argv[2]))
@@ -0,0 +1,48 @@
+"""
+Jinja template environments for the FastAPI apps
+Production mode keeps compiled templates in a bytecode cache shared by workers
+"""
+
+import os
+from typing import Iterable
+
+import jinja2
+from fastapi.templating import Jinja2Templates
+
+TEMPLATE_DIR = 'templates'
+# TEMPLATE_MODE=production: bytecode cache on disk, no mtime checks, first-page templates compiled at startup
+PRODUCTION_TEMPLATES = os.getenv('TEMPLATE_MODE', 'development').lower() == 'production'
+# Unset uses Jinja's per-user directory under the system temp dir
+TEMPLATE_CACHE_DIR = os.getenv('TEMPLATE_CACHE_DIR')
+
+def create_templates(directory: str = TEMPLATE_DIR, production: bool = PRODUCTION_TEMPLATES) -> Jinja2Templates:
+    """Jinja2Templates with the default reloading setup, or the production one"""
+    if not production:
+        return Jinja2Templates(directory=directory)
+
+    if TEMPLATE_CACHE_DIR:
+        os.makedirs(TEMPLATE_CACHE_DIR, exist_ok=True)
+
+    env = jinja2.Environment(
+        loader=jinja2.FileSystemLoader(directory),
+        autoescape=True,
+        auto_reload=False,
+        cache_size=-1,  # keep every compiled template for the life of the worker
+        bytecode_cache=jinja2.FileSystemBytecodeCache(TEMPLATE_CACHE_DIR)
+    )
+    return Jinja2Templates(env=env)
+
+def precompile_templates(templates: Jinja2Templates, names: Iterable[str]) -> int:
+    """Compile ``names`` into the environment cache; returns how many were loaded
+
+    Apps pass the templates of their first page only. Compiling the whole
+    directory made every app also parse the other apps' templates at startup
+    and cost more than the first render saved; anything else is compiled,
+    and cached, on first use. Templates already in the bytecode cache
+    (written by another worker or an earlier start) are loaded from there
+    instead of being parsed again.
+    """
+    names = list(names)
+    for name in names:
+        templates.env.get_template(name)
+    return len(names)